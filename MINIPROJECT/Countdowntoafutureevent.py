@@ -1,11 +1,73 @@
+import math
+import time
 import wx
 import wx.adv
-from datetime import datetime
+from datetime import date, datetime
+from businessdays import BusinessCalendar, DEFAULT_WEEKMASK, load_holidays
+from calendarindex import get_index
+from countdownengine import format_adaptive, format_remaining, split_remaining
+from countdownscheduler import CountdownScheduler
+from eventstore import get_store
+from exportmenu import ResultExportMixin
+from exportwriter import close_writer
+from icsimport import DEFAULT_HORIZON_DAYS, import_ics
+from instrumentation import observe, timed
+from resulthistory import get_history, TOOL_COUNTDOWN
+from uifonts import get_fonts
+from zonedcountdown import to_epoch, zone_names, zone_table
+
+LOCAL_ZONE = "Local"
+
+SAVED_EVENTS_SHOWN = 20
+
+
+class SchedulerTimer(wx.Timer):
+    """One-shot timer that sleeps until the shared scheduler's next deadline or refresh."""
+
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+        self.wakeup = None
+        scheduler.wakeup_changed = self.reschedule
+
+    def Notify(self):
+        if self.wakeup is not None:
+            # How far behind its scheduled wakeup the event loop delivered this tick
+            observe("timer_lateness", self.scheduler.clock() - self.wakeup)
+        self.scheduler.run()
+        self.reschedule()
+
+    def reschedule(self):
+        wakeup = self.wakeup = self.scheduler.next_wakeup()
+        if wakeup is None:
+            self.Stop()
+            return
+        delay_ms = max(1, math.ceil((wakeup - self.scheduler.clock()) * 1000))
+        self.StartOnce(delay_ms)
+
+
+_shared_timer = None
+
+
+def get_scheduler():
+    """Return the scheduler shared by every CountdownFrame, creating its timer on first use."""
+    global _shared_timer
+    if _shared_timer is None:
+        _shared_timer = SchedulerTimer(CountdownScheduler())
+    return _shared_timer.scheduler
 
 
-class CountdownFrame(wx.Frame):
+def timer_stats():
+    """Running wx timers and countdowns tracked by the shared scheduler."""
+    if _shared_timer is None:
+        return {"timers": 0, "countdowns": 0}
+    return {"timers": int(_shared_timer.IsRunning()), "countdowns": len(_shared_timer.scheduler)}
+
+
+class CountdownFrame(ResultExportMixin, wx.Frame):
     """Countdown to a future event GUI using wxPython."""
 
+    @timed("CountdownFrame.__init__")
     def __init__(self, parent=None):
         super().__init__(parent, title="Countdown to Future Event", size=(480, 260))
         panel = wx.Panel(self)
@@ -13,6 +75,13 @@ class CountdownFrame(wx.Frame):
 
         # Menu
         menubar = wx.MenuBar()
+        file_menu = wx.Menu()
+        self._append_export_items(file_menu)
+        holidays_item = file_menu.Append(wx.ID_ANY, "Load Holi&days...", "Holiday calendar for working-day countdowns")
+        self.Bind(wx.EVT_MENU, self.on_load_holidays, holidays_item)
+        import_item = file_menu.Append(wx.ID_ANY, "&Import Calendar...", "Add upcoming events from an iCalendar (.ics) file")
+        self.Bind(wx.EVT_MENU, self.on_import_calendar, import_item)
+        menubar.Append(file_menu, "&File")
         help_menu = wx.Menu()
         help_menu.Append(wx.ID_ABOUT, "&About\tF1", "About this app")
         menubar.Append(help_menu, "&Help")
@@ -20,9 +89,7 @@ class CountdownFrame(wx.Frame):
         self.Bind(wx.EVT_MENU, self.on_about, id=wx.ID_ABOUT)
 
         # Fonts
-        header_font = wx.Font(20, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
-        default_font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        button_font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        header_font, default_font, button_font = get_fonts()
         panel.SetFont(default_font)
 
         # Header
@@ -40,6 +107,17 @@ class CountdownFrame(wx.Frame):
         name_sizer.Add(self.name_ctrl, 1, wx.EXPAND)
         sizer.Add(name_sizer, 0, wx.ALL | wx.EXPAND, 12)
 
+        # Saved events: only the next few upcoming ones are read from the store
+        saved_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        saved_sizer.Add(wx.StaticText(panel, label="Saved events:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 12)
+        self.saved_choice = wx.Choice(panel)
+        self.saved_choice.Bind(wx.EVT_CHOICE, self.on_pick_saved)
+        saved_sizer.Add(self.saved_choice, 1, wx.EXPAND | wx.RIGHT, 12)
+        self.delete_btn = wx.Button(panel, label="Delete Saved")
+        self.delete_btn.Bind(wx.EVT_BUTTON, self.on_delete_saved)
+        saved_sizer.Add(self.delete_btn, 0)
+        sizer.Add(saved_sizer, 0, wx.LEFT | wx.RIGHT | wx.EXPAND, 12)
+
         # Date and Time pickers
         row = wx.BoxSizer(wx.HORIZONTAL)
         row.Add(wx.StaticText(panel, label="Event date:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 12)
@@ -58,6 +136,28 @@ class CountdownFrame(wx.Frame):
 
         sizer.Add(row, 0, wx.ALL | wx.EXPAND, 12)
 
+        # Time zone the date and time above are given in
+        zone_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        zone_sizer.Add(wx.StaticText(panel, label="Time zone:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 12)
+        self.zone_ctrl = wx.ComboBox(panel, value=LOCAL_ZONE, choices=[LOCAL_ZONE] + zone_names())
+        zone_sizer.Add(self.zone_ctrl, 1, wx.EXPAND)
+        sizer.Add(zone_sizer, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM | wx.EXPAND, 12)
+
+        # Kiosk mode: show minutes or hours only while the event is far away and refresh that often
+        self.adaptive_chk = wx.CheckBox(panel, label="Adaptive refresh (coarser display for distant events)")
+        self.adaptive_chk.Bind(wx.EVT_CHECKBOX, self.on_adaptive)
+        sizer.Add(self.adaptive_chk, 0, wx.LEFT | wx.RIGHT, 12)
+
+        # Working-day mode: also count the business days left, skipping the weekend mask and loaded holidays
+        business_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.business_chk = wx.CheckBox(panel, label="Count working days:")
+        self.business_chk.Bind(wx.EVT_CHECKBOX, self.on_business)
+        business_sizer.Add(self.business_chk, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 12)
+        self.weekmask_ctrl = wx.TextCtrl(panel, value="Mon Tue Wed Thu Fri")
+        self.weekmask_ctrl.Bind(wx.EVT_TEXT, self.on_business)
+        business_sizer.Add(self.weekmask_ctrl, 1, wx.EXPAND)
+        sizer.Add(business_sizer, 0, wx.ALL | wx.EXPAND, 12)
+
         # Buttons
         btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self.start_btn = wx.Button(panel, label="Start")
@@ -98,16 +198,29 @@ class CountdownFrame(wx.Frame):
 
         panel.SetSizer(sizer)
 
-        # Timer
-        self.timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.on_tick, self.timer)
+        # All countdown windows share one scheduler-driven timer
+        self.scheduler = get_scheduler()
+        self.event_id = None
         self.target = None
+        self.zone = None
+        self.deadline = None  # epoch seconds, resolved once per start
+        self.holidays = []
+        self.business = BusinessCalendar(DEFAULT_WEEKMASK)
+        self.Bind(wx.EVT_ICONIZE, self.on_iconize)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+        try:
+            self.store = get_store()
+        except Exception:
+            self.store = None
+        self.saved_events = []
+        self.load_saved_events()
 
         self.Maximize(True)  # fill the screen
 
     def on_about(self, event):
         wx.MessageBox(
-            "Countdown to a future event. Select a date and time, then press Start. The countdown updates every second.",
+            "Countdown to a future event. Select a date and time, then press Start. The countdown updates every second, or every minute/hour for distant events in adaptive mode.",
             "About",
             wx.ICON_INFORMATION,
         )
@@ -120,64 +233,216 @@ class CountdownFrame(wx.Frame):
         hh = int(self.hour.GetValue())
         mm = int(self.minu.GetValue())
         ss = int(self.sec.GetValue())
+        if not get_index().is_valid(y, m, d):
+            return None
         try:
             return datetime(y, m, d, hh, mm, ss)
         except Exception:
             return None
 
+    def get_zone(self):
+        """Selected zone name, None for the system local zone. Raises KeyError for an unknown zone."""
+        zone = self.zone_ctrl.GetValue().strip()
+        if not zone or zone == LOCAL_ZONE:
+            return None
+        zone_table(zone)
+        return zone
+
     def on_start(self, event):
         target = self.get_target_datetime()
         if target is None:
             wx.MessageBox("The selected date/time is invalid.", "Invalid", wx.ICON_ERROR)
             return
-        now = datetime.now()
-        if target <= now:
+        try:
+            zone = self.get_zone()
+        except Exception:
+            wx.MessageBox(f"Unknown time zone: {self.zone_ctrl.GetValue()}", "Invalid", wx.ICON_ERROR)
+            return
+        # Resolve the wall time to an absolute instant once; ticks are then plain subtraction
+        deadline = to_epoch(target, zone)
+        if deadline <= time.time():
             wx.MessageBox("Please select a future date/time.", "Invalid", wx.ICON_ERROR)
             return
 
         self.target = target
-        self.timer.Start(1000)
+        self.zone = zone
+        self.deadline = deadline
+        self._remember(deadline)
+        self._cancel_countdown()
+        self.event_id = self.scheduler.add(self.scheduler.wall_to_clock(deadline), self.on_reached, self.on_tick)
+        self._record_history()
         self.start_btn.Enable(False)
         self.stop_btn.Enable(True)
         self.copy_btn.Enable(False)
         self.save_btn.Enable(False)
         self.update_result()
 
+    def load_saved_events(self):
+        self.saved_events = self.store.next_due(SAVED_EVENTS_SHOWN) if self.store else []
+        self.saved_choice.SetItems([f"{e.name} — {e.target:%Y-%m-%d %H:%M:%S}" for e in self.saved_events])
+        self.saved_choice.Enable(bool(self.saved_events))
+        self.delete_btn.Enable(bool(self.saved_events))
+
+    def _remember(self, deadline):
+        if self.store is None:
+            return
+        name = self.name_ctrl.GetValue().strip() or "Untitled event"
+        try:
+            # Restarting a saved or already started countdown must not store it again
+            added = self.store.add_missing([(name, deadline)])
+        except Exception as e:
+            wx.MessageBox(f"Failed to save event: {e}", "Error", wx.ICON_ERROR)
+            return
+        if added:
+            self.load_saved_events()
+
+    def on_pick_saved(self, event):
+        sel = self.saved_choice.GetSelection()
+        if sel == wx.NOT_FOUND:
+            return
+        picked = self.saved_events[sel]
+        target = picked.target
+        self.name_ctrl.SetValue(picked.name)
+        self.zone_ctrl.SetValue(LOCAL_ZONE)  # saved deadlines are absolute; show them in local time
+        self.datepicker.SetValue(wx.DateTime.FromDMY(target.day, target.month - 1, target.year))
+        self.hour.SetValue(target.hour)
+        self.minu.SetValue(target.minute)
+        self.sec.SetValue(target.second)
+
+    def on_delete_saved(self, event):
+        sel = self.saved_choice.GetSelection()
+        if sel == wx.NOT_FOUND or self.store is None:
+            return
+        self.store.remove(self.saved_events[sel].event_id)
+        self.load_saved_events()
+
+    def _cancel_countdown(self):
+        if self.event_id is not None:
+            self.scheduler.cancel(self.event_id)
+            self.event_id = None
+
+    def _record_history(self):
+        now = time.time()
+        get_history().record(TOOL_COUNTDOWN, (int(self.deadline), int(now)), split_remaining(max(0, self.deadline - now)))
+
     def on_stop(self, event):
-        if self.timer.IsRunning():
-            self.timer.Stop()
+        if self.event_id is not None:
+            self._record_history()
+        self._cancel_countdown()
+        self._log_result(self.result_text.GetLabel())
         self.start_btn.Enable(True)
         self.stop_btn.Enable(False)
 
-    def on_tick(self, event):
+    @timed("CountdownFrame.on_tick")
+    def on_tick(self, event=None):
         if not self.target:
+            return None
+        return self.update_result()
+
+    def on_adaptive(self, event):
+        if self.event_id is not None:
+            self.scheduler.rearm_refresh(self.event_id)
+            self.update_result()
+
+    def on_business(self, event):
+        try:
+            self.business = BusinessCalendar(self.weekmask_ctrl.GetValue(), self.holidays)
+        except ValueError:
+            return  # keep the last valid calendar while the mask is being edited
+        if self.event_id is not None:
+            self.update_result()
+
+    def on_load_holidays(self, event):
+        with wx.FileDialog(self, "Load holidays", wildcard="Text files (*.txt)|*.txt|All files (*.*)|*.*",
+                           style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as dlg:
+            if dlg.ShowModal() == wx.ID_CANCEL:
+                return
+            path = dlg.GetPath()
+        try:
+            self.holidays = load_holidays(path)
+            self.business = BusinessCalendar(self.business.weekmask, self.holidays)
+        except Exception as e:
+            wx.MessageBox(f"Failed to load holidays: {e}", "Error", wx.ICON_ERROR)
             return
-        now = datetime.now()
-        if now >= self.target:
-            self.timer.Stop()
-            self.result_text.SetLabel("Event reached! 🎉")
-            wx.MessageBox("The event time has been reached!", "Event", wx.ICON_INFORMATION)
-            self.start_btn.Enable(True)
-            self.stop_btn.Enable(False)
-            self.copy_btn.Enable(True)
-            self.save_btn.Enable(True)
-            return
-        self.update_result()
+        wx.MessageBox(f"Loaded {len(self.holidays)} holidays.", "Holidays", wx.ICON_INFORMATION)
+        if self.event_id is not None:
+            self.update_result()
 
+    def on_import_calendar(self, event):
+        if self.store is None:
+            wx.MessageBox("Saved events are unavailable, so calendars cannot be imported.", "Error", wx.ICON_ERROR)
+            return
+        with wx.FileDialog(self, "Import calendar", wildcard="iCalendar files (*.ics)|*.ics|All files (*.*)|*.*",
+                           style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as dlg:
+            if dlg.ShowModal() == wx.ID_CANCEL:
+                return
+            path = dlg.GetPath()
+        try:
+            with wx.BusyCursor():
+                result = import_ics(path, self.store, DEFAULT_HORIZON_DAYS)
+        except Exception as e:
+            wx.MessageBox(f"Failed to import calendar: {e}", "Error", wx.ICON_ERROR)
+            return
+        message = f"Added {result.added} countdowns for the next {DEFAULT_HORIZON_DAYS} days from {result.events} events."
+        if result.skipped:
+            message += f"\n{result.skipped} events could not be read and were skipped."
+        wx.MessageBox(message, "Import Calendar", wx.ICON_INFORMATION)
+        self.load_saved_events()
+
+    def _working_days_left(self):
+        """Working days from today up to, but not including, the event's date, both in the event's zone."""
+        today = zone_table(self.zone).to_wall(time.time()).date() if self.zone else date.today()
+        return self.business.count(today, self.target.date())
+
+    def on_reached(self):
+        self.event_id = None
+        self._record_history()
+        self.result_text.SetLabel("Event reached! 🎉")
+        name = self.name_ctrl.GetValue().strip()
+        reached = f"Event reached at {self.target:%Y-%m-%d %H:%M:%S}" + (f" {self.zone}" if self.zone else "")
+        self._log_result(f"{name} — {reached}" if name else reached)
+        self.start_btn.Enable(True)
+        self.stop_btn.Enable(False)
+        self.copy_btn.Enable(True)
+        self.save_btn.Enable(True)
+        # Show the dialog outside the scheduler run so its modal loop cannot re-enter it
+        wx.CallAfter(wx.MessageBox, "The event time has been reached!", "Event", wx.ICON_INFORMATION)
+
+    def on_iconize(self, event):
+        if self.event_id is not None:
+            visible = not event.IsIconized()
+            self.scheduler.set_visible(self.event_id, visible)
+            if visible:
+                self.update_result()
+        event.Skip()
+
+    def on_close(self, event):
+        self._cancel_countdown()
+        self._close_result_log()
+        event.Skip()
+
+    @timed("CountdownFrame.update_result")
     def update_result(self):
-        now = datetime.now()
-        delta = self.target - now
-        days = delta.days
-        seconds = delta.seconds
-        hours, remainder = divmod(seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        result = f"Time remaining: {days} days, {hours} hours, {minutes} minutes, {seconds} seconds."
+        """Refresh the countdown label and return how many seconds it stays valid."""
+        if self.event_id is not None:
+            remaining = self.scheduler.remaining(self.event_id)
+        else:
+            remaining = self.deadline - time.time()
+        if self.adaptive_chk.GetValue():
+            result, step = format_adaptive(remaining)
+        else:
+            result, step = format_remaining(remaining), 1
+        if self.business_chk.GetValue() and remaining > 0:
+            result = f"{self._working_days_left()} working days left. {result}"
         name = self.name_ctrl.GetValue().strip()
         if name:
             result = f"{name} — {result}"
-        self.result_text.SetLabel(result)
-        self.copy_btn.Enable(True)
-        self.save_btn.Enable(True)
+        # SetLabel relayouts the panel, so skip it when the text is unchanged
+        if result != self.result_text.GetLabel():
+            self.result_text.SetLabel(result)
+            self.copy_btn.Enable(True)
+            self.save_btn.Enable(True)
+        return step
 
     def on_copy(self, event):
         text = self.result_text.GetLabel()
@@ -190,23 +455,9 @@ class CountdownFrame(wx.Frame):
         else:
             wx.MessageBox("Could not open the clipboard.", "Error", wx.ICON_ERROR)
 
-    def on_save(self, event):
-        text = self.result_text.GetLabel()
-        if not text:
-            return
-        with wx.FileDialog(self, "Save result", wildcard="Text files (*.txt)|*.txt", style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dlg:
-            if dlg.ShowModal() == wx.ID_CANCEL:
-                return
-            path = dlg.GetPath()
-            try:
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(text + "\n")
-                wx.MessageBox(f"Result saved to: {path}", "Saved", wx.ICON_INFORMATION)
-            except Exception as e:
-                wx.MessageBox(f"Failed to save file: {e}", "Error", wx.ICON_ERROR)
-
     def on_clear(self, event):
         self.name_ctrl.SetValue("")
+        self.saved_choice.SetSelection(wx.NOT_FOUND)
         now = datetime.now()
         default_dt = wx.DateTime.FromDMY(now.day, now.month - 1, now.year)
         self.datepicker.SetValue(default_dt)
@@ -214,8 +465,7 @@ class CountdownFrame(wx.Frame):
         self.minu.SetValue(now.minute)
         self.sec.SetValue(now.second)
         self.result_text.SetLabel("")
-        if self.timer.IsRunning():
-            self.timer.Stop()
+        self._cancel_countdown()
         self.start_btn.Enable(True)
         self.stop_btn.Enable(False)
         self.copy_btn.Enable(False)
@@ -232,4 +482,5 @@ if __name__ == "__main__":
     frame = CountdownFrame()
     frame.Show()
     app.MainLoop()
+    close_writer()
     
\ No newline at end of file
@@ -1,21 +1,25 @@
 import wx
 import wx.adv
 from datetime import date
-from calendar import monthrange
+from ageengine import calculate_age
+from exportmenu import ResultExportMixin
+from exportwriter import close_writer
+from instrumentation import timed
+from resulthistory import get_history, TOOL_AGE
+from uifonts import get_fonts
 
 
-class AgeCalculator(wx.Frame):
+class AgeCalculator(ResultExportMixin, wx.Frame):
     """Enhanced Age Calculator GUI using wxPython with DatePicker, copy and save."""
 
+    @timed("AgeCalculator.__init__")
     def __init__(self, parent=None):
         super().__init__(parent, title="Age Calculator", size=(420, 220))
         panel = wx.Panel(self)
         panel.SetBackgroundColour('#f0f6ff')  # soft blue background
 
         # Fonts and styling
-        header_font = wx.Font(20, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
-        default_font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        button_font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        header_font, default_font, button_font = get_fonts()
 
         panel.SetFont(default_font)
 
@@ -28,6 +32,9 @@ class AgeCalculator(wx.Frame):
 
         # Menu
         menubar = wx.MenuBar()
+        file_menu = wx.Menu()
+        self._append_export_items(file_menu)
+        menubar.Append(file_menu, "&File")
         help_menu = wx.Menu()
         help_menu.Append(wx.ID_ABOUT, "&About\tF1", "About this app")
         menubar.Append(help_menu, "&Help")
@@ -79,11 +86,16 @@ class AgeCalculator(wx.Frame):
 
         panel.SetSizer(main_sizer)
         panel.Layout()
+        self.Bind(wx.EVT_CLOSE, self.on_close)
         self.Maximize(True)  # fill the screen
 
     def on_about(self, event):
         wx.MessageBox("Age Calculator\nUse the date picker to select a birth date.\nCalculates years, months and days.", "About", wx.ICON_INFORMATION)
 
+    def on_close(self, event):
+        self._close_result_log()
+        event.Skip()
+
     def on_clear(self, event):
         today = date.today()
         default_dt = wx.DateTime.FromDMY(today.day, today.month - 1, today.year)
@@ -92,6 +104,7 @@ class AgeCalculator(wx.Frame):
         self.copy_btn.Enable(False)
         self.save_btn.Enable(False)
 
+    @timed("AgeCalculator.on_calculate")
     def on_calculate(self, event):
         # Get date from DatePicker (wx.DateTime uses month indices 0-11)
         dt = self.datepicker.GetValue()
@@ -110,25 +123,12 @@ class AgeCalculator(wx.Frame):
             wx.MessageBox("Birth date is in the future. Please enter a valid past date.", "Invalid Date", wx.ICON_ERROR)
             return
 
-        years = today.year - birth_date.year
-        months = today.month - birth_date.month
-        days = today.day - birth_date.day
-
-        if days < 0:
-            months -= 1
-            if today.month == 1:
-                prev_month = 12
-                prev_year = today.year - 1
-            else:
-                prev_month = today.month - 1
-                prev_year = today.year
-            days += monthrange(prev_year, prev_month)[1]
-        if months < 0:
-            years -= 1
-            months += 12
+        years, months, days = calculate_age(birth_date, today)
+        get_history().record(TOOL_AGE, (birth_date.toordinal(), today.toordinal()), (years, months, days))
 
         result = f"Your age is {years} years, {months} months, and {days} days."
         self.result_text.SetLabel(result)
+        self._log_result(result)
         self.copy_btn.Enable(True)
         self.save_btn.Enable(True)
 
@@ -143,21 +143,6 @@ class AgeCalculator(wx.Frame):
         else:
             wx.MessageBox("Could not open the clipboard.", "Error", wx.ICON_ERROR)
 
-    def on_save(self, event):
-        text = self.result_text.GetLabel()
-        if not text:
-            return
-        with wx.FileDialog(self, "Save result", wildcard="Text files (*.txt)|*.txt", style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dlg:
-            if dlg.ShowModal() == wx.ID_CANCEL:
-                return
-            path = dlg.GetPath()
-            try:
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(text + "\n")
-                wx.MessageBox(f"Result saved to: {path}", "Saved", wx.ICON_INFORMATION)
-            except Exception as e:
-                wx.MessageBox(f"Failed to save file: {e}", "Error", wx.ICON_ERROR)
-
 
 if __name__ == "__main__":
     try:
@@ -168,4 +153,5 @@ if __name__ == "__main__":
 
     frame = AgeCalculator()
     frame.Show()
-    app.MainLoop()
\ No newline at end of file
+    app.MainLoop()
+    close_writer()
\ No newline at end of file
@@ -0,0 +1,156 @@
+import argparse
+from collections import Counter
+from datetime import date, timedelta
+
+from ageengine import civil_from_days, to_day_numbers
+from calendarindex import get_index
+
+np = None  # imported on first vectorized use, see ageengine
+
+LEAP_DAY = (2, 29)
+# Beyond this many elapsed days a rebuild from the birthday index is cheaper than replaying each day
+MAX_REPLAY_DAYS = 366
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for array input and .npy files. Install it with: pip install numpy") from None
+        np = numpy
+
+
+class AgeDistribution:
+    """Counts of people per age in whole years, kept current as the as-of date moves forward.
+
+    People are indexed by (month, day) of birth, each entry counting birth
+    years. The counts are built once; advance() then visits only the
+    birthdays in the elapsed days and moves those people up one age (or
+    adds them at age 0 on the day they are born). Ages follow
+    ageengine.calculate_age, so someone born on 29 February turns a year
+    older on 1 March in common years.
+    """
+
+    def __init__(self, birth_dates=(), as_of=None):
+        self.as_of = date.today() if as_of is None else as_of
+        self.birthdays = {}   # (month, day) -> Counter of birth years
+        self.counts = []      # counts[age] = people of that age
+        self.unborn = 0       # birth date after as_of
+        self.add_many(birth_dates)
+
+    def __len__(self):
+        return sum(self.counts) + self.unborn
+
+    def _age(self, year, key):
+        """Age on self.as_of of someone born on key in year, or -1 if not yet born."""
+        as_of = self.as_of
+        if (year, key) > (as_of.year, (as_of.month, as_of.day)):
+            return -1
+        return as_of.year - year - ((as_of.month, as_of.day) < key)
+
+    def _shift(self, age, n):
+        if age < 0:
+            self.unborn += n
+            return
+        counts = self.counts
+        if age >= len(counts):
+            counts.extend([0] * (age + 1 - len(counts)))
+        counts[age] += n
+
+    def add(self, birth_date, n=1):
+        """Add n people born on birth_date (a negative n removes them)."""
+        key = (birth_date.month, birth_date.day)
+        years = self.birthdays.setdefault(key, Counter())
+        years[birth_date.year] += n
+        if not years[birth_date.year]:
+            del years[birth_date.year]
+        self._shift(self._age(birth_date.year, key), n)
+
+    def remove(self, birth_date, n=1):
+        self.add(birth_date, -n)
+
+    def add_many(self, birth_dates):
+        """Add a population: an iterable of dates, or with NumPy an array of datetime64 values or ordinals."""
+        if hasattr(birth_dates, "dtype"):  # a NumPy array
+            _require_numpy()
+            years, months, days = civil_from_days(to_day_numbers(birth_dates))
+            packed = (years.astype(np.int64) * 16 + months) * 32 + days
+            values, counts = np.unique(packed, return_counts=True)
+            groups = ((int(v) // 512, (int(v) // 32 % 16, int(v) % 32), int(c)) for v, c in zip(values, counts))
+        else:
+            grouped = Counter((d.year, (d.month, d.day)) for d in birth_dates)
+            groups = ((year, key, n) for (year, key), n in grouped.items())
+        for year, key, n in groups:
+            self.birthdays.setdefault(key, Counter())[year] += n
+            self._shift(self._age(year, key), n)
+
+    def _rebuild(self):
+        self.counts = []
+        self.unborn = 0
+        for key, years in self.birthdays.items():
+            for year, n in years.items():
+                self._shift(self._age(year, key), n)
+
+    def _apply_birthdays(self, day, key):
+        years = self.birthdays.get(key)
+        if not years:
+            return
+        for year, n in years.items():
+            if year > day.year:
+                continue
+            if year == day.year:
+                self.unborn -= n  # born today
+                self._shift(0, n)
+            else:
+                age = day.year - year
+                self.counts[age - 1] -= n
+                self._shift(age, n)
+
+    def advance(self, as_of):
+        """Move the as-of date to as_of, touching only the people whose birthday falls in between."""
+        if as_of == self.as_of:
+            return
+        if as_of < self.as_of or (as_of - self.as_of).days > MAX_REPLAY_DAYS:
+            self.as_of = as_of
+            self._rebuild()
+            return
+        index = get_index()
+        day = self.as_of
+        while day < as_of:
+            day += timedelta(days=1)
+            self.as_of = day
+            self._apply_birthdays(day, (day.month, day.day))
+            if day.month == 3 and day.day == 1 and not index.is_leap(day.year):
+                self._apply_birthdays(day, LEAP_DAY)
+
+    def histogram(self, width=10, max_age=None):
+        """(first age, people) per bucket of width years; with max_age, ages above it share the last bucket."""
+        buckets = Counter()
+        for age, n in enumerate(self.counts):
+            if n:
+                if max_age is not None and age > max_age:
+                    age = max_age
+                buckets[age // width * width] += n
+        return sorted(buckets.items())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the age distribution of a population of birth dates.")
+    parser.add_argument("input", help=".npy file of datetime64 birth dates or date.toordinal() ordinals")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="as-of date YYYY-MM-DD (default: today)")
+    parser.add_argument("--width", type=int, default=10, help="bucket width in years (default: 10)")
+    parser.add_argument("--max-age", type=int, default=None, help="fold older ages into the last bucket")
+    args = parser.parse_args(argv)
+    _require_numpy()
+
+    distribution = AgeDistribution(np.load(args.input, mmap_mode="r"), args.as_of)
+    for first, n in distribution.histogram(args.width, args.max_age):
+        print(f"{first:>4}-{first + args.width - 1:<4} {n}")
+    if distribution.unborn:
+        print(f"not yet born: {distribution.unborn}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+from datetime import date
+from calendarindex import get_index
+
+# NumPy is imported by _require_numpy() on the first vectorized call, so scalar
+# users such as the command-line tool start without paying for it
+np = None
+
+# date(1970, 1, 1).toordinal(); datetime64[D] values count days from 1970-01-01
+EPOCH_ORDINAL = 719163
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for batch age calculation. Install it with: pip install numpy") from None
+        np = numpy
+
+
+def calculate_age(birth_date, today):
+    """Return (years, months, days) between two dates, borrowing from the month before today."""
+    years = today.year - birth_date.year
+    months = today.month - birth_date.month
+    days = today.day - birth_date.day
+
+    if days < 0:
+        months -= 1
+        if today.month == 1:
+            prev_month = 12
+            prev_year = today.year - 1
+        else:
+            prev_month = today.month - 1
+            prev_year = today.year
+        days += get_index().days_in_month(prev_year, prev_month)
+    if months < 0:
+        years -= 1
+        months += 12
+    return years, months, days
+
+
+def to_day_numbers(values):
+    """Convert datetime64 values or date.toordinal() ordinals to int64 days since 1970-01-01."""
+    _require_numpy()
+    arr = np.asarray(values)
+    if not arr.size:
+        return np.zeros(arr.shape, dtype=np.int64)  # an empty list comes in as float64
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[D]").astype(np.int64)
+    if arr.dtype.kind in "iu":
+        return arr.astype(np.int64) - EPOCH_ORDINAL
+    raise TypeError(f"Expected datetime64 or integer day ordinals, got {arr.dtype}")
+
+
+def civil_from_days(days):
+    """Split int64 days since 1970-01-01 into (year, month, day) arrays."""
+    _require_numpy()
+    z = np.asarray(days, dtype=np.int64) + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def days_from_civil(years, months, days):
+    """Inverse of civil_from_days: int64 days since 1970-01-01 for (year, month, day) arrays."""
+    _require_numpy()
+    m = np.asarray(months, dtype=np.int64)
+    y = np.asarray(years, dtype=np.int64) - (m <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * np.where(m > 2, m - 3, m + 9) + 2) // 5 + np.asarray(days, dtype=np.int64) - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def age_columns(birth_dates, as_of=None):
+    """Vectorized calculate_age over many birth dates.
+
+    birth_dates is an array of datetime64 values or date.toordinal() ordinals.
+    as_of is a date (default: today). Returns int32 (years, months, days)
+    arrays; rows born after as_of are -1 in all three columns.
+    """
+    _require_numpy()
+    by, bm, bd = civil_from_days(to_day_numbers(birth_dates))
+    return age_from_parts(by, bm, bd, as_of)
+
+
+def age_from_parts(birth_years, birth_months, birth_days, as_of=None):
+    """age_columns for birth dates already split into year, month and day arrays.
+
+    Splitting is the expensive part, so callers that recompute ages for a fixed
+    population against many as-of dates can keep the parts and skip it.
+    """
+    _require_numpy()
+    if as_of is None:
+        as_of = date.today()
+    by = np.asarray(birth_years, dtype=np.int32)
+    bm = np.asarray(birth_months, dtype=np.int32)
+    bd = np.asarray(birth_days, dtype=np.int32)
+
+    years = as_of.year - by
+    months = as_of.month - bm
+    days = as_of.day - bd
+
+    borrow = days < 0
+    if borrow.any():
+        # The borrowed month is always the one before as_of, so its length is a scalar;
+        # December always has 31 days, which also covers as_of in January of year 1
+        prev_len = 31 if as_of.month == 1 else get_index().days_in_month(as_of.year, as_of.month - 1)
+        days += borrow * prev_len
+    months -= borrow
+    borrow = months < 0
+    months += borrow * 12
+    years -= borrow
+
+    # Born after as_of exactly when the (year, month, day) tuple compares greater
+    future = (by * 512 + bm * 32 + bd) > (as_of.year * 512 + as_of.month * 32 + as_of.day)
+    years[future] = -1
+    months[future] = -1
+    days[future] = -1
+    return years, months, days
@@ -0,0 +1,172 @@
+import argparse
+import os
+import sys
+from datetime import date
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    print("pyarrow is required for batch mode. Install it with: pip install pyarrow")
+    raise
+
+from ageengine import age_columns, EPOCH_ORDINAL
+from dateparser import DateParser, FORMATS
+from weekdayengine import WEEKDAY_NAMES, weekdays_from_ordinals
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+def _format_of(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    if ext in (".arrow", ".feather", ".ipc"):
+        return "arrow"
+    raise ValueError(f"Unsupported file type: {path}")
+
+
+def iter_batches(path, column, chunk_rows=DEFAULT_CHUNK_ROWS, as_text=False):
+    """Yield RecordBatches from a CSV, Parquet or Arrow IPC file without loading it whole.
+
+    With as_text, a CSV date column is read as plain strings for DateParser instead of as ISO dates.
+    """
+    fmt = _format_of(path)
+    if fmt == "csv":
+        # Roughly 64 bytes per row keeps CSV blocks close to chunk_rows rows
+        read_options = pacsv.ReadOptions(block_size=max(1 << 20, min(chunk_rows * 64, 1 << 30)))
+        convert_options = pacsv.ConvertOptions(column_types={column: pa.string() if as_text else pa.date32()})
+        with pacsv.open_csv(path, read_options=read_options, convert_options=convert_options) as reader:
+            for batch in reader:
+                yield batch
+    elif fmt == "parquet":
+        yield from pq.ParquetFile(path).iter_batches(batch_size=chunk_rows)
+    else:
+        with pa.memory_map(path) as source:
+            reader = ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+
+
+def _day_numbers(arr):
+    """Return (int64 days since 1970-01-01, null mask) for a date/timestamp/string column."""
+    if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+        arr = pc.cast(arr, pa.date32())
+    elif pa.types.is_timestamp(arr.type) or pa.types.is_date64(arr.type):
+        arr = pc.cast(arr, pa.date32())
+    if not pa.types.is_date32(arr.type):
+        raise TypeError(f"Column has unsupported type {arr.type}")
+    nulls = arr.is_null().to_numpy(zero_copy_only=False)
+    days = pc.fill_null(arr.cast(pa.int32()), 0).to_numpy().astype(np.int64)
+    return days, nulls
+
+
+def _parsed_day_numbers(arr, parser):
+    """Like _day_numbers for a string column in any DateParser format; unparseable rows become nulls."""
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return _day_numbers(arr)
+    parsed = parser.parse(arr.to_pylist())
+    return parsed.days, parsed.nulls
+
+
+def compute_batch(batch, column, as_of, parser=None):
+    """Append age and weekday columns to one RecordBatch. String dates go through parser when given."""
+    arr = batch.column(column)
+    days, nulls = _parsed_day_numbers(arr, parser) if parser is not None else _day_numbers(arr)
+    years, months, day_parts = age_columns(days + EPOCH_ORDINAL, as_of)
+    age_nulls = nulls | (years < 0)
+    weekday = weekdays_from_ordinals(days + EPOCH_ORDINAL)
+
+    names = pa.array(WEEKDAY_NAMES, pa.string())
+    arrays = list(batch.columns) + [
+        pa.array(years, mask=age_nulls),
+        pa.array(months, mask=age_nulls),
+        pa.array(day_parts, mask=age_nulls),
+        pa.array(weekday, mask=nulls),
+        pa.DictionaryArray.from_arrays(pa.array(weekday, mask=nulls), names),
+    ]
+    fields = list(batch.schema.names) + ["age_years", "age_months", "age_days", "weekday", "weekday_name"]
+    return pa.RecordBatch.from_arrays(arrays, names=fields)
+
+
+class _Writer:
+    """Streaming writer that picks Parquet, Arrow IPC or CSV from the output extension."""
+
+    def __init__(self, path):
+        self.path = path
+        self.fmt = _format_of(path)
+        self._writer = None
+
+    def write(self, batch):
+        if self._writer is None:
+            if self.fmt == "parquet":
+                self._writer = pq.ParquetWriter(self.path, batch.schema)
+            elif self.fmt == "arrow":
+                self._writer = ipc.new_file(self.path, batch.schema)
+            else:
+                self._writer = pacsv.CSVWriter(self.path, batch.schema)
+        if self.fmt == "parquet":
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def run_batch(input_path, output_path, column, as_of=None, chunk_rows=DEFAULT_CHUNK_ROWS, progress=None, parser=None):
+    """Stream input_path through compute_batch into output_path. Returns the number of rows written.
+
+    parser is an optional DateParser for text date columns; its invalid_count and invalid_rows describe the
+    rows that could not be parsed once this returns.
+    """
+    if as_of is None:
+        as_of = date.today()
+    writer = _Writer(output_path)
+    rows = 0
+    try:
+        for batch in iter_batches(input_path, column, chunk_rows, as_text=parser is not None):
+            writer.write(compute_batch(batch, column, as_of, parser))
+            rows += batch.num_rows
+            if progress:
+                progress(rows)
+    finally:
+        writer.close()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute age and day-of-week columns for a large CSV, Parquet or Arrow file.")
+    parser.add_argument("input", help="input .csv, .parquet or .arrow file")
+    parser.add_argument("output", help="output .parquet, .arrow or .csv file")
+    parser.add_argument("--column", default="birth_date", help="name of the date column (default: birth_date)")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="as-of date YYYY-MM-DD (default: today)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="rows per chunk")
+    parser.add_argument("--date-format", choices=["auto"] + list(FORMATS), default=None,
+                        help="parse a text date column in this format, or detect it with 'auto' (default: ISO dates only)")
+    args = parser.parse_args(argv)
+
+    date_parser = None
+    if args.date_format:
+        date_parser = DateParser(None if args.date_format == "auto" else args.date_format)
+    rows = run_batch(args.input, args.output, args.column, args.as_of, args.chunk_rows,
+                     progress=lambda n: print(f"{n} rows processed", file=sys.stderr), parser=date_parser)
+    print(f"Wrote {rows} rows to {args.output}")
+    if date_parser is not None:
+        print(f"Date format: {date_parser.format}")
+        if date_parser.invalid_count:
+            print(f"{date_parser.invalid_count} rows had invalid dates and were left empty, e.g.:", file=sys.stderr)
+            for row, text in date_parser.invalid_rows[:10]:
+                print(f"  row {row + 1}: {text!r}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from ageengine import age_columns, calculate_age, civil_from_days, EPOCH_ORDINAL
+from calendarindex import get_index
+from countdownengine import split_remaining, split_remaining_columns
+from weekdayengine import weekday_name, weekday_names, weekdays, weekdays_from_ordinals
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+AS_OF = date(2026, 10, 18)
+SEED = 12345
+SCALAR_CALLS = (1, 1000, 100_000)
+
+
+def _time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return min(times), sum(times) / len(times)
+
+
+def _record(results, name, rows, func, repeat):
+    best, mean = _time(func, repeat)
+    results.append({"name": name, "rows": rows, "best_s": best, "mean_s": mean, "ns_per_row": best / rows * 1e9})
+    print(f"{name:<28} {rows:>10} rows {best * 1000:12.3f} ms {best / rows * 1e9:10.1f} ns/row", file=sys.stderr)
+
+
+def _batch_sizes(max_rows):
+    size = 1
+    while size <= max_rows:
+        yield size
+        size *= 10
+
+
+def _ordinals(rng, rows):
+    return rng.integers(date(1900, 1, 1).toordinal(), AS_OF.toordinal() + 1, size=rows)
+
+
+def bench_age(results, rng, max_rows, repeat):
+    for calls in SCALAR_CALLS:
+        births = [date.fromordinal(int(o)) for o in _ordinals(rng, calls)]
+        _record(results, "age_scalar", calls, lambda: [calculate_age(b, AS_OF) for b in births], repeat)
+    for rows in _batch_sizes(max_rows):
+        ordinals = _ordinals(rng, rows)
+        _record(results, "age_batch", rows, lambda: age_columns(ordinals, AS_OF), repeat)
+
+
+def bench_weekday(results, rng, max_rows, repeat):
+    for calls in SCALAR_CALLS:
+        ymd = [(d.year, d.month, d.day) for d in (date.fromordinal(int(o)) for o in _ordinals(rng, calls))]
+        # The original DayOfWeekFrame.on_calculate path, for comparison
+        _record(results, "weekday_strftime", calls, lambda: [date(y, m, d).strftime("%A") for y, m, d in ymd], repeat)
+        _record(results, "weekday_scalar", calls, lambda: [weekday_name(y, m, d) for y, m, d in ymd], repeat)
+    for rows in _batch_sizes(max_rows):
+        ordinals = _ordinals(rng, rows)
+        years, months, days = civil_from_days(ordinals - EPOCH_ORDINAL)
+        _record(results, "weekday_batch_ymd", rows, lambda: weekday_names(weekdays(years, months, days)), repeat)
+        _record(results, "weekday_batch_ordinal", rows, lambda: weekdays_from_ordinals(ordinals), repeat)
+
+
+def bench_countdown(results, rng, max_rows, repeat):
+    for calls in SCALAR_CALLS:
+        remaining = rng.uniform(0, 400 * 86400, size=calls).tolist()
+        now = datetime(2026, 10, 18, 12, 0, 0)
+        targets = [now + timedelta(seconds=r) for r in remaining]
+
+        # The original CountdownFrame.update_result arithmetic, for comparison
+        def timedelta_path():
+            for target in targets:
+                delta = target - now
+                hours, remainder = divmod(delta.seconds, 3600)
+                divmod(remainder, 60)
+
+        _record(results, "countdown_timedelta", calls, timedelta_path, repeat)
+        _record(results, "countdown_scalar", calls, lambda: [split_remaining(r) for r in remaining], repeat)
+    for rows in _batch_sizes(max_rows):
+        remaining = rng.uniform(0, 400 * 86400, size=rows)
+        _record(results, "countdown_batch", rows, lambda: split_remaining_columns(remaining), repeat)
+
+
+def _run_python(args, timeout=120):
+    return subprocess.run([sys.executable] + args, cwd=HERE, capture_output=True, text=True, timeout=timeout)
+
+
+def _import_time(results, name, modules, repeat):
+    code = f"import time; t = time.perf_counter(); import {modules}; print(time.perf_counter() - t)"
+    samples = []
+    for _ in range(repeat):
+        proc = _run_python(["-c", code])
+        if proc.returncode != 0:
+            error = (proc.stderr.strip().splitlines() or ["unknown error"])[-1]
+            results.append({"name": name, "skipped": error})
+            print(f"{name:<28} skipped: {error}", file=sys.stderr)
+            return
+        samples.append(float(proc.stdout.strip().splitlines()[-1]))
+    results.append({"name": name, "rows": 1, "best_s": min(samples), "mean_s": sum(samples) / len(samples)})
+    print(f"{name:<28} {min(samples) * 1000:12.3f} ms", file=sys.stderr)
+
+
+def bench_launcher(results, repeat):
+    _import_time(results, "import_engines", "ageengine, weekdayengine, countdownengine", repeat)
+    _import_time(results, "import_launcher", "launcher", repeat)
+    if sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        results.append({"name": "launcher_startup", "skipped": "no display"})
+        print(f"{'launcher_startup':<28} skipped: no display", file=sys.stderr)
+        return
+    reports = []
+    for _ in range(repeat):
+        proc = _run_python(["launcher.py", "--startup-report", "--exit-after-startup"])
+        lines = [line for line in proc.stdout.splitlines() if line.startswith("{")]
+        if proc.returncode != 0 or not lines:
+            error = (proc.stderr.strip().splitlines() or ["no startup report"])[-1]
+            results.append({"name": "launcher_startup", "skipped": error})
+            return
+        reports.append(json.loads(lines[-1]))
+    for key in reports[0]:
+        samples = [report[key] / 1000 for report in reports if key in report]
+        results.append({"name": f"launcher_{key}", "rows": 1, "best_s": min(samples), "mean_s": sum(samples) / len(samples)})
+        print(f"{'launcher_' + key:<28} {min(samples) * 1000:12.3f} ms", file=sys.stderr)
+
+
+def _git_commit():
+    try:
+        proc = subprocess.run(["git", "rev-parse", "HEAD"], cwd=HERE, capture_output=True, text=True)
+        return proc.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(max_rows, repeat, only=None):
+    rng = np.random.default_rng(SEED)
+    results = []
+    get_index()  # build the shared calendar index outside the timed sections
+    suites = {
+        "age": lambda: bench_age(results, rng, max_rows, repeat),
+        "weekday": lambda: bench_weekday(results, rng, max_rows, repeat),
+        "countdown": lambda: bench_countdown(results, rng, max_rows, repeat),
+        "launcher": lambda: bench_launcher(results, repeat),
+    }
+    for name, suite in suites.items():
+        if not only or name in only:
+            suite()
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "max_rows": max_rows,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(old_path, new_path):
+    """Print new/old best-time ratios for every benchmark present in both files."""
+    with open(old_path, encoding="utf-8") as f:
+        old = {(r["name"], r.get("rows")): r for r in json.load(f)["results"] if "best_s" in r}
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)["results"]
+    for r in new:
+        base = old.get((r["name"], r.get("rows")))
+        if base is None or "best_s" not in r:
+            continue
+        ratio = r["best_s"] / base["best_s"] if base["best_s"] else float("inf")
+        print(f"{r['name']:<28} {r.get('rows', ''):>10} {base['best_s'] * 1000:12.3f} ms -> {r['best_s'] * 1000:12.3f} ms  x{ratio:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless benchmarks for the date calculations and the launcher.")
+    parser.add_argument("--max-rows", type=int, default=10_000_000, help="largest batch size (default: 10^7)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark; the best is reported")
+    parser.add_argument("--only", nargs="*", choices=("age", "weekday", "countdown", "launcher"), help="suites to run")
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    report = run(args.max_rows, args.repeat, args.only)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+from array import array
+from datetime import date
+
+from ageengine import EPOCH_ORDINAL
+from weekdayengine import WEEKDAY_NAMES
+
+np = None  # imported on first vectorized use, see ageengine
+
+DEFAULT_WEEKMASK = "1111100"  # Monday to Friday
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for bulk business-day counts. Install it with: pip install numpy") from None
+        np = numpy
+
+
+def parse_weekmask(weekmask):
+    """Seven working-day flags, Monday first, from "1111100", "Mon Tue Wed Thu Fri" or a sequence of bools."""
+    if isinstance(weekmask, str):
+        text = weekmask.strip()
+        if len(text) == 7 and set(text) <= {"0", "1"}:
+            return tuple(c == "1" for c in text)
+        abbreviations = [name[:3].lower() for name in WEEKDAY_NAMES]
+        days = {word[:3].lower() for word in text.replace(",", " ").split()}
+        unknown = days - set(abbreviations)
+        if unknown:
+            raise ValueError(f"Unknown weekday in weekmask: {', '.join(sorted(unknown))}")
+        return tuple(a in days for a in abbreviations)
+    flags = tuple(bool(v) for v in weekmask)
+    if len(flags) != 7:
+        raise ValueError("A weekmask needs exactly 7 entries")
+    return flags
+
+
+def load_holidays(path):
+    """Read holidays from a text file with one YYYY-MM-DD date per line; blank lines and # comments are skipped."""
+    holidays = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                holidays.append(date.fromisoformat(line))
+    return holidays
+
+
+class BusinessCalendar:
+    """Counts working days between two dates in constant time.
+
+    Working weekdays are counted from the fixed week structure: ordinal 1
+    (0001-01-01) is a Monday, so the working days before any ordinal are the
+    full weeks times the weekly count plus a prefix of the mask. Holidays
+    that fall on working days are turned into a cumulative count array over
+    the span they cover, so subtracting them is two array lookups as well.
+    """
+
+    def __init__(self, weekmask=DEFAULT_WEEKMASK, holidays=()):
+        self.weekmask = parse_weekmask(weekmask)
+        if not any(self.weekmask):
+            raise ValueError("A weekmask needs at least one working day")
+        self.week_prefix = [0] * 8  # working days among the first k weekdays
+        for k, working in enumerate(self.weekmask):
+            self.week_prefix[k + 1] = self.week_prefix[k] + working
+        self.per_week = self.week_prefix[7]
+        ordinals = sorted({_ordinal(h) for h in holidays})
+        self.holidays = [o for o in ordinals if self.weekmask[(o - 1) % 7]]
+        # holidays_before[i]: working-day holidays with ordinal < first + i, for first <= ordinal <= last + 1
+        self.first = self.holidays[0] if self.holidays else 1
+        span = self.holidays[-1] - self.first + 2 if self.holidays else 1
+        self.holidays_before = array("i", bytes(4 * span))
+        for o in self.holidays:
+            self.holidays_before[o - self.first + 1] += 1
+        for i in range(1, span):
+            self.holidays_before[i] += self.holidays_before[i - 1]
+        self._columns = None
+
+    def _weekdays_before(self, ordinal):
+        full, rest = divmod(ordinal - 1, 7)
+        return full * self.per_week + self.week_prefix[rest]
+
+    def _holidays_before(self, ordinal):
+        i = ordinal - self.first
+        if i <= 0:
+            return 0
+        table = self.holidays_before
+        return table[i] if i < len(table) else table[-1]
+
+    def business_days_before(self, day):
+        """Working days from 0001-01-01 up to, but not including, day."""
+        ordinal = _ordinal(day)
+        return self._weekdays_before(ordinal) - self._holidays_before(ordinal)
+
+    def is_business_day(self, day):
+        ordinal = _ordinal(day)
+        return self.weekmask[(ordinal - 1) % 7] and self._holidays_before(ordinal + 1) == self._holidays_before(ordinal)
+
+    def count(self, start, end):
+        """Working days in [start, end); when end is before start, minus the working days in [end, start)."""
+        return self.business_days_before(end) - self.business_days_before(start)
+
+    def _arrays(self):
+        if self._columns is None:
+            self._columns = (np.array(self.week_prefix, dtype=np.int64),
+                             np.frombuffer(self.holidays_before, dtype=np.int32).astype(np.int64))
+        return self._columns
+
+    def business_days_before_many(self, ordinals):
+        """Vectorized business_days_before over an array of date.toordinal() ordinals."""
+        _require_numpy()
+        prefix, table = self._arrays()
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        full, rest = np.divmod(ordinals - 1, 7)
+        holidays = table[np.clip(ordinals - self.first, 0, len(table) - 1)]  # table[0] is 0
+        return full * self.per_week + prefix[rest] - holidays
+
+    def count_many(self, starts, ends):
+        """Vectorized count over arrays of datetime64[D] values or ordinals."""
+        return self.business_days_before_many(_ordinals(ends)) - self.business_days_before_many(_ordinals(starts))
+
+
+def _ordinal(day):
+    return day.toordinal() if hasattr(day, "toordinal") else int(day)
+
+
+def _ordinals(values):
+    _require_numpy()
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[D]").astype(np.int64) + EPOCH_ORDINAL
+    return values.astype(np.int64)
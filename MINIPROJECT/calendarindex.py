@@ -0,0 +1,140 @@
+import sys
+from array import array
+
+MIN_YEAR = 1
+MAX_YEAR = 9999
+MONTHS = (MAX_YEAR - MIN_YEAR + 1) * 12
+_MAGIC = b"CALIDX01"
+_COMMON_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+class CalendarIndex:
+    """Precomputed Gregorian calendar for years 1-9999, stored in flat arrays.
+
+    Months are indexed as (year - 1) * 12 + (month - 1). Ordinals follow
+    date.toordinal() (0001-01-01 is 1) and weekdays follow date.weekday()
+    (Monday is 0).
+    """
+
+    __slots__ = ("month_start", "month_length", "month_weekday", "leap")
+
+    def __init__(self, month_start, month_length, month_weekday, leap):
+        self.month_start = month_start      # int32 ordinal of the 1st of each month, plus one sentinel
+        self.month_length = month_length    # uint8 days in each month
+        self.month_weekday = month_weekday  # uint8 weekday of the 1st of each month
+        self.leap = leap                    # uint8 per year, index 0 unused
+
+    @classmethod
+    def build(cls):
+        month_start = array("i", bytes(4 * (MONTHS + 1)))
+        month_length = array("B", bytes(MONTHS))
+        month_weekday = array("B", bytes(MONTHS))
+        leap = array("B", bytes(MAX_YEAR + 1))
+        ordinal = 1
+        i = 0
+        for year in range(MIN_YEAR, MAX_YEAR + 1):
+            is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            leap[year] = is_leap
+            for month in range(12):
+                length = _COMMON_LENGTHS[month] + (is_leap and month == 1)
+                month_start[i] = ordinal
+                month_length[i] = length
+                month_weekday[i] = (ordinal - 1) % 7
+                ordinal += length
+                i += 1
+        month_start[i] = ordinal
+        return cls(month_start, month_length, month_weekday, leap)
+
+    def to_bytes(self):
+        """Pack the tables into a little-endian binary blob for from_bytes()."""
+        month_start = array("i", self.month_start)
+        if sys.byteorder == "big":
+            month_start.byteswap()
+        return b"".join((_MAGIC, month_start.tobytes(), self.month_length.tobytes(),
+                         self.month_weekday.tobytes(), self.leap.tobytes()))
+
+    @classmethod
+    def from_bytes(cls, blob):
+        if blob[:len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not a calendar index blob")
+        pos = len(_MAGIC)
+        month_start = array("i")
+        month_start.frombytes(blob[pos:pos + 4 * (MONTHS + 1)])
+        if sys.byteorder == "big":
+            month_start.byteswap()
+        pos += 4 * (MONTHS + 1)
+        month_length = array("B", blob[pos:pos + MONTHS])
+        pos += MONTHS
+        month_weekday = array("B", blob[pos:pos + MONTHS])
+        pos += MONTHS
+        leap = array("B", blob[pos:pos + MAX_YEAR + 1])
+        if len(month_start) != MONTHS + 1 or len(leap) != MAX_YEAR + 1:
+            raise ValueError("Truncated calendar index blob")
+        return cls(month_start, month_length, month_weekday, leap)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def _month_index(self, year, month):
+        if not MIN_YEAR <= year <= MAX_YEAR:
+            raise ValueError(f"year {year} is out of range")
+        if not 1 <= month <= 12:
+            raise ValueError("month must be in 1..12")
+        return (year - 1) * 12 + month - 1
+
+    def _checked_index(self, year, month, day):
+        i = self._month_index(year, month)
+        if not 1 <= day <= self.month_length[i]:
+            raise ValueError("day is out of range for month")
+        return i
+
+    def is_leap(self, year):
+        if not MIN_YEAR <= year <= MAX_YEAR:
+            raise ValueError(f"year {year} is out of range")
+        return bool(self.leap[year])
+
+    def days_in_month(self, year, month):
+        return self.month_length[self._month_index(year, month)]
+
+    def is_valid(self, year, month, day):
+        return (MIN_YEAR <= year <= MAX_YEAR and 1 <= month <= 12
+                and 1 <= day <= self.month_length[(year - 1) * 12 + month - 1])
+
+    def to_ordinal(self, year, month, day):
+        return self.month_start[self._checked_index(year, month, day)] + day - 1
+
+    def weekday(self, year, month, day):
+        return (self.month_weekday[self._checked_index(year, month, day)] + day - 1) % 7
+
+    def from_ordinal(self, ordinal):
+        """Return (year, month, day) for a date.toordinal() value."""
+        starts = self.month_start
+        if not 1 <= ordinal < starts[MONTHS]:
+            raise ValueError(f"ordinal {ordinal} is out of range")
+        # 146097 days per 400 years gives a year estimate that is off by at most one
+        year = min((ordinal - 1) * 400 // 146097 + 1, MAX_YEAR)
+        if starts[(year - 1) * 12] > ordinal:
+            year -= 1
+        elif year < MAX_YEAR and starts[year * 12] <= ordinal:
+            year += 1
+        i = (year - 1) * 12 + min((ordinal - starts[(year - 1) * 12]) // 29, 11)
+        while starts[i] > ordinal:
+            i -= 1
+        return year, i % 12 + 1, ordinal - starts[i] + 1
+
+
+_shared = None
+
+
+def get_index(path=None):
+    """Return the process-wide CalendarIndex, loading it from a blob at path or building it on first use."""
+    global _shared
+    if _shared is None:
+        _shared = CalendarIndex.load(path) if path else CalendarIndex.build()
+    return _shared
@@ -0,0 +1,146 @@
+import time
+import wx
+from array import array
+from datetime import datetime
+from countdownengine import format_compact
+from Countdowntoafutureevent import get_scheduler
+from eventstore import get_store
+from instrumentation import timed
+from uifonts import get_fonts
+
+DASHBOARD_MAX_EVENTS = 100_000
+COLUMNS = (("Event", 320), ("Due", 200), ("Remaining", 180))
+
+
+class CountdownListCtrl(wx.ListCtrl):
+    """Virtual list of countdowns: wx asks for the text of a cell only when it paints that row."""
+
+    def __init__(self, parent):
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_HRULES | wx.LC_VRULES)
+        for i, (label, width) in enumerate(COLUMNS):
+            self.InsertColumn(i, label, width=width)
+        self.names = []
+        self.deadlines = array("d")
+        self.now = time.time()  # one clock reading per refresh keeps the visible rows consistent
+
+    def set_events(self, events):
+        self.names = [e.name for e in events]
+        self.deadlines = array("d", (e.deadline for e in events))
+        self.now = time.time()
+        self.SetItemCount(len(self.names))
+        self.Refresh()
+
+    def OnGetItemText(self, item, column):
+        if column == 0:
+            return self.names[item]
+        if column == 1:
+            return f"{datetime.fromtimestamp(self.deadlines[item]):%Y-%m-%d %H:%M:%S}"
+        return format_compact(self.deadlines[item] - self.now)
+
+    def refresh_visible(self):
+        """Repaint only the rows currently on screen."""
+        count = self.GetItemCount()
+        if not count:
+            return
+        self.now = time.time()
+        top = self.GetTopItem()
+        bottom = min(top + self.GetCountPerPage(), count - 1)
+        self.RefreshItems(top, bottom)
+
+
+class CountdownDashboard(wx.Frame):
+    """All saved countdowns in one window, driven by the shared countdown scheduler."""
+
+    @timed("CountdownDashboard.__init__")
+    def __init__(self, parent=None):
+        super().__init__(parent, title="Countdown Dashboard", size=(760, 520))
+        panel = wx.Panel(self)
+        panel.SetBackgroundColour('#fff6f0')
+
+        header_font, default_font, button_font = get_fonts()
+        panel.SetFont(default_font)
+
+        header = wx.StaticText(panel, label="Countdown Dashboard")
+        header.SetFont(header_font)
+        header.SetForegroundColour('#7a3b00')
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(header, 0, wx.ALL | wx.ALIGN_CENTER, 18)
+
+        self.list_ctrl = CountdownListCtrl(panel)
+        sizer.Add(self.list_ctrl, 1, wx.LEFT | wx.RIGHT | wx.EXPAND, 12)
+
+        btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        reload_btn = wx.Button(panel, label="Reload")
+        reload_btn.SetFont(button_font)
+        reload_btn.Bind(wx.EVT_BUTTON, self.on_reload)
+        btn_sizer.Add(reload_btn, 0, wx.RIGHT, 12)
+        self.count_text = wx.StaticText(panel, label="")
+        btn_sizer.Add(self.count_text, 0, wx.ALIGN_CENTER_VERTICAL)
+        sizer.Add(btn_sizer, 0, wx.ALL | wx.ALIGN_CENTER, 12)
+
+        panel.SetSizer(sizer)
+
+        # One scheduler entry for the whole list: refresh every second until the last deadline passes
+        self.scheduler = get_scheduler()
+        self.event_id = None
+        self.Bind(wx.EVT_ICONIZE, self.on_iconize)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        try:
+            self.store = get_store()
+        except Exception as e:
+            self.store = None
+            self.count_text.SetLabel(f"Saved events are unavailable: {e}")
+        self.load_events()
+
+    def load_events(self):
+        if self.store is None:
+            return
+        events = self.store.next_due(DASHBOARD_MAX_EVENTS)
+        self.list_ctrl.set_events(events)
+        self.count_text.SetLabel(f"{len(events)} upcoming events")
+        self._cancel_refresh()
+        if events:
+            deadline = self.scheduler.wall_to_clock(events[-1].deadline)
+            self.event_id = self.scheduler.add(deadline, self.on_last_reached, self.on_tick)
+
+    def _cancel_refresh(self):
+        if self.event_id is not None:
+            self.scheduler.cancel(self.event_id)
+            self.event_id = None
+
+    @timed("CountdownDashboard.on_tick")
+    def on_tick(self):
+        self.list_ctrl.refresh_visible()
+        return 1
+
+    def on_last_reached(self):
+        self.event_id = None
+        self.list_ctrl.refresh_visible()
+
+    def on_reload(self, event):
+        self.load_events()
+
+    def on_iconize(self, event):
+        if self.event_id is not None:
+            visible = not event.IsIconized()
+            self.scheduler.set_visible(self.event_id, visible)
+            if visible:
+                self.list_ctrl.refresh_visible()
+        event.Skip()
+
+    def on_close(self, event):
+        self._cancel_refresh()
+        event.Skip()
+
+
+if __name__ == "__main__":
+    try:
+        app = wx.App(False)
+    except Exception:
+        print("wxPython is required to run this GUI. Install it with: pip install wxPython")
+        raise
+
+    frame = CountdownDashboard()
+    frame.Show()
+    app.MainLoop()
@@ -0,0 +1,64 @@
+import math
+
+np = None  # imported on first vectorized use, see ageengine
+
+# (remaining seconds above which the step applies, display/refresh step in seconds)
+ADAPTIVE_STEPS = (
+    (30 * 86400, 3600),
+    (86400, 60),
+    (0, 1),
+)
+
+
+def split_remaining(seconds):
+    """Break a remaining time in seconds into (days, hours, minutes, seconds), flooring like timedelta."""
+    days, rest = divmod(math.floor(seconds), 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
+    return days, hours, minutes, secs
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for batch countdown calculation. Install it with: pip install numpy") from None
+        np = numpy
+
+
+def split_remaining_columns(seconds):
+    """Vectorized split_remaining over an array of remaining seconds. Returns four int64 arrays."""
+    _require_numpy()
+    total = np.floor(np.asarray(seconds, dtype=np.float64)).astype(np.int64)
+    days, rest = np.divmod(total, 86400)
+    hours, rest = np.divmod(rest, 3600)
+    minutes, secs = np.divmod(rest, 60)
+    return days, hours, minutes, secs
+
+
+def format_remaining(seconds):
+    days, hours, minutes, secs = split_remaining(seconds)
+    return f"Time remaining: {days} days, {hours} hours, {minutes} minutes, {secs} seconds."
+
+
+def format_compact(seconds):
+    """Short countdown text for table cells, e.g. "3d 04:05:06"."""
+    if seconds <= 0:
+        return "Reached"
+    days, hours, minutes, secs = split_remaining(seconds)
+    return f"{days}d {hours:02}:{minutes:02}:{secs:02}"
+
+
+def format_adaptive(remaining):
+    """Return the countdown text at the coarsest unit the remaining time allows, and that unit in seconds."""
+    for threshold, step in ADAPTIVE_STEPS:
+        if remaining > threshold:
+            break
+    days, hours, minutes, secs = split_remaining(remaining // step * step)
+    if step == 3600:
+        return f"Time remaining: {days} days, {hours} hours.", step
+    if step == 60:
+        return f"Time remaining: {days} days, {hours} hours, {minutes} minutes.", step
+    return f"Time remaining: {days} days, {hours} hours, {minutes} minutes, {secs} seconds.", step
@@ -0,0 +1,145 @@
+import heapq
+import itertools
+import math
+import time
+
+
+class _Event:
+    __slots__ = ("event_id", "deadline", "on_due", "on_refresh", "visible", "refresh_token")
+
+    def __init__(self, event_id, deadline, on_due, on_refresh):
+        self.event_id = event_id
+        self.deadline = deadline
+        self.on_due = on_due
+        self.on_refresh = on_refresh
+        self.visible = on_refresh is not None
+        self.refresh_token = 0
+
+
+class CountdownScheduler:
+    """Deadline queue shared by many countdowns so that one timer can drive all of them.
+
+    Deadlines are in the units of clock (time.monotonic by default, so wall
+    clock adjustments cannot make timers drift); wall_to_clock() converts an
+    epoch timestamp. Two heaps are kept: one keyed by deadline and one keyed by
+    the next display refresh of visible events. Entries of cancelled or hidden
+    events are discarded lazily when they reach the top, so a wakeup only
+    touches events that are due.
+    """
+
+    def __init__(self, clock=time.monotonic, refresh_interval=1.0):
+        self.clock = clock
+        self.refresh_interval = refresh_interval
+        self.wakeup_changed = None  # called when the earliest wakeup may have moved earlier
+        self._events = {}
+        self._due_heap = []
+        self._refresh_heap = []
+        self._ids = itertools.count(1)
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, event_id):
+        return event_id in self._events
+
+    def wall_to_clock(self, timestamp):
+        """Convert an epoch timestamp (datetime.timestamp()) to the scheduler clock."""
+        return timestamp - time.time() + self.clock()
+
+    def remaining(self, event_id, now=None):
+        """Seconds left until the event's deadline."""
+        if now is None:
+            now = self.clock()
+        return self._events[event_id].deadline - now
+
+    def add(self, deadline, on_due, on_refresh=None):
+        """Track a countdown.
+
+        on_due() runs once at the deadline. on_refresh() runs while the event is
+        visible; it may return the number of seconds its display can wait
+        before the next refresh, otherwise refresh_interval is used.
+        """
+        event_id = next(self._ids)
+        event = _Event(event_id, deadline, on_due, on_refresh)
+        self._events[event_id] = event
+        heapq.heappush(self._due_heap, (deadline, event_id))
+        if event.visible:
+            self._push_refresh(event, self.clock())
+        self._notify()
+        return event_id
+
+    def cancel(self, event_id):
+        self._events.pop(event_id, None)
+
+    def set_visible(self, event_id, visible):
+        event = self._events.get(event_id)
+        if event is None or event.on_refresh is None or event.visible == visible:
+            return
+        event.visible = visible
+        if visible:
+            self._push_refresh(event, self.clock())
+            self._notify()
+
+    def rearm_refresh(self, event_id):
+        """Schedule the event's next refresh at the default interval, e.g. after its display format changed."""
+        event = self._events.get(event_id)
+        if event is not None and event.visible:
+            self._push_refresh(event, self.clock())
+            self._notify()
+
+    def next_wakeup(self):
+        """Epoch time of the next due deadline or refresh, or None when nothing is scheduled."""
+        self._prune()
+        times = []
+        if self._due_heap:
+            times.append(self._due_heap[0][0])
+        if self._refresh_heap:
+            times.append(self._refresh_heap[0][0])
+        return min(times) if times else None
+
+    def run(self, now=None):
+        """Fire every deadline and refresh that is due at now. Returns the number of callbacks run."""
+        if now is None:
+            now = self.clock()
+        fired = 0
+        while self._due_heap and self._due_heap[0][0] <= now:
+            _, event_id = heapq.heappop(self._due_heap)
+            event = self._events.pop(event_id, None)
+            if event is not None:
+                event.on_due()
+                fired += 1
+        while self._refresh_heap and self._refresh_heap[0][0] <= now:
+            _, event_id, token = heapq.heappop(self._refresh_heap)
+            event = self._events.get(event_id)
+            if event is None or not event.visible or event.refresh_token != token:
+                continue
+            step = event.on_refresh()
+            fired += 1
+            if event_id in self._events:
+                self._push_refresh(event, now, step)
+        return fired
+
+    def _push_refresh(self, event, now, step=None):
+        # Refresh exactly when the remaining time crosses a multiple of step, i.e.
+        # when a display rounded up to that step changes. Computing each wakeup
+        # from the deadline rather than from the previous tick keeps it drift-free.
+        # The token invalidates any older entry left behind by a hide/show cycle.
+        event.refresh_token += 1
+        step = step or self.refresh_interval
+        k = math.ceil((event.deadline - now) / step) - 1
+        at = event.deadline - k * step if k > 0 else event.deadline
+        heapq.heappush(self._refresh_heap, (at, event.event_id, event.refresh_token))
+
+    def _prune(self):
+        while self._due_heap and self._due_heap[0][1] not in self._events:
+            heapq.heappop(self._due_heap)
+        while self._refresh_heap:
+            _, event_id, token = self._refresh_heap[0]
+            event = self._events.get(event_id)
+            if event is not None and event.visible and event.refresh_token == token:
+                break
+            heapq.heappop(self._refresh_heap)
+
+    def _notify(self):
+        if self.wakeup_changed is not None:
+            self.wakeup_changed()
@@ -0,0 +1,153 @@
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+
+# Only the scalar engines are imported here: no wx, no NumPy, so the tool
+# starts quickly enough to be run per call or kept open as a co-process
+from ageengine import calculate_age
+from calendarindex import get_index
+from countdownengine import format_compact, split_remaining
+from weekdayengine import WEEKDAY_NAMES
+
+INDEX_PATH = os.path.join(os.path.expanduser("~"), ".minitools_calendar.idx")
+TOOLS = ("age", "weekday", "countdown")
+
+
+def _as_of(body, now):
+    value = body.get("as_of")
+    if value:
+        return date.fromisoformat(value)
+    return now.date() if now else date.today()
+
+
+def _now(body, now):
+    value = body.get("now")
+    if value:
+        return datetime.fromisoformat(value)
+    return now or datetime.now()
+
+
+def age(body, now=None):
+    birth_date = date.fromisoformat(body["birth_date"])
+    as_of = _as_of(body, now)
+    if birth_date > as_of:
+        raise ValueError("Birth date is in the future.")
+    years, months, days = calculate_age(birth_date, as_of)
+    return {"years": years, "months": months, "days": days}
+
+
+def weekday(body, now=None):
+    code = date.fromisoformat(body["date"]).weekday()
+    return {"weekday": code, "name": WEEKDAY_NAMES[code]}
+
+
+def countdown(body, now=None):
+    target = datetime.fromisoformat(body["target"])
+    zone = body.get("zone")
+    if zone:
+        from zonedcountdown import to_epoch  # pulls in zoneinfo, so only when a zone is asked for
+        if body.get("now") or now:
+            current = to_epoch(_now(body, now), zone)  # an explicit now is wall time in the target's zone
+        else:
+            current = time.time()  # datetime.now() would be this machine's wall time, not the zone's
+        remaining = to_epoch(target, zone) - current
+    else:
+        remaining = (target - _now(body, now)).total_seconds()
+    days, hours, minutes, seconds = split_remaining(remaining)
+    return {"reached": remaining <= 0, "days": days, "hours": hours, "minutes": minutes, "seconds": seconds}
+
+
+HANDLERS = {"age": (age, "birth_date"), "weekday": (weekday, "date"), "countdown": (countdown, "target")}
+
+
+def _plain_text(tool, result):
+    """Tab-separated result for a plain input line."""
+    if tool == "age":
+        return f"{result['years']}\t{result['months']}\t{result['days']}"
+    if tool == "weekday":
+        return f"{result['weekday']}\t{result['name']}"
+    seconds = result["days"] * 86400 + result["hours"] * 3600 + result["minutes"] * 60 + result["seconds"]
+    return format_compact(seconds)
+
+
+def handle_line(line, tool=None, now=None):
+    """Result line for one input line: a JSON object answers in JSON, a bare date or datetime in plain text.
+
+    A JSON line names its tool in "tool" (falling back to tool) and takes the
+    same fields as the matching dateservice endpoint. now, when given,
+    stands in for the current time in lines without an "as_of" or "now".
+    """
+    text = line.strip()
+    if text.startswith("{"):
+        body = None
+        try:
+            body = json.loads(text)
+            if not isinstance(body, dict):
+                raise ValueError("Expected a JSON object")
+            name = body.get("tool", tool)
+            if name not in HANDLERS:
+                raise ValueError(f"Unknown tool {name!r}; expected one of: {', '.join(TOOLS)}")
+            result = HANDLERS[name][0](body, now)
+        except KeyError as e:
+            result = {"error": f"Missing field: {e.args[0]}"}
+        except Exception as e:
+            result = {"error": str(e)}
+        if isinstance(body, dict) and "id" in body:
+            result["id"] = body["id"]  # lets a co-process match answers to requests
+        return json.dumps(result)
+    if tool is None:
+        return "error: plain date lines need --tool"
+    try:
+        handler, field = HANDLERS[tool]
+        return _plain_text(tool, handler({field: text}, now))
+    except Exception as e:
+        return f"error: {e}"
+
+
+def _load_index(path):
+    """Load the calendar index blob at path, building and saving it when it is missing or unreadable."""
+    try:
+        return get_index(path)
+    except Exception:
+        pass
+    index = get_index()
+    try:
+        index.save(path)
+    except Exception:
+        pass
+    return index
+
+
+def run(stdin, stdout, tool=None, now=None, flush=True):
+    """Answer stdin line by line until end of input, writing each result as soon as it is computed."""
+    for line in iter(stdin.readline, ""):
+        if not line.strip():
+            continue
+        stdout.write(handle_line(line, tool, now) + "\n")
+        if flush:
+            stdout.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Read JSON lines or plain date lines from stdin and write one result line per input line.")
+    parser.add_argument("--tool", choices=TOOLS, default=None,
+                        help="tool for plain date lines, and for JSON lines without a \"tool\" field")
+    parser.add_argument("--now", type=datetime.fromisoformat, default=None,
+                        help="fixed current date or time, YYYY-MM-DD[THH:MM:SS] (default: the clock, per line)")
+    parser.add_argument("--index", default=INDEX_PATH, help=f"calendar index cache file (default: {INDEX_PATH})")
+    parser.add_argument("--no-flush", action="store_true", help="buffer output instead of flushing every line")
+    args = parser.parse_args(argv)
+
+    _load_index(args.index)
+    try:
+        run(sys.stdin, sys.stdout, args.tool, args.now, not args.no_flush)
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
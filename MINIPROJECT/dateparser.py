@@ -0,0 +1,188 @@
+import re
+from collections import namedtuple
+
+from ageengine import days_from_civil, EPOCH_ORDINAL
+from calendarindex import get_index
+
+np = None  # imported on first vectorized use, see ageengine
+
+MONTH_NAMES = ("january", "february", "march", "april", "may", "june", "july", "august", "september",
+               "october", "november", "december")
+
+# name -> (pattern, field order, separator of the zero-padded layout or None for month names)
+FORMATS = {
+    "YYYY-MM-DD": (r"(\d{4})-(\d{1,2})-(\d{1,2})", "ymd", "-"),
+    "YYYY/MM/DD": (r"(\d{4})/(\d{1,2})/(\d{1,2})", "ymd", "/"),
+    "YYYYMMDD": (r"(\d{4})(\d{2})(\d{2})", "ymd", ""),
+    "DD/MM/YYYY": (r"(\d{1,2})/(\d{1,2})/(\d{4})", "dmy", "/"),
+    "MM/DD/YYYY": (r"(\d{1,2})/(\d{1,2})/(\d{4})", "mdy", "/"),
+    "DD.MM.YYYY": (r"(\d{1,2})\.(\d{1,2})\.(\d{4})", "dmy", "."),
+    "DD-MM-YYYY": (r"(\d{1,2})-(\d{1,2})-(\d{4})", "dmy", "-"),
+    "MM-DD-YYYY": (r"(\d{1,2})-(\d{1,2})-(\d{4})", "mdy", "-"),
+    "D Mon YYYY": (r"(\d{1,2})[ -]([A-Za-z]{3,9})\.?,?[ -](\d{4})", "dmy", None),
+    "Mon D, YYYY": (r"([A-Za-z]{3,9})\.? (\d{1,2}),? (\d{4})", "mdy", None),
+}
+_COMPILED = {name: (re.compile(pattern), order) for name, (pattern, order, _) in FORMATS.items()}
+_WIDTHS = {"y": 4, "m": 2, "d": 2}
+
+# Marks a string that did not parse, in the memo and in intermediate arrays
+INVALID = -(1 << 62)
+DEFAULT_SAMPLE = 1000
+DEFAULT_MEMO_SIZE = 1_000_000
+DEFAULT_MAX_REPORTED = 100
+
+ParsedDates = namedtuple("ParsedDates", "days nulls invalid_count invalid_rows")
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for bulk date parsing. Install it with: pip install numpy") from None
+        np = numpy
+
+
+def _month_number(token):
+    if token.isdigit():
+        return int(token)
+    token = token.lower()
+    for i, name in enumerate(MONTH_NAMES):
+        if name.startswith(token):  # "Oct", "Sept" and "October" all work
+            return i + 1
+    return 0
+
+
+def _parse_one(text, fmt):
+    """Days since 1970-01-01 for one string in format fmt, or INVALID."""
+    pattern, order = _COMPILED[fmt]
+    match = pattern.fullmatch(text.strip())
+    if match is None:
+        return INVALID
+    fields = dict(zip(order, match.groups()))
+    year, month, day = int(fields["y"]), _month_number(fields["m"]), int(fields["d"])
+    index = get_index()
+    if not index.is_valid(year, month, day):
+        return INVALID
+    return index.to_ordinal(year, month, day) - EPOCH_ORDINAL
+
+
+def detect_format(strings, sample=DEFAULT_SAMPLE):
+    """Name of the FORMATS entry that parses the most of the first sample distinct non-empty strings.
+
+    Ties go to the earlier entry, so ambiguous columns such as 01/02/2026 are read day first.
+    """
+    seen = {}
+    for text in strings:
+        if text and not text.isspace() and text not in seen:
+            seen[text] = None
+            if len(seen) >= sample:
+                break
+    best, best_count = None, 0
+    for fmt in FORMATS:
+        count = sum(_parse_one(text, fmt) != INVALID for text in seen)
+        if count > best_count:
+            best, best_count = fmt, count
+    return best
+
+
+def _parse_fixed_width(texts, fmt):
+    """Vectorized parse of zero-padded numeric strings. Returns days, INVALID where a string does not fit the layout."""
+    _, order, separator = FORMATS[fmt]
+    width = sum(_WIDTHS.values()) + 2 * len(separator)
+    # One spare character makes longer strings fail the length check instead of being cut to fit
+    texts = np.asarray(texts, dtype=f"U{width + 1}")
+    ok = np.char.str_len(texts) == width
+    codes = texts.view(np.uint32).reshape(len(texts), width + 1)
+    fields = {}
+    pos = 0
+    for i, field in enumerate(order):
+        value = np.zeros(len(texts), dtype=np.int64)
+        for _ in range(_WIDTHS[field]):
+            digit = codes[:, pos].astype(np.int32) - ord("0")
+            ok &= (digit >= 0) & (digit <= 9)
+            value = value * 10 + digit
+            pos += 1
+        fields[field] = value
+        if separator and i < 2:
+            ok &= codes[:, pos] == ord(separator)
+            pos += 1
+    year, month, day = fields["y"], fields["m"], fields["d"]
+    ok &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+    month = np.where(ok, month, 1)
+    month_length = np.array((0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31))[month]
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    ok &= day <= month_length + (leap & (month == 2))
+    return np.where(ok, days_from_civil(year, month, day), INVALID)
+
+
+class DateParser:
+    """Parses a column of date strings in one format, detected from the first values it sees.
+
+    Zero-padded numeric formats are parsed for the whole chunk in one
+    vectorized pass over the characters. Everything else (unpadded values,
+    month names, invalid strings) goes through the format's compiled
+    pattern, once per distinct string: results are memoized, so repeated
+    values cost a dictionary lookup.
+    """
+
+    def __init__(self, fmt=None, memo_size=DEFAULT_MEMO_SIZE, max_reported=DEFAULT_MAX_REPORTED):
+        _require_numpy()
+        if fmt is not None and fmt not in FORMATS:
+            raise ValueError(f"Unknown date format {fmt!r}; expected one of: {', '.join(FORMATS)}")
+        self.format = fmt
+        self.memo_size = memo_size
+        self.max_reported = max_reported
+        self.memo = {None: INVALID, "": INVALID}
+        self.rows = 0  # rows parsed so far, so reported row numbers run across chunks
+        self.invalid_count = 0
+        self.invalid_rows = []  # first max_reported (row, text) pairs over all chunks
+
+    def _slow_path(self, strings, rows, days):
+        """Fill days[rows] through the memo, parsing unseen strings with the format's pattern."""
+        memo = self.memo
+        texts = [strings[i] for i in rows]
+        new = [text for text in dict.fromkeys(texts) if text not in memo]
+        if new:
+            if len(memo) + len(new) > self.memo_size:
+                memo = self.memo = {None: INVALID, "": INVALID}
+                new = [text for text in dict.fromkeys(texts) if text not in memo]
+            memo.update((text, _parse_one(text, self.format)) for text in new)
+        days[rows] = np.fromiter(map(memo.__getitem__, texts), dtype=np.int64, count=len(texts))
+
+    def parse(self, strings):
+        """Parse a sequence of strings (None for missing) into a ParsedDates."""
+        strings = strings if isinstance(strings, list) else list(strings)
+        if self.format is None:
+            self.format = detect_format(strings)
+        first_row = self.rows
+        self.rows += len(strings)
+        if self.format is None:  # nothing but empty values so far
+            return ParsedDates(np.zeros(len(strings), dtype=np.int64), np.ones(len(strings), dtype=bool), 0, [])
+        if FORMATS[self.format][2] is None:
+            days = np.full(len(strings), INVALID, dtype=np.int64)
+        else:
+            days = _parse_fixed_width(strings, self.format)
+        slow = np.flatnonzero(days == INVALID)
+        if len(slow):
+            self._slow_path(strings, slow, days)
+        nulls = days == INVALID
+        days[nulls] = 0
+        invalid_rows = []
+        invalid_count = 0
+        for i in np.flatnonzero(nulls):
+            text = strings[i]
+            if text is None or not text.strip():
+                continue
+            invalid_count += 1
+            if len(invalid_rows) < self.max_reported:
+                invalid_rows.append((first_row + int(i), text))
+        self.invalid_count += invalid_count
+        self.invalid_rows.extend(invalid_rows[:self.max_reported - len(self.invalid_rows)])
+        return ParsedDates(days, nulls, invalid_count, invalid_rows)
+
+
+def parse_dates(strings, fmt=None):
+    """Parse one column of date strings with a fresh DateParser. See DateParser.parse()."""
+    return DateParser(fmt).parse(strings)
@@ -0,0 +1,93 @@
+from bisect import bisect_left
+from datetime import date
+
+from calendarindex import get_index, MAX_YEAR, MIN_YEAR
+
+CYCLE_MONTHS = 400 * 12  # weekdays and month lengths repeat every 400 years
+
+_tables = {}
+
+
+def _cycle_table(key, day_in_month):
+    """(month offset, day) pairs within one 400-year cycle where day_in_month(first weekday, length) gives a day.
+
+    Built once per query shape from the month-start weekdays of the calendar
+    index and cached, so a query only walks its own matches.
+    """
+    table = _tables.get(key)
+    if table is None:
+        index = get_index()
+        month = key[-1]
+        months = range(month - 1, CYCLE_MONTHS, 12) if month else range(CYCLE_MONTHS)
+        table = ([], [])
+        for i in months:
+            day = day_in_month(index.month_weekday[i], index.month_length[i])
+            if day is not None:
+                table[0].append(i)
+                table[1].append(day)
+        _tables[key] = table
+    return table
+
+
+def _matches(table, start_year, end_year):
+    """Dates of every cycle match in years start_year..end_year inclusive, in order."""
+    if not MIN_YEAR <= start_year <= end_year <= MAX_YEAR:
+        raise ValueError(f"year range must be ordered and within {MIN_YEAR}..{MAX_YEAR}")
+    offsets, days = table
+    first = (start_year - 1) * 12
+    stop = end_year * 12
+    base = first - first % CYCLE_MONTHS
+    k = bisect_left(offsets, first - base)
+    while base < stop:
+        for k in range(k, len(offsets)):
+            month_index = base + offsets[k]
+            if month_index >= stop:
+                return
+            yield date(month_index // 12 + 1, month_index % 12 + 1, days[k])
+        base += CYCLE_MONTHS
+        k = 0
+
+
+def _check(weekday, month):
+    if not 0 <= weekday <= 6:
+        raise ValueError("weekday must be in 0..6 (Monday is 0)")
+    if month is not None and not 1 <= month <= 12:
+        raise ValueError("month must be in 1..12")
+
+
+def day_on_weekday(day, weekday, start_year, end_year, month=None):
+    """Dates where day of the month falls on weekday, e.g. day_on_weekday(13, 4, 1900, 2100) for every Friday the 13th.
+
+    With month given only that month of each year is considered.
+    """
+    _check(weekday, month)
+    if not 1 <= day <= 31:
+        raise ValueError("day must be in 1..31")
+
+    def rule(first_weekday, length):
+        return day if day <= length and (first_weekday + day - 1) % 7 == weekday else None
+
+    return _matches(_cycle_table(("day", day, weekday, month), rule), start_year, end_year)
+
+
+def years_on_weekday(month, day, weekday, start_year, end_year):
+    """Years in which month/day falls on weekday, e.g. years_on_weekday(12, 25, 0, 2000, 2100)."""
+    if month is None:
+        raise ValueError("month is required")
+    return (d.year for d in day_on_weekday(day, weekday, start_year, end_year, month))
+
+
+def nth_weekdays(n, weekday, start_year, end_year, month=None):
+    """The nth weekday of each month (n is 1-5, or -1 for the last one), skipping months that have no nth."""
+    _check(weekday, month)
+    if n not in (1, 2, 3, 4, 5, -1):
+        raise ValueError("n must be 1-5, or -1 for the last")
+
+    def rule(first_weekday, length):
+        first = 1 + (weekday - first_weekday) % 7
+        if n == -1:
+            return first + (length - first) // 7 * 7
+        day = first + (n - 1) * 7
+        return day if day <= length else None
+
+    return _matches(_cycle_table(("nth", n, weekday, month), rule), start_year, end_year)
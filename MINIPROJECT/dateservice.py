@@ -0,0 +1,262 @@
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, datetime
+from functools import partial
+
+import numpy as np
+
+from ageengine import age_columns, calculate_age, EPOCH_ORDINAL
+from countdownengine import split_remaining, split_remaining_columns
+from dateparser import DateParser, FORMATS
+import instrumentation
+from weekdayengine import WEEKDAY_NAMES, weekday_names, weekdays_from_ordinals
+
+DEFAULT_PORT = 8765
+MAX_BODY = 512 * 1024 * 1024
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _as_of(body):
+    value = body.get("as_of")
+    return date.fromisoformat(value) if value else date.today()
+
+
+def _now(body):
+    value = body.get("now")
+    return datetime.fromisoformat(value) if value else datetime.now()
+
+
+def _dates(values, fmt=None):
+    """datetime64[D] array of ISO dates, or of dates in fmt (a dateparser format name or "auto")."""
+    if fmt is not None:
+        if fmt != "auto" and fmt not in FORMATS:
+            raise RequestError(400, f"Unknown date_format {fmt!r}")
+        parser = DateParser(None if fmt == "auto" else fmt)
+        parsed = parser.parse(values)
+        if parser.format is None and len(values):
+            raise RequestError(400, "Could not detect the date format of the batch")
+        if parsed.nulls.any():
+            rows = ", ".join(f"{row} ({text!r})" for row, text in parsed.invalid_rows[:10]) or "empty values"
+            raise RequestError(400, f"{int(parsed.nulls.sum())} invalid dates in batch, e.g. rows {rows}")
+        return parsed.days.astype("datetime64[D]")
+    try:
+        return np.array(values, dtype="datetime64[D]")
+    except (TypeError, ValueError) as e:
+        raise RequestError(400, f"Invalid date in batch: {e}")
+
+
+def age(body):
+    birth_date = date.fromisoformat(body["birth_date"])
+    as_of = _as_of(body)
+    if birth_date > as_of:
+        raise RequestError(400, "Birth date is in the future.")
+    years, months, days = calculate_age(birth_date, as_of)
+    return {"years": years, "months": months, "days": days}
+
+
+def age_batch(body):
+    years, months, days = age_columns(_dates(body["birth_dates"], body.get("date_format")), _as_of(body))
+    return {"years": years.tolist(), "months": months.tolist(), "days": days.tolist()}
+
+
+def weekday(body):
+    code = date.fromisoformat(body["date"]).weekday()
+    return {"weekday": code, "name": WEEKDAY_NAMES[code]}
+
+
+def weekday_batch(body):
+    days = _dates(body["dates"], body.get("date_format")).astype(np.int64)
+    codes = weekdays_from_ordinals(days + EPOCH_ORDINAL)
+    return {"weekday": codes.tolist(), "name": weekday_names(codes).tolist()}
+
+
+def countdown(body):
+    remaining = (datetime.fromisoformat(body["target"]) - _now(body)).total_seconds()
+    days, hours, minutes, seconds = split_remaining(remaining)
+    return {"reached": remaining <= 0, "days": days, "hours": hours, "minutes": minutes, "seconds": seconds}
+
+
+def countdown_batch(body):
+    fmt = body.get("date_format")
+    if fmt is not None:
+        # Parsed formats are dates only, so each target is midnight of its day
+        targets = _dates(body["targets"], fmt).astype("datetime64[us]")
+    else:
+        try:
+            targets = np.array(body["targets"], dtype="datetime64[us]")
+        except (TypeError, ValueError) as e:
+            raise RequestError(400, f"Invalid datetime in batch: {e}")
+    # Exact difference first, floored to seconds once, as split_remaining does for /countdown
+    remaining = (targets - np.datetime64(_now(body), "us")).astype(np.int64)
+    days, hours, minutes, seconds = split_remaining_columns(remaining // 1000000)
+    return {"reached": (remaining <= 0).tolist(), "days": days.tolist(), "hours": hours.tolist(),
+            "minutes": minutes.tolist(), "seconds": seconds.tolist()}
+
+
+# Batch handlers run in a worker thread so a large request cannot stall the event loop
+ROUTES = {
+    "/age": (age, False),
+    "/age/batch": (age_batch, True),
+    "/weekday": (weekday, False),
+    "/weekday/batch": (weekday_batch, True),
+    "/countdown": (countdown, False),
+    "/countdown/batch": (countdown_batch, True),
+}
+
+
+class DateService:
+    """Minimal HTTP/1.1 JSON server for the age, weekday and countdown calculations.
+
+    Connections are kept alive unless the client asks otherwise, and at most
+    max_concurrency requests are computed at once; further requests wait.
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, max_concurrency=64, max_body=MAX_BODY):
+        self.host = host
+        self.port = port
+        self.max_body = max_body
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        return self._server
+
+    async def serve_forever(self):
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                keep_alive = await self._handle_request(head, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, head, reader, writer):
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ", 2)
+        except ValueError:
+            self._respond(writer, 400, {"error": "Malformed request line"}, False)
+            return False
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        try:
+            length = int(headers.get("content-length", "0") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._respond(writer, 400, {"error": "Invalid Content-Length"}, False)
+            return False
+        if length > self.max_body:
+            self._respond(writer, 413, {"error": f"Body larger than {self.max_body} bytes"}, False)
+            return False
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            self._respond(writer, 411, {"error": "Chunked bodies are not supported; send Content-Length"}, False)
+            return False
+        try:
+            body = await reader.readexactly(length) if length else b""
+        except asyncio.IncompleteReadError:
+            return False  # the client closed before sending the whole body
+
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            self._respond(writer, 200, {"status": "ok"}, keep_alive)
+            return keep_alive
+        if path == "/metrics":
+            self._respond(writer, 200, instrumentation.stats(), keep_alive)
+            return keep_alive
+        route = ROUTES.get(path)
+        if route is None:
+            self._respond(writer, 404, {"error": f"Unknown endpoint {path}"}, keep_alive)
+            return keep_alive
+        if method != "POST":
+            self._respond(writer, 405, {"error": "Use POST"}, keep_alive)
+            return keep_alive
+
+        handler, blocking = route
+        started = time.perf_counter()
+        async with self._slots:
+            status, payload = await self._call(handler, body, blocking)
+        self._respond(writer, status, payload, keep_alive)
+        instrumentation.observe(path, time.perf_counter() - started)
+        return keep_alive
+
+    async def _call(self, handler, body, blocking):
+        try:
+            if blocking:
+                loop = asyncio.get_running_loop()
+                return 200, await loop.run_in_executor(None, partial(_run_handler, handler, body))
+            return 200, _run_handler(handler, body)
+        except RequestError as e:
+            return e.status, {"error": str(e)}
+        except KeyError as e:
+            return 400, {"error": f"Missing field {e}"}
+        except (ValueError, TypeError) as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": str(e)}
+
+    def _respond(self, writer, status, payload, keep_alive):
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1"))
+        writer.write(data)
+
+
+def _run_handler(handler, body):
+    payload = json.loads(body) if body else {}
+    if not isinstance(payload, dict):
+        raise RequestError(400, "Request body must be a JSON object")
+    return handler(payload)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local JSON service for age, weekday and countdown calculations.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument("--max-concurrency", type=int, default=64, help="requests computed at the same time")
+    parser.add_argument("--metrics", action="store_true", help="record per-endpoint latency, served at GET /metrics")
+    args = parser.parse_args(argv)
+    if args.metrics:
+        instrumentation.enable()
+
+    service = DateService(args.host, args.port, args.max_concurrency)
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
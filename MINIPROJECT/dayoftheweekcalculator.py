@@ -1,26 +1,43 @@
+import calendar
 import wx
 import wx.adv
 from datetime import date
-
-
-class DayOfWeekFrame(wx.Frame):
+from exportmenu import ResultExportMixin
+from exportwriter import close_writer
+from calendarindex import get_index, MAX_YEAR, MIN_YEAR
+from datepatterns import day_on_weekday, nth_weekdays, years_on_weekday
+from instrumentation import timed
+from resulthistory import get_history, TOOL_WEEKDAY
+from uifonts import get_fonts
+from weekdayengine import WEEKDAY_NAMES
+
+PATTERNS = ("Day of month on a weekday (e.g. Friday the 13th)",
+            "Date falling on a weekday, by year (e.g. 25 Dec on a Monday)",
+            "Nth weekday of each month")
+NTH_CHOICES = ("1st", "2nd", "3rd", "4th", "5th", "Last")
+PATTERN_RESULTS_SHOWN = 5000
+
+
+class DayOfWeekFrame(ResultExportMixin, wx.Frame):
     """GUI for calculating day of the week from a date."""
 
+    @timed("DayOfWeekFrame.__init__")
     def __init__(self, parent=None):
         super().__init__(parent, title="Day of the Week Calculator", size=(420, 180))
         panel = wx.Panel(self)
 
         # Menu
         menubar = wx.MenuBar()
+        file_menu = wx.Menu()
+        self._append_export_items(file_menu)
+        menubar.Append(file_menu, "&File")
         help_menu = wx.Menu()
         help_menu.Append(wx.ID_ABOUT, "&About\tF1", "About this app")
         menubar.Append(help_menu, "&Help")
         self.SetMenuBar(menubar)
         self.Bind(wx.EVT_MENU, self.on_about, id=wx.ID_ABOUT)
 
-        header_font = wx.Font(20, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
-        default_font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        button_font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        header_font, default_font, button_font = get_fonts()
 
         panel.SetBackgroundColour('#f0fff4')  # soft green
         panel.SetFont(default_font)
@@ -68,25 +85,71 @@ class DayOfWeekFrame(wx.Frame):
 
         main_sizer.Add(btn_sizer, 0, wx.ALIGN_CENTER | wx.BOTTOM, 18)
 
+        # Pattern search over a range of years
+        search = wx.StaticBoxSizer(wx.VERTICAL, panel, "Find dates")
+        box = search.GetStaticBox()
+        query_row = wx.BoxSizer(wx.HORIZONTAL)
+        self.pattern_choice = wx.Choice(box, choices=list(PATTERNS))
+        self.pattern_choice.SetSelection(0)
+        self.pattern_choice.Bind(wx.EVT_CHOICE, self.on_pattern)
+        query_row.Add(self.pattern_choice, 1, wx.RIGHT, 12)
+        self.nth_choice = wx.Choice(box, choices=list(NTH_CHOICES))
+        self.nth_choice.SetSelection(0)
+        query_row.Add(self.nth_choice, 0, wx.RIGHT, 6)
+        self.weekday_choice = wx.Choice(box, choices=list(WEEKDAY_NAMES))
+        self.weekday_choice.SetSelection(4)
+        query_row.Add(self.weekday_choice, 0, wx.RIGHT, 6)
+        self.day_spin = wx.SpinCtrl(box, min=1, max=31, initial=13)
+        query_row.Add(self.day_spin, 0, wx.RIGHT, 6)
+        self.month_choice = wx.Choice(box, choices=["Any month"] + list(calendar.month_name[1:]))
+        self.month_choice.SetSelection(0)
+        query_row.Add(self.month_choice, 0)
+        search.Add(query_row, 0, wx.ALL | wx.EXPAND, 8)
+
+        range_row = wx.BoxSizer(wx.HORIZONTAL)
+        range_row.Add(wx.StaticText(box, label="From year:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
+        self.from_year = wx.SpinCtrl(box, min=MIN_YEAR, max=MAX_YEAR, initial=today.year)
+        range_row.Add(self.from_year, 0, wx.RIGHT, 12)
+        range_row.Add(wx.StaticText(box, label="To year:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
+        self.to_year = wx.SpinCtrl(box, min=MIN_YEAR, max=MAX_YEAR, initial=today.year + 10)
+        range_row.Add(self.to_year, 0, wx.RIGHT, 12)
+        find_btn = wx.Button(box, label="Find")
+        find_btn.SetFont(button_font)
+        find_btn.Bind(wx.EVT_BUTTON, self.on_find)
+        range_row.Add(find_btn, 0)
+        search.Add(range_row, 0, wx.ALL, 8)
+
+        self.matches_ctrl = wx.TextCtrl(box, style=wx.TE_MULTILINE | wx.TE_READONLY, size=(-1, 160))
+        search.Add(self.matches_ctrl, 1, wx.ALL | wx.EXPAND, 8)
+        main_sizer.Add(search, 1, wx.LEFT | wx.RIGHT | wx.EXPAND, 20)
+
         self.result_text = wx.StaticText(panel, label="")
         self.result_text.SetFont(header_font)
         self.result_text.SetForegroundColour('#0b6b3a')
         main_sizer.Add(self.result_text, 0, wx.ALIGN_CENTER | wx.ALL, 20)
 
         panel.SetSizer(main_sizer)
+        self.on_pattern(None)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
         self.Maximize(True)  # fill the screen
 
     def on_about(self, event):
         wx.MessageBox("Select a date and press 'Get Day' to find the day of the week.", "About", wx.ICON_INFORMATION)
 
+    def on_close(self, event):
+        self._close_result_log()
+        event.Skip()
+
     def on_clear(self, event):
         today = date.today()
         default_dt = wx.DateTime.FromDMY(today.day, today.month - 1, today.year)
         self.datepicker.SetValue(default_dt)
         self.result_text.SetLabel("")
+        self.matches_ctrl.SetValue("")
         self.copy_btn.Enable(False)
         self.save_btn.Enable(False)
 
+    @timed("DayOfWeekFrame.on_calculate")
     def on_calculate(self, event):
         dt = self.datepicker.GetValue()
         d = dt.GetDay()
@@ -94,18 +157,70 @@ class DayOfWeekFrame(wx.Frame):
         y = dt.GetYear()
 
         try:
-            weekday = date(y, m, d).strftime("%A")
+            code = get_index().weekday(y, m, d)
+            weekday = WEEKDAY_NAMES[code]
         except Exception:
             wx.MessageBox("Invalid date selected.", "Error", wx.ICON_ERROR)
             return
 
+        get_history().record(TOOL_WEEKDAY, (get_index().to_ordinal(y, m, d),), (code,))
         result = f"Day of the week is: {weekday}"
         self.result_text.SetLabel(result)
+        self.matches_ctrl.SetValue("")
+        self._log_result(result)
         self.copy_btn.Enable(True)
         self.save_btn.Enable(True)
 
-    def on_copy(self, event):
+    def on_pattern(self, event):
+        kind = self.pattern_choice.GetSelection()
+        self.nth_choice.Show(kind == 2)
+        self.day_spin.Show(kind != 2)
+        self.nth_choice.GetContainingSizer().Layout()
+
+    @timed("DayOfWeekFrame.on_find")
+    def on_find(self, event):
+        kind = self.pattern_choice.GetSelection()
+        weekday = self.weekday_choice.GetSelection()
+        month = self.month_choice.GetSelection() or None
+        start, end = self.from_year.GetValue(), self.to_year.GetValue()
+        if start > end:
+            wx.MessageBox("The start year must not be after the end year.", "Invalid", wx.ICON_ERROR)
+            return
+        name = WEEKDAY_NAMES[weekday]
+        if kind == 0:
+            day = self.day_spin.GetValue()
+            matches = [f"{d:%Y-%m-%d}" for d in day_on_weekday(day, weekday, start, end, month)]
+            what = f"{name} the {day}{_suffix(day)}" + (f" in {calendar.month_name[month]}" if month else "")
+        elif kind == 1:
+            if month is None:
+                wx.MessageBox("Pick a month for this search.", "Invalid", wx.ICON_ERROR)
+                return
+            day = self.day_spin.GetValue()
+            matches = [str(y) for y in years_on_weekday(month, day, weekday, start, end)]
+            what = f"years where {day} {calendar.month_name[month]} is a {name}"
+        else:
+            nth = self.nth_choice.GetSelection()
+            n = -1 if nth == len(NTH_CHOICES) - 1 else nth + 1
+            matches = [f"{d:%Y-%m-%d}" for d in nth_weekdays(n, weekday, start, end, month)]
+            what = f"{NTH_CHOICES[nth].lower()} {name} of " + (calendar.month_name[month] if month else "each month")
+        result = f"{len(matches)} {what}, {start}-{end}"
+        self.result_text.SetLabel(result)
+        shown = matches[:PATTERN_RESULTS_SHOWN]
+        if len(matches) > len(shown):
+            shown.append(f"... and {len(matches) - len(shown)} more")
+        self.matches_ctrl.SetValue("\n".join(shown))
+        self._log_result(result)
+        self.copy_btn.Enable(True)
+        self.save_btn.Enable(True)
+
+    def _result_text(self):
+        """The result label, followed by the listed matches of the last search if any."""
         text = self.result_text.GetLabel()
+        matches = self.matches_ctrl.GetValue()
+        return f"{text}\n{matches}" if text and matches else text
+
+    def on_copy(self, event):
+        text = self._result_text()
         if not text:
             return
         if wx.TheClipboard.Open():
@@ -115,20 +230,11 @@ class DayOfWeekFrame(wx.Frame):
         else:
             wx.MessageBox("Could not open the clipboard.", "Error", wx.ICON_ERROR)
 
-    def on_save(self, event):
-        text = self.result_text.GetLabel()
-        if not text:
-            return
-        with wx.FileDialog(self, "Save result", wildcard="Text files (*.txt)|*.txt", style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dlg:
-            if dlg.ShowModal() == wx.ID_CANCEL:
-                return
-            path = dlg.GetPath()
-            try:
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(text + "\n")
-                wx.MessageBox(f"Result saved to: {path}", "Saved", wx.ICON_INFORMATION)
-            except Exception as e:
-                wx.MessageBox(f"Failed to save file: {e}", "Error", wx.ICON_ERROR)
+
+def _suffix(day):
+    if 10 <= day % 100 <= 20:
+        return "th"
+    return {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
 
 
 if __name__ == "__main__":
@@ -140,4 +246,5 @@ if __name__ == "__main__":
 
     frame = DayOfWeekFrame()
     frame.Show()
-    app.MainLoop()
\ No newline at end of file
+    app.MainLoop()
+    close_writer()
\ No newline at end of file
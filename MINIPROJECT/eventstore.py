@@ -0,0 +1,127 @@
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".minitools_countdowns.db")
+# Only upcoming events are listed, so reached ones are pruned this long after their deadline
+KEEP_REACHED_SECONDS = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    deadline REAL NOT NULL,
+    created REAL NOT NULL
+);
+-- (deadline, name) serves the deadline range scans and the duplicate check of add_missing
+CREATE INDEX IF NOT EXISTS events_deadline_name ON events (deadline, name);
+"""
+
+
+def _timestamp(value):
+    return value.timestamp() if isinstance(value, datetime) else float(value)
+
+
+class StoredEvent:
+    __slots__ = ("event_id", "name", "deadline")
+
+    def __init__(self, event_id, name, deadline):
+        self.event_id = event_id
+        self.name = name
+        self.deadline = deadline  # epoch seconds
+
+    @property
+    def target(self):
+        return datetime.fromtimestamp(self.deadline)
+
+    def __repr__(self):
+        return f"StoredEvent({self.event_id}, {self.name!r}, {self.target.isoformat(sep=' ')})"
+
+
+class EventStore:
+    """Named countdown events kept in SQLite (WAL mode) and indexed by deadline.
+
+    Deadlines are stored as epoch seconds, so "next N due" and "due in a
+    window" are range scans on the deadline index and cost O(log n + results)
+    regardless of how many events are stored.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def add(self, name, deadline):
+        """Store an event; deadline is a datetime or epoch seconds. Returns its id."""
+        with self.conn:
+            cur = self.conn.execute("INSERT INTO events (name, deadline, created) VALUES (?, ?, ?)",
+                                    (name, _timestamp(deadline), time.time()))
+        return cur.lastrowid
+
+    def add_many(self, events):
+        """Store many (name, deadline) pairs in one transaction."""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany("INSERT INTO events (name, deadline, created) VALUES (?, ?, ?)",
+                                  ((name, _timestamp(deadline), now) for name, deadline in events))
+
+    def add_missing(self, events):
+        """Store the (name, deadline) pairs not already stored with that name and deadline, in one transaction.
+
+        Returns how many were added, so importing the same events twice adds nothing the second time.
+        """
+        now = time.time()
+        rows = ((name, deadline, now, deadline, name)
+                for name, deadline in ((name, _timestamp(deadline)) for name, deadline in events))
+        with self.conn:
+            return self.conn.executemany(
+                "INSERT INTO events (name, deadline, created) SELECT ?, ?, ? "
+                "WHERE NOT EXISTS (SELECT 1 FROM events WHERE deadline = ? AND name = ?)", rows).rowcount
+
+    def remove(self, event_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+
+    def get(self, event_id):
+        row = self.conn.execute("SELECT id, name, deadline FROM events WHERE id = ?", (event_id,)).fetchone()
+        return StoredEvent(*row) if row else None
+
+    def next_due(self, limit, after=None):
+        """The limit events with the earliest deadlines after the given time (default: now)."""
+        after = time.time() if after is None else _timestamp(after)
+        rows = self.conn.execute(
+            "SELECT id, name, deadline FROM events WHERE deadline > ? ORDER BY deadline LIMIT ?", (after, limit))
+        return [StoredEvent(*row) for row in rows]
+
+    def due_between(self, start, end):
+        """Events with start <= deadline < end, earliest first."""
+        rows = self.conn.execute(
+            "SELECT id, name, deadline FROM events WHERE deadline >= ? AND deadline < ? ORDER BY deadline",
+            (_timestamp(start), _timestamp(end)))
+        return [StoredEvent(*row) for row in rows]
+
+    def remove_before(self, cutoff):
+        """Delete events whose deadline is before cutoff. Returns how many were removed."""
+        with self.conn:
+            return self.conn.execute("DELETE FROM events WHERE deadline < ?", (_timestamp(cutoff),)).rowcount
+
+
+_shared = None
+
+
+def get_store(path=DEFAULT_PATH):
+    """Return the process-wide EventStore, opening it and pruning reached events on first use."""
+    global _shared
+    if _shared is None:
+        _shared = EventStore(path)
+        _shared.remove_before(time.time() - KEEP_REACHED_SECONDS)
+    return _shared
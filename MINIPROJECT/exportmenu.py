@@ -0,0 +1,88 @@
+import queue
+
+import wx
+
+from exportwriter import get_writer
+from resulthistory import get_history, records_to_csv
+
+
+class ResultExportMixin:
+    """Save, Log Results to File and Export History for a tool window.
+
+    All file writes go through the shared BackgroundWriter; outcomes are
+    reported back on the UI thread. A frame calls _append_export_items while
+    building its File menu, _close_result_log when it closes, and may
+    override _result_text for what Save writes.
+    """
+
+    def _append_export_items(self, file_menu):
+        self.result_log = None
+        self.log_item = file_menu.AppendCheckItem(wx.ID_ANY, "&Log Results to File...\tCtrl+L", "Append every result to one file")
+        self.Bind(wx.EVT_MENU, self.on_log_results, self.log_item)
+        history_item = file_menu.Append(wx.ID_ANY, "Export &History...", "Save recent results of all tools as CSV")
+        self.Bind(wx.EVT_MENU, self.on_export_history, history_item)
+
+    def _result_text(self):
+        return self.result_text.GetLabel()
+
+    def on_save(self, event):
+        text = self._result_text()
+        if not text:
+            return
+        with wx.FileDialog(self, "Save result", wildcard="Text files (*.txt)|*.txt", style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dlg:
+            if dlg.ShowModal() == wx.ID_CANCEL:
+                return
+            path = dlg.GetPath()
+        get_writer(wx.CallAfter).write(
+            path, text + "\n",
+            on_done=lambda p: wx.MessageBox(f"Result saved to: {p}", "Saved", wx.ICON_INFORMATION),
+            on_error=lambda e: wx.MessageBox(f"Failed to save file: {e}", "Error", wx.ICON_ERROR),
+        )
+
+    def on_log_results(self, event):
+        if self.result_log is not None:
+            self._close_result_log()
+            return
+        with wx.FileDialog(self, "Log results to", wildcard="Text files (*.txt)|*.txt", style=wx.FD_SAVE) as dlg:
+            if dlg.ShowModal() == wx.ID_CANCEL:
+                self.log_item.Check(False)
+                return
+            path = dlg.GetPath()
+        stream = get_writer(wx.CallAfter).open_stream(path, on_error=lambda e: self._on_log_error(stream, e))
+        self.result_log = stream
+
+    def _on_log_error(self, stream, error):
+        """The writer has dropped stream; turn logging off so the menu matches."""
+        if self and self.result_log is stream:
+            self.result_log = None
+            self.log_item.Check(False)
+        wx.MessageBox(f"Failed to log results: {error}", "Error", wx.ICON_ERROR)
+
+    def on_export_history(self, event):
+        # Snapshot now; formatting and writing happen on the export thread
+        records = list(get_history().query())[::-1]
+        if not records:
+            wx.MessageBox("No results have been recorded yet.", "History", wx.ICON_INFORMATION)
+            return
+        with wx.FileDialog(self, "Export history", wildcard="CSV files (*.csv)|*.csv", style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dlg:
+            if dlg.ShowModal() == wx.ID_CANCEL:
+                return
+            path = dlg.GetPath()
+        get_writer(wx.CallAfter).write(
+            path, lambda: records_to_csv(records),
+            on_done=lambda p: wx.MessageBox(f"{len(records)} results exported to: {p}", "Exported", wx.ICON_INFORMATION),
+            on_error=lambda e: wx.MessageBox(f"Failed to export history: {e}", "Error", wx.ICON_ERROR),
+        )
+
+    def _log_result(self, text):
+        if self.result_log is None:
+            return
+        try:
+            self.result_log.write(text + "\n")
+        except queue.Full:
+            wx.MessageBox("The result log is falling behind; this result was not logged.", "Log", wx.ICON_WARNING)
+
+    def _close_result_log(self):
+        if self.result_log is not None:
+            self.result_log.close()
+            self.result_log = None
@@ -0,0 +1,204 @@
+import itertools
+import queue
+import sys
+import threading
+
+DEFAULT_MAX_PENDING = 4096
+DEFAULT_CLOSE_TIMEOUT = 10.0
+_BATCH = 512
+
+
+def _call_now(func, *args):
+    func(*args)
+
+
+class ExportStream:
+    """Handle for appending many results to one file through a BackgroundWriter."""
+
+    def __init__(self, writer, stream_id, path):
+        self.writer = writer
+        self.stream_id = stream_id
+        self.path = path
+        self.closed = False
+
+    def write(self, text, block=False):
+        """Queue text for the file; with block=False a full queue raises queue.Full instead of waiting."""
+        self.writer._put(("line", self.stream_id, text), block)
+
+    def close(self, on_done=None, on_error=None):
+        if not self.closed:
+            self.closed = True
+            self.writer._put(("close", self.stream_id, on_done, on_error), True)
+
+
+class BackgroundWriter:
+    """Writes text files on a worker thread so a slow disk or network share never blocks the UI.
+
+    Work goes through a bounded queue. The worker drains up to a batch of
+    queued jobs at a time, joins consecutive lines for the same stream into a
+    single write and keeps only the last whole-file write per path. on_done
+    and on_error callbacks are passed to dispatch (e.g. wx.CallAfter) so they
+    run on the UI thread. A stream that fails is reported to its on_error
+    and dropped; the other streams and files carry on.
+    """
+
+    def __init__(self, max_pending=DEFAULT_MAX_PENDING, dispatch=None):
+        self._queue = queue.Queue(max_pending)
+        self._dispatch = dispatch or _call_now
+        self._files = {}
+        self._ids = itertools.count(1)
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="export-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, path, text, on_done=None, on_error=None):
+        """Replace the contents of path with text in the background. on_done(path) or on_error(exc) follows.
+
+        text may also be a callable returning the text, so large exports are formatted off the UI thread too.
+        """
+        try:
+            self._put(("write", path, text, on_done, on_error), False)
+        except queue.Full:
+            if on_error:
+                self._dispatch(on_error, RuntimeError("Too many exports are pending; try again shortly."))
+
+    def open_stream(self, path, append=True, on_error=None):
+        stream = ExportStream(self, next(self._ids), path)
+        self._put(("open", stream.stream_id, path, "a" if append else "w", on_error), True)
+        return stream
+
+    def join(self):
+        """Wait until everything queued so far has been written."""
+        self._queue.join()
+
+    def close(self, timeout=DEFAULT_CLOSE_TIMEOUT):
+        """Write everything queued so far, close the open streams and stop the worker thread.
+
+        Call on exit: the worker is a daemon thread, so queued work would otherwise be lost.
+        """
+        if self._thread.is_alive():
+            self._put(("stop",), True)
+            self._thread.join(timeout)
+
+    def _put(self, job, block):
+        if block:
+            self._queue.put(job)
+        else:
+            self._queue.put_nowait(job)
+
+    def _run(self):
+        while not self._stopping:
+            jobs = [self._queue.get()]
+            try:
+                while len(jobs) < _BATCH:
+                    jobs.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                self._process(jobs)
+            except Exception as e:
+                # Errors are normally routed to on_error; never let one stop the writer for every tool
+                print(f"Export writer error: {e!r}", file=sys.stderr)
+            finally:
+                for _ in jobs:
+                    self._queue.task_done()
+        for stream_id in list(self._files):
+            self._close_stream(stream_id, None, self._files[stream_id][1])
+
+    def _notify(self, callback, arg):
+        if callback:
+            self._dispatch(callback, arg)
+
+    def _process(self, jobs):
+        pending_lines = {}
+        last_write = {}
+        for job in jobs:
+            if job[0] == "write":
+                last_write[job[1]] = job
+        for job in jobs:
+            kind = job[0]
+            if kind == "line":
+                pending_lines.setdefault(job[1], []).append(job[2])
+            elif kind == "write":
+                _, path, text, on_done, on_error = job
+                if last_write[path] is job:
+                    self._write_file(path, text, on_done, on_error)
+                else:
+                    self._notify(on_done, path)  # superseded by a later write in this batch
+            elif kind == "open":
+                _, stream_id, path, mode, on_error = job
+                try:
+                    self._files[stream_id] = (open(path, mode, encoding="utf-8"), on_error)
+                except Exception as e:
+                    self._notify(on_error, e)
+            elif kind == "close":
+                self._flush_lines(pending_lines, job[1])
+                self._close_stream(*job[1:])
+            elif kind == "stop":
+                self._stopping = True
+        for stream_id in list(pending_lines):
+            self._flush_lines(pending_lines, stream_id)
+        for stream_id, (f, on_error) in list(self._files.items()):
+            try:
+                f.flush()
+            except Exception as e:
+                self._drop_stream(stream_id, e)
+
+    def _write_file(self, path, text, on_done, on_error):
+        try:
+            if callable(text):
+                text = text()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        except Exception as e:
+            self._notify(on_error, e)
+            return
+        self._notify(on_done, path)
+
+    def _flush_lines(self, pending_lines, stream_id):
+        lines = pending_lines.pop(stream_id, None)
+        entry = self._files.get(stream_id)
+        if not lines or entry is None:
+            return
+        try:
+            entry[0].write("".join(lines))
+        except Exception as e:
+            self._drop_stream(stream_id, e)
+
+    def _drop_stream(self, stream_id, error):
+        """Report a failed stream to its on_error and stop writing to it."""
+        f, on_error = self._files.pop(stream_id)
+        self._notify(on_error, error)
+        try:
+            f.close()
+        except Exception:
+            pass  # buffered data that could not be written is already reported
+
+    def _close_stream(self, stream_id, on_done, on_error):
+        entry = self._files.pop(stream_id, None)
+        if entry is None:
+            return
+        f = entry[0]
+        try:
+            f.close()
+        except Exception as e:
+            self._notify(on_error, e)
+            return
+        self._notify(on_done, f.name)
+
+
+_shared = None
+
+
+def get_writer(dispatch=None):
+    """Return the process-wide BackgroundWriter, starting it on first use."""
+    global _shared
+    if _shared is None:
+        _shared = BackgroundWriter(dispatch=dispatch)
+    return _shared
+
+
+def close_writer():
+    """Finish and stop the process-wide BackgroundWriter, if one was started. Call before the app exits."""
+    if _shared is not None:
+        _shared.close()
@@ -0,0 +1,418 @@
+import argparse
+import time
+from collections import Counter, namedtuple
+from datetime import date, datetime, timedelta
+
+from ageengine import EPOCH_ORDINAL
+from calendarindex import get_index, MAX_YEAR
+from eventstore import DEFAULT_PATH, get_store
+from zonedcountdown import DAY, local_seconds, to_epoch, zone_table
+
+DEFAULT_HORIZON_DAYS = 365
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+# RRULE parts expanded here; an event whose rule uses any other part is skipped
+RRULE_PARTS = {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "BYMONTHDAY", "BYMONTH", "BYSETPOS", "WKST"}
+# Properties kept from each VEVENT; everything else (descriptions, attendees, alarms) is dropped as it is read
+EVENT_PROPERTIES = {"UID", "SUMMARY", "DTSTART", "RRULE", "RDATE", "EXDATE", "RECURRENCE-ID", "STATUS"}
+
+IcsImport = namedtuple("IcsImport", "events added skipped")
+
+
+def _content_lines(f):
+    """Unfolded content lines of an iCalendar file (continuation lines start with a space or tab)."""
+    parts = None
+    for raw in f:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if parts is not None:
+                parts.append(line[1:])
+            continue
+        if parts:
+            yield "".join(parts)
+        parts = [line] if line else None
+    if parts:
+        yield "".join(parts)
+
+
+def _split_property(line):
+    """(NAME, {PARAM: value}, value) of a content line such as DTSTART;TZID=Europe/Paris:20260105T090000."""
+    end = line.find(":")
+    if '"' in line[:end]:  # quoted parameter values may contain ":"
+        quoted = False
+        for end, c in enumerate(line):
+            if c == '"':
+                quoted = not quoted
+            elif c == ":" and not quoted:
+                break
+    head, value = line[:end], line[end + 1:]
+    name, *params = head.split(";")
+    return name.upper(), {k.upper(): v.strip('"') for k, _, v in (p.partition("=") for p in params)}, value
+
+
+def iter_vevents(f, names=EVENT_PROPERTIES):
+    """Yield the properties of each VEVENT in an open .ics file as {NAME: [(params, value), ...]}.
+
+    The file is consumed line by line and only the named properties of the
+    event being read are held, so memory does not grow with the file.
+    """
+    props = None
+    nested = 0  # depth of components inside the VEVENT, such as VALARM
+    for line in _content_lines(f):
+        name = line.partition(":")[0].partition(";")[0].upper()
+        if props is None:
+            if name == "BEGIN" and line[6:].strip().upper() == "VEVENT":
+                props = {}
+            continue
+        if name == "BEGIN":
+            nested += 1
+        elif name == "END":
+            if nested:
+                nested -= 1
+            else:
+                yield props
+                props = None
+        elif not nested and name in names:
+            name, params, value = _split_property(line)
+            props.setdefault(name, []).append((params, value))
+
+
+def _unescape(text):
+    return text.replace("\\n", " ").replace("\\N", " ").replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+
+
+_zones = {"UTC": "UTC"}
+
+
+def _zone(tzid):
+    """tzid if zoneinfo knows it, otherwise None (the local zone); exports often carry Windows zone names."""
+    if tzid not in _zones:
+        try:
+            zone_table(tzid)
+            _zones[tzid] = tzid
+        except Exception:
+            _zones[tzid] = None
+    return _zones[tzid]
+
+
+def _epoch(wall, zone):
+    return local_seconds(wall) if zone == "UTC" else to_epoch(wall, zone)
+
+
+def parse_time(params, value):
+    """(naive wall datetime, zone or None for local time, all-day flag) of a DATE or DATE-TIME value."""
+    value = value.strip()
+    if params.get("VALUE", "").upper() == "DATE" or len(value) == 8:
+        return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8])), None, True
+    if len(value) < 15 or value[8] != "T":
+        raise ValueError(f"Invalid date-time {value!r}")
+    wall = datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                    int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    if value.endswith("Z"):
+        return wall, "UTC", False
+    return wall, _zone(params["TZID"]) if "TZID" in params else None, False
+
+
+def _epochs(values):
+    """Epoch seconds of every comma-separated value of RDATE/EXDATE properties."""
+    result = []
+    for params, value in values:
+        for item in value.split(","):
+            wall, zone, _ = parse_time(params, item)
+            result.append(_epoch(wall, zone))
+    return result
+
+
+def parse_rrule(value):
+    """An RRULE value as a dict of its parts, rejecting parts that are not expanded here."""
+    rule = {}
+    for part in value.strip().split(";"):
+        key, _, item = part.partition("=")
+        rule[key.upper()] = item.upper()
+    unsupported = set(rule) - RRULE_PARTS
+    if unsupported:
+        raise ValueError(f"Unsupported RRULE parts: {', '.join(sorted(unsupported))}")
+    if rule.get("FREQ") not in FREQUENCIES:
+        raise ValueError(f"Unsupported RRULE frequency {rule.get('FREQ')!r}")
+    return rule
+
+
+class IcsEvent:
+    """One VEVENT: its first start as a wall-clock time in its zone, and how it repeats."""
+
+    __slots__ = ("uid", "name", "start", "zone", "recurrence", "rdates", "exdates", "recurrence_id", "cancelled")
+
+    def __init__(self, props):
+        def first(name):
+            values = props.get(name)
+            return values[0] if values else None
+
+        if first("DTSTART") is None:
+            raise ValueError("VEVENT without DTSTART")
+        self.uid = first("UID")[1] if first("UID") else None
+        self.name = _unescape(first("SUMMARY")[1]).strip() if first("SUMMARY") else ""
+        self.name = self.name or "Untitled event"
+        self.start, self.zone, _ = parse_time(*first("DTSTART"))
+        self.recurrence = Recurrence(parse_rrule(first("RRULE")[1]), self.start, self.zone) if first("RRULE") else None
+        self.rdates = sorted(_epochs(props.get("RDATE", ())))
+        self.exdates = set(_epochs(props.get("EXDATE", ())))
+        rid = first("RECURRENCE-ID")
+        self.recurrence_id = _epoch(*parse_time(*rid)[:2]) if rid else None
+        self.cancelled = first("STATUS") is not None and first("STATUS")[1].strip().upper() == "CANCELLED"
+
+    def occurrences(self, after, before, skip=()):
+        """Epoch seconds of the occurrences with after <= t < before, earliest first.
+
+        skip holds occurrence times replaced by RECURRENCE-ID overrides.
+        """
+        if self.recurrence is None:
+            times = [_epoch(self.start, self.zone)]
+        else:
+            times = self.recurrence.times(after, before)
+        if self.rdates:
+            times = sorted(set(self.rdates).union(t for t in times if t < before))
+        for t in times:
+            if t >= before:
+                return
+            if t >= after and t not in self.exdates and t not in skip:
+                yield t
+
+
+def _byday(rule):
+    """BYDAY as (n or None, weekday) pairs, e.g. "1MO,-1FR" -> [(1, 0), (-1, 4)]."""
+    result = []
+    for item in rule.get("BYDAY", "").split(","):
+        if item:
+            n = item[:-2]
+            result.append((int(n) if n not in ("", "+") else None, WEEKDAY_CODES.index(item[-2:])))
+    return result
+
+
+def _ints(rule, key):
+    return [int(v) for v in rule[key].split(",")] if key in rule else []
+
+
+def _weekday_days(first_weekday, length, byday):
+    """Days 1..length matching BYDAY, for a span of length days starting on first_weekday."""
+    days = []
+    for n, weekday in byday:
+        matches = range(1 + (weekday - first_weekday) % 7, length + 1, 7)
+        if n is None:
+            days.extend(matches)
+        elif -len(matches) <= n <= len(matches) and n:
+            days.append(matches[n - 1 if n > 0 else n])
+    return days
+
+
+def _month_days(year, month, monthdays, byday, default_day):
+    """Ordinals of the matching days of one month."""
+    index = get_index()
+    length = index.days_in_month(year, month)
+    days = None
+    if monthdays:
+        days = {d if d > 0 else length + 1 + d for d in monthdays}
+    if byday:
+        matched = set(_weekday_days(index.weekday(year, month, 1), length, byday))
+        days = matched if days is None else days & matched
+    if days is None:
+        days = {default_day}
+    first = index.to_ordinal(year, month, 1)
+    return [first + d - 1 for d in sorted(days) if 1 <= d <= length]
+
+
+class Recurrence:
+    """An RRULE bound to its DTSTART, expanded lazily one period (day, week, month or year) at a time.
+
+    times() only produces occurrences up to the end of the requested window,
+    and starts at the period holding the window start. With COUNT the
+    earlier occurrences must be counted: when every period has the same
+    number of them (plain daily or weekly rules) that is arithmetic,
+    otherwise the earlier periods are walked without converting their days
+    to epoch seconds.
+    """
+
+    def __init__(self, rule, start, zone):
+        self.freq = rule["FREQ"]
+        self.interval = int(rule.get("INTERVAL", 1))
+        self.count = int(rule["COUNT"]) if "COUNT" in rule else None
+        self.months = set(_ints(rule, "BYMONTH"))
+        self.monthdays = _ints(rule, "BYMONTHDAY")
+        self.byday = _byday(rule)
+        self.positions = _ints(rule, "BYSETPOS")
+        self.wkst = WEEKDAY_CODES.index(rule.get("WKST", "MO"))
+        self.start = start
+        self.zone = zone
+        # Occurrences in every period after the first, when that does not depend on the period
+        self.per_period = None
+        if not self.months and not self.positions:
+            if self.freq == "DAILY" and not self.byday and not self.monthdays:
+                self.per_period = 1
+            elif self.freq == "WEEKLY":
+                self.per_period = len({w for _, w in self.byday} or {start.weekday()})
+        self.until = None
+        if "UNTIL" in rule:
+            wall, until_zone, all_day = parse_time({}, rule["UNTIL"])
+            # A date-only UNTIL includes the whole day; a floating one is in the event's zone
+            if all_day:
+                self.until = _epoch(wall + timedelta(days=1), zone) - 1
+            else:
+                self.until = _epoch(wall, until_zone or zone)
+
+    def period(self, k):
+        """Ordinal of the first day of period k and the ordinals of the matching days in it, or (None, [])."""
+        start = self.start
+        index = get_index()
+        if self.freq == "DAILY":
+            first = start.toordinal() + k * self.interval
+            days = [first]
+            if self.byday and (first - 1) % 7 not in {w for _, w in self.byday}:
+                days = []
+            if self.monthdays and days:
+                d = date.fromordinal(first)
+                length = index.days_in_month(d.year, d.month)
+                if d.day not in {m if m > 0 else length + 1 + m for m in self.monthdays}:
+                    days = []
+        elif self.freq == "WEEKLY":
+            first = start.toordinal() - (start.weekday() - self.wkst) % 7 + 7 * k * self.interval
+            weekdays = {w for _, w in self.byday} or {start.weekday()}
+            days = sorted(first + (w - self.wkst) % 7 for w in weekdays)
+        elif self.freq == "MONTHLY":
+            i = (start.year - 1) * 12 + start.month - 1 + k * self.interval
+            year, month = i // 12 + 1, i % 12 + 1
+            if year > MAX_YEAR:
+                return None, []
+            first = index.to_ordinal(year, month, 1)
+            days = _month_days(year, month, self.monthdays, self.byday, start.day)
+        else:
+            year = start.year + k * self.interval
+            if year > MAX_YEAR:
+                return None, []
+            first = index.to_ordinal(year, 1, 1)
+            if self.byday and not self.months and not self.monthdays:  # e.g. the 20th Monday of the year
+                length = 366 if index.is_leap(year) else 365
+                days = [first + d - 1 for d in sorted(_weekday_days(index.weekday(year, 1, 1), length, self.byday))]
+            else:
+                days = []
+                months = sorted(self.months) or (range(1, 13) if self.byday or self.monthdays else [start.month])
+                for month in months:
+                    days.extend(_month_days(year, month, self.monthdays, self.byday, start.day))
+        if self.months and self.freq != "YEARLY":
+            days = [o for o in days if date.fromordinal(o).month in self.months]
+        if self.positions and days:
+            n = len(days)
+            days = sorted({days[p - 1 if p > 0 else p] for p in self.positions if p and -n <= p <= n})
+        return first, days
+
+    def first_period(self, ordinal):
+        """Index of a period starting on or before ordinal."""
+        start = self.start
+        if self.freq == "DAILY":
+            k = (ordinal - start.toordinal()) // self.interval
+        elif self.freq == "WEEKLY":
+            k = (ordinal - start.toordinal()) // (7 * self.interval)
+        elif self.freq == "MONTHLY":
+            d = date.fromordinal(ordinal)
+            k = ((d.year - start.year) * 12 + d.month - start.month) // self.interval
+        else:
+            k = (date.fromordinal(ordinal).year - start.year) // self.interval
+        return max(0, k - 1)
+
+    def times(self, after, before):
+        """Occurrence times in order, from the first one that may fall at or after after, until before."""
+        start_ordinal = self.start.toordinal()
+        # Zone offsets stay within a day, so two days of slack keep the day-level bounds safe
+        last_ordinal = EPOCH_ORDINAL + int(before // DAY) + 2
+        early_ordinal = EPOCH_ORDINAL + int(after // DAY) - 2
+        if self.until is not None:
+            early_ordinal = min(early_ordinal, EPOCH_ORDINAL + int(self.until // DAY) - 2)
+        count = self.count
+        k = emitted = 0
+        if count is None or self.per_period is not None:
+            k = self.first_period(max(start_ordinal, early_ordinal))
+            if count is not None and k:
+                emitted = sum(o >= start_ordinal for o in self.period(0)[1]) + (k - 1) * self.per_period
+        while True:
+            first, days = self.period(k)
+            if first is None or first > last_ordinal:
+                return
+            for ordinal in days:
+                if ordinal < start_ordinal:
+                    continue
+                emitted += 1
+                if count is not None and emitted > count:
+                    return
+                if ordinal < early_ordinal:
+                    continue  # before the window and before UNTIL: only counted
+                t = _epoch(datetime.combine(date.fromordinal(ordinal), self.start.time()), self.zone)
+                if self.until is not None and t > self.until:
+                    return
+                yield t
+            k += 1
+
+
+def _overrides(path):
+    """UID -> occurrence times replaced by a RECURRENCE-ID override in the file."""
+    with open(path, encoding="utf-8-sig", errors="replace") as f:
+        result = {}
+        for props in iter_vevents(f, {"UID", "RECURRENCE-ID"}):
+            try:
+                rid = props["RECURRENCE-ID"][0]
+                result.setdefault(props["UID"][0][1], set()).add(_epoch(*parse_time(*rid)[:2]))
+            except (KeyError, ValueError):
+                pass
+        return result
+
+
+def _countdowns(path, after, before, overrides, stats):
+    """(name, deadline) of every occurrence in [after, before), streamed from the file."""
+    with open(path, encoding="utf-8-sig", errors="replace") as f:
+        for props in iter_vevents(f):
+            stats["events"] += 1
+            try:
+                event = IcsEvent(props)
+            except Exception:
+                stats["skipped"] += 1
+                continue
+            if event.cancelled:
+                continue
+            skip = overrides.get(event.uid, ()) if event.recurrence_id is None else ()
+            try:
+                # Expanded before yielding so a rule that fails part way adds none of its occurrences
+                times = list(event.occurrences(after, before, skip))
+            except Exception:
+                stats["skipped"] += 1
+                continue
+            for t in times:
+                yield event.name, t
+
+
+def import_ics(path, store=None, horizon_days=DEFAULT_HORIZON_DAYS, now=None):
+    """Add every occurrence in the .ics file at path between now and horizon_days ahead to the event store.
+
+    The file is streamed twice: once for the RECURRENCE-ID overrides, which
+    replace single occurrences of a series, and once to expand the events.
+    Occurrences already stored under the same name and time are not added
+    again. Returns IcsImport(events read, countdowns added, events skipped).
+    """
+    store = get_store() if store is None else store
+    now = time.time() if now is None else now
+    overrides = _overrides(path)
+    stats = Counter()
+    added = store.add_missing(_countdowns(path, now, now + horizon_days * DAY, overrides, stats))
+    return IcsImport(stats["events"], added, stats["skipped"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import the upcoming events of an iCalendar (.ics) file as countdowns.")
+    parser.add_argument("input", help=".ics file")
+    parser.add_argument("--days", type=int, default=DEFAULT_HORIZON_DAYS,
+                        help=f"import occurrences up to this many days ahead (default: {DEFAULT_HORIZON_DAYS})")
+    parser.add_argument("--db", default=DEFAULT_PATH, help=f"event store (default: {DEFAULT_PATH})")
+    args = parser.parse_args(argv)
+
+    result = import_ics(args.input, get_store(args.db), args.days)
+    print(f"Added {result.added} countdowns from {result.events} events ({result.skipped} skipped).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENV_VAR = "MINITOOLS_METRICS"
+DEFAULT_METRICS_PORT = 8766
+_BUCKETS = 40  # bucket i counts durations in [2**(i-1), 2**i) microseconds
+
+_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+_histograms = {}
+_lock = threading.Lock()
+
+
+def enabled():
+    return _enabled
+
+
+def enable():
+    """Turn instrumentation on. Functions decorated with @timed before this call stay uninstrumented."""
+    global _enabled
+    _enabled = True
+
+
+class LatencyHistogram:
+    """Durations counted in power-of-two microsecond buckets.
+
+    Recording is one increment, so the histogram can sit on a per-tick path;
+    percentiles are interpolated within a bucket, so they are estimates
+    (always within a factor of two), while the count, total and maximum are
+    exact.
+    """
+
+    def __init__(self):
+        self.buckets = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        micros = int(seconds * 1e6)
+        self.buckets[min(micros.bit_length(), _BUCKETS - 1) if micros > 0 else 0] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        """Estimated q-th percentile (0-100) in seconds."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                low = 2 ** (i - 1) if i else 0
+                micros = low + (2 ** i - low) * (rank - seen) / n  # interpolate within the bucket
+                return min(micros / 1e6, self.max)
+            seen += n
+        return self.max
+
+    def summary(self):
+        """Count plus mean, percentiles and max in milliseconds."""
+        ms = 1000
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * ms, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * ms, 3),
+            "p90_ms": round(self.percentile(90) * ms, 3),
+            "p99_ms": round(self.percentile(99) * ms, 3),
+            "max_ms": round(self.max * ms, 3),
+        }
+
+
+def observe(name, seconds):
+    """Record one duration (or lateness) under name. Does nothing while instrumentation is off."""
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = LatencyHistogram()
+        histogram.observe(seconds)
+
+
+def timed(name):
+    """Decorator recording each call's duration under name.
+
+    Whether to instrument is decided when the decorator runs, so with
+    instrumentation off the original function is returned untouched and
+    costs nothing. Enable it (MINITOOLS_METRICS=1 or enable()) before the
+    decorated modules are imported.
+    """
+    def decorate(func):
+        if not _enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+def stats():
+    """Summaries of every histogram, keyed by name."""
+    with _lock:
+        return {name: histogram.summary() for name, histogram in sorted(_histograms.items())}
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def dump(file=None):
+    """Write the stats as a plain-text table (stderr by default)."""
+    file = file or sys.stderr
+    rows = stats()
+    if not rows:
+        print("No metrics recorded.", file=file)
+        return
+    width = max(len(name) for name in list(rows) + ["metric"])
+    print(f"{'metric':<{width}}  {'count':>8}  {'mean':>9}  {'p50':>9}  {'p90':>9}  {'p99':>9}  {'max':>9}  (ms)",
+          file=file)
+    for name, s in rows.items():
+        print(f"{name:<{width}}  {s['count']:>8}  {s['mean_ms']:>9.3f}  {s['p50_ms']:>9.3f}  {s['p90_ms']:>9.3f}  "
+              f"{s['p99_ms']:>9.3f}  {s['max_ms']:>9.3f}", file=file)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        data = json.dumps(stats(), separators=(",", ":")).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port=DEFAULT_METRICS_PORT, host="127.0.0.1"):
+    """Serve GET /metrics as JSON from a daemon thread and return the server."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
@@ -1,14 +1,94 @@
-import wx
+import time
+_process_start = time.perf_counter()
+
+import importlib
+import json
 import sys
+import wx
+import instrumentation
+from exportwriter import close_writer
+from uifonts import get_font
+
+# Seconds spent on each startup step, filled in as the launcher starts and tools load
+STARTUP_TIMES = {"import_wx": time.perf_counter() - _process_start}
+
+# Tool modules are imported on first use (they only create their own wx.App when run directly)
+# key: (module, frame class, display name)
+TOOLS = {
+    "age": ("agecalculator", "AgeCalculator", "Age Calculator"),
+    "countdown": ("Countdowntoafutureevent", "CountdownFrame", "Countdown"),
+    "day": ("dayoftheweekcalculator", "DayOfWeekFrame", "Day of Week Calculator"),
+    "dashboard": ("countdowndashboard", "CountdownDashboard", "Countdown Dashboard"),
+}
+_tool_classes = {}
+
+# Seconds of window construction "Open All" may spend before yielding back to the event loop
+OPEN_ALL_BUDGET = 0.05
 
-# Import the frames from the tool modules (they only create their own wx.App when run directly)
-try:
-    from agecalculator import AgeCalculator
-    from Countdowntoafutureevent import CountdownFrame
-    from dayoftheweekcalculator import DayOfWeekFrame
-except Exception as e:
-    print("Failed to import one or more tools:", e)
-    raise
+
+def load_tool(key):
+    """Import a tool's module on first use and return its frame class."""
+    frame_class = _tool_classes.get(key)
+    if frame_class is None:
+        module_name, class_name, _ = TOOLS[key]
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        STARTUP_TIMES[f"import_{module_name}"] = time.perf_counter() - started
+        frame_class = _tool_classes[key] = getattr(module, class_name)
+    return frame_class
+
+
+class FrameManager:
+    """Keeps at most one live window per tool and forgets it once it is closed.
+
+    Opening a tool that is already open restores and raises the existing
+    window instead of building a new one, so repeated presses of 1-4 or
+    "Open All" cannot accumulate frames, fonts and timers.
+    """
+
+    def __init__(self, on_change=None):
+        self.frames = {}
+        self.on_change = on_change
+
+    def show(self, key, frame_class):
+        """Bring up the tool's window, creating it only if none is open. Returns (frame, created)."""
+        frame = self.frames.get(key)
+        if frame:  # a destroyed wx window is falsy
+            if frame.IsIconized():
+                frame.Iconize(False)
+            frame.Show()
+            frame.Raise()
+            return frame, False
+        frame = frame_class(None)
+        self.frames[key] = frame
+        frame.Bind(wx.EVT_WINDOW_DESTROY, lambda event: self._on_destroy(event, key, frame))
+        frame.Show()
+        self._changed()
+        return frame, True
+
+    def _on_destroy(self, event, key, frame):
+        event.Skip()
+        # Child windows send EVT_WINDOW_DESTROY too; only the frame itself matters here
+        if event.GetEventObject() is frame and self.frames.get(key) is frame:
+            del self.frames[key]
+            self._changed()
+
+    def counts(self):
+        """Numbers of live tool windows, running timers and scheduled countdowns."""
+        counts = {"frames": len(self.frames), "timers": 0, "countdowns": 0}
+        countdown_module = sys.modules.get(TOOLS["countdown"][0])
+        if countdown_module is not None:
+            counts.update(countdown_module.timer_stats())
+        return counts
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+
+
+def startup_report():
+    """Startup timings in milliseconds."""
+    return {name: round(seconds * 1000, 2) for name, seconds in STARTUP_TIMES.items()}
 
 
 class LauncherFrame(wx.Frame):
@@ -22,15 +102,15 @@ class LauncherFrame(wx.Frame):
         main = wx.BoxSizer(wx.VERTICAL)
 
         header = wx.StaticText(panel, label="Mini Tools Launcher", style=wx.ALIGN_CENTER)
-        header_font = wx.Font(22, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        header_font = get_font(22, True)
         header.SetFont(header_font)
         header.SetForegroundColour('#4b0082')
         main.Add(header, 0, wx.ALL | wx.ALIGN_CENTER, 16)
 
-        grid = wx.GridSizer(rows=2, cols=2, hgap=20, vgap=20)
+        grid = wx.GridSizer(rows=3, cols=2, hgap=20, vgap=20)
 
         # Make buttons larger and consistent
-        btn_font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        btn_font = get_font(14, True)
 
         age_btn = wx.Button(panel, label="Age Calculator (1)")
         age_btn.SetFont(btn_font)
@@ -50,6 +130,12 @@ class LauncherFrame(wx.Frame):
         day_btn.Bind(wx.EVT_BUTTON, self.on_open_day)
         grid.Add(day_btn, 0, wx.EXPAND)
 
+        dashboard_btn = wx.Button(panel, label="Dashboard (4)")
+        dashboard_btn.SetFont(btn_font)
+        dashboard_btn.SetBackgroundColour('#fff2e6')
+        dashboard_btn.Bind(wx.EVT_BUTTON, self.on_open_dashboard)
+        grid.Add(dashboard_btn, 0, wx.EXPAND)
+
         open_all_btn = wx.Button(panel, label="Open All")
         open_all_btn.SetFont(btn_font)
         open_all_btn.SetBackgroundColour('#f3e8ff')
@@ -68,56 +154,90 @@ class LauncherFrame(wx.Frame):
 
         panel.SetSizer(main)
 
-        # status bar
-        self.CreateStatusBar()
-        self.SetStatusText("Press 1/2/3 or click a button to open a tool")
+        # status bar: message on the left, live window/timer counts on the right
+        self.CreateStatusBar(2)
+        self.SetStatusWidths([-2, -1])
+        self.SetStatusText("Press 1-4 or click a button to open a tool")
 
         # Accelerator table for keyboard shortcuts
         accel_tbl = wx.AcceleratorTable([
             (wx.ACCEL_CTRL, ord('1'), wx.NewIdRef()),
             (wx.ACCEL_CTRL, ord('2'), wx.NewIdRef()),
             (wx.ACCEL_CTRL, ord('3'), wx.NewIdRef()),
+            (wx.ACCEL_CTRL, ord('4'), wx.NewIdRef()),
         ])
         self.SetAcceleratorTable(accel_tbl)
         # Bind the key events to handlers via EVT_CHAR_HOOK
         self.Bind(wx.EVT_CHAR_HOOK, self.on_key)
 
-        self.opened_frames = []
+        self.frame_manager = FrameManager(on_change=self.update_counts)
+        self.open_queue = []
+        self.update_counts()
+        self.Bind(wx.EVT_ACTIVATE, self.on_activate)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
         self.Maximize(True)  # fill the screen
 
-    def _show_frame(self, frame):
-        # Keep a reference so frames don't get garbage collected
-        self.opened_frames.append(frame)
-        frame.Show()
+    def update_counts(self):
+        if not self:  # tool windows can outlive the launcher
+            return
+        counts = self.frame_manager.counts()
+        self.SetStatusText(f"{counts['frames']} windows, {counts['timers']} timers, {counts['countdowns']} countdowns", 1)
 
-    def on_open_age(self, event):
+    def on_destroy(self, event):
+        if event.GetEventObject() is self:
+            self.frame_manager.on_change = None
+        event.Skip()
+
+    def on_activate(self, event):
+        # Countdowns may have started or finished in other windows since the last update
+        if event.GetActive():
+            self.update_counts()
+        event.Skip()
+
+    def _open_tool(self, key):
+        name = TOOLS[key][2]
         try:
-            frame = AgeCalculator(None)
-            self._show_frame(frame)
-            self.SetStatusText("Opened Age Calculator")
+            frame_class = load_tool(key)
+            started = time.perf_counter()
+            _, created = self.frame_manager.show(key, frame_class)
+            if created:
+                elapsed = STARTUP_TIMES[f"construct_{key}"] = time.perf_counter() - started
+                self.SetStatusText(f"Opened {name} in {elapsed * 1000:.0f} ms")
+            else:
+                self.SetStatusText(f"Switched to {name}")
         except Exception as e:
-            wx.MessageBox(f"Failed to open Age Calculator: {e}", "Error", wx.ICON_ERROR)
+            wx.MessageBox(f"Failed to open {name}: {e}", "Error", wx.ICON_ERROR)
+
+    def on_open_age(self, event):
+        self._open_tool("age")
 
     def on_open_countdown(self, event):
-        try:
-            frame = CountdownFrame(None)
-            self._show_frame(frame)
-            self.SetStatusText("Opened Countdown")
-        except Exception as e:
-            wx.MessageBox(f"Failed to open Countdown: {e}", "Error", wx.ICON_ERROR)
+        self._open_tool("countdown")
 
     def on_open_day(self, event):
-        try:
-            frame = DayOfWeekFrame(None)
-            self._show_frame(frame)
-            self.SetStatusText("Opened Day of Week Calculator")
-        except Exception as e:
-            wx.MessageBox(f"Failed to open Day of Week Calculator: {e}", "Error", wx.ICON_ERROR)
+        self._open_tool("day")
+
+    def on_open_dashboard(self, event):
+        self._open_tool("dashboard")
 
     def on_open_all(self, event):
-        self.on_open_age(event)
-        self.on_open_countdown(event)
-        self.on_open_day(event)
+        # Build the windows in event-loop slices so each one appears as soon as it is
+        # ready and the launcher keeps handling input and paints in between
+        idle = not self.open_queue
+        self.open_queue.extend(key for key in ("age", "countdown", "day") if key not in self.open_queue)
+        if idle:
+            wx.CallAfter(self._open_next)
+
+    def _open_next(self):
+        if not self:  # the launcher was closed meanwhile
+            return
+        started = time.perf_counter()
+        while self.open_queue:
+            self._open_tool(self.open_queue.pop(0))
+            if time.perf_counter() - started >= OPEN_ALL_BUDGET:
+                break
+        if self.open_queue:
+            wx.CallAfter(self._open_next)
 
     def on_key(self, event):
         key = event.GetKeyCode()
@@ -130,9 +250,20 @@ class LauncherFrame(wx.Frame):
         if key == ord('3'):
             self.on_open_day(None)
             return
+        if key == ord('4'):
+            self.on_open_dashboard(None)
+            return
         event.Skip()
 
 
+def _on_first_window(frame, exit_after):
+    STARTUP_TIMES["first_window"] = time.perf_counter() - _process_start
+    if "--startup-report" in sys.argv:
+        print(json.dumps(startup_report()), flush=True)
+    if exit_after:
+        frame.Close()
+
+
 if __name__ == "__main__":
     try:
         app = wx.App(False)
@@ -140,6 +271,20 @@ if __name__ == "__main__":
         print("wxPython is required to run this launcher. Install it with: pip install wxPython")
         raise
 
+    # Opt-in handler timings and timer lateness; must be on before the tool modules are imported
+    metrics = "--metrics" in sys.argv or instrumentation.enabled()
+    if metrics:
+        instrumentation.enable()
+        try:
+            instrumentation.start_metrics_server()
+        except OSError as e:
+            print(f"Metrics endpoint unavailable: {e}", file=sys.stderr)
+
     frame = LauncherFrame()
     frame.Show()
+    # Runs once the event loop is idle, i.e. when the launcher window is actually up
+    wx.CallAfter(_on_first_window, frame, "--exit-after-startup" in sys.argv)
     app.MainLoop()
+    close_writer()  # finish saves and logs still queued by the tools
+    if metrics:
+        instrumentation.dump()
@@ -0,0 +1,131 @@
+import argparse
+import os
+from datetime import date
+
+import numpy as np
+
+from ageengine import age_from_parts, civil_from_days, to_day_numbers, EPOCH_ORDINAL
+from weekdayengine import weekdays_from_ordinals
+
+DEFAULT_CHUNK_ROWS = 4_000_000
+RAW_DTYPES = {"ordinal": np.dtype("<i4"), "datetime64": np.dtype("<M8[D]")}
+
+# Column files in a store directory: name -> dtype
+COLUMNS = {
+    "birth_year": np.int16,
+    "birth_month": np.int8,
+    "birth_day": np.int8,
+    "weekday": np.int8,
+    "age_years": np.int16,
+    "age_months": np.int8,
+    "age_days": np.int8,
+}
+AGE_COLUMNS = ("age_years", "age_months", "age_days")
+
+
+def open_dates(path, kind="ordinal"):
+    """Memory-map a date column: a .npy file, or a raw file of packed int32 ordinals or datetime64[D] values."""
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    return np.memmap(path, dtype=RAW_DTYPES[kind], mode="r")
+
+
+class DateColumnStore:
+    """A directory of memory-mapped .npy columns derived from one population of dates.
+
+    create() splits every date into year/month/day columns and stores the
+    weekday once. recompute_ages() then only runs the borrow arithmetic over
+    those small integer columns and writes into memory-mapped age columns in
+    place, so repeated as-of recomputations are bound by memory bandwidth.
+    """
+
+    def __init__(self, directory, chunk_rows=DEFAULT_CHUNK_ROWS):
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.npy")
+
+    def column(self, name, mode="r"):
+        return np.load(self._path(name), mmap_mode=mode)
+
+    def _new_column(self, name, rows):
+        return np.lib.format.open_memmap(self._path(name), mode="w+", dtype=COLUMNS[name], shape=(rows,))
+
+    def _reuse_column(self, name, rows):
+        """Open an existing column for writing in place, or create it when missing or of another shape."""
+        if os.path.exists(self._path(name)):
+            column = self.column(name, "r+")
+            if column.shape == (rows,) and column.dtype == COLUMNS[name]:
+                return column
+            del column  # release the mapping before the file is replaced
+        return self._new_column(name, rows)
+
+    def __len__(self):
+        return len(self.column("birth_year"))
+
+    @classmethod
+    def create(cls, directory, dates, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Build a store from an array (or memmap) of datetime64 values or date.toordinal() ordinals."""
+        os.makedirs(directory, exist_ok=True)
+        store = cls(directory, chunk_rows)
+        rows = len(dates)
+        for name in AGE_COLUMNS:  # ages of the previous population no longer apply
+            if os.path.exists(store._path(name)):
+                os.remove(store._path(name))
+        outputs = {name: store._new_column(name, rows) for name in ("birth_year", "birth_month", "birth_day", "weekday")}
+        for start in range(0, rows, chunk_rows):
+            stop = min(start + chunk_rows, rows)
+            days = to_day_numbers(dates[start:stop])
+            year, month, day = civil_from_days(days)
+            outputs["birth_year"][start:stop] = year
+            outputs["birth_month"][start:stop] = month
+            outputs["birth_day"][start:stop] = day
+            outputs["weekday"][start:stop] = weekdays_from_ordinals(days + EPOCH_ORDINAL)
+        for column in outputs.values():
+            column.flush()
+        return store
+
+    def recompute_ages(self, as_of=None):
+        """Write age_years/age_months/age_days for as_of into the store, reusing the files when present."""
+        if as_of is None:
+            as_of = date.today()
+        parts = [self.column(name) for name in ("birth_year", "birth_month", "birth_day")]
+        rows = len(parts[0])
+        outputs = [self._reuse_column(name, rows) for name in AGE_COLUMNS]
+        for start in range(0, rows, self.chunk_rows):
+            stop = min(start + self.chunk_rows, rows)
+            results = age_from_parts(*(part[start:stop] for part in parts), as_of)
+            for column, values in zip(outputs, results):
+                column[start:stop] = values
+        for column in outputs:
+            column.flush()
+        return outputs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or refresh memory-mapped age and weekday columns.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    create = sub.add_parser("create", help="split a binary date column into a column store")
+    create.add_argument("input", help=".npy file, or raw packed dates (see --kind)")
+    create.add_argument("store", help="output directory")
+    create.add_argument("--kind", choices=sorted(RAW_DTYPES), default="ordinal",
+                        help="raw input layout: int32 date.toordinal() values or datetime64[D] (default: ordinal)")
+    ages = sub.add_parser("ages", help="recompute the age columns of a store")
+    ages.add_argument("store", help="store directory")
+    ages.add_argument("--as-of", type=date.fromisoformat, default=None, help="as-of date YYYY-MM-DD (default: today)")
+    for p in (create, ages):
+        p.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="rows per chunk")
+    args = parser.parse_args(argv)
+
+    if args.command == "create":
+        store = DateColumnStore.create(args.store, open_dates(args.input, args.kind), args.chunk_rows)
+        print(f"Created {args.store} with {len(store)} rows")
+    else:
+        store = DateColumnStore(args.store, args.chunk_rows)
+        store.recompute_ages(args.as_of)
+        print(f"Recomputed ages for {len(store)} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ageengine import age_columns, to_day_numbers, EPOCH_ORDINAL
+from weekdayengine import weekdays_from_ordinals
+
+DEFAULT_CHUNK_ROWS = 2_000_000
+
+# name, dtype of every shared column; "days" is the input (days since 1970-01-01)
+_COLUMNS = (
+    ("days", np.int32),
+    ("age_years", np.int32),
+    ("age_months", np.int32),
+    ("age_days", np.int32),
+    ("weekday", np.int8),
+)
+
+
+def _attach(names, rows):
+    blocks = {name: shared_memory.SharedMemory(name=shm_name) for name, shm_name in names.items()}
+    dtypes = dict(_COLUMNS)
+    arrays = {name: np.ndarray(rows, dtype=dtypes[name], buffer=block.buf) for name, block in blocks.items()}
+    return blocks, arrays
+
+
+def _run_shard(names, rows, start, stop, as_of_ordinal):
+    """Worker: compute rows [start, stop) in place in the shared columns."""
+    blocks, arrays = _attach(names, rows)
+    try:
+        ordinals = arrays["days"][start:stop].astype(np.int64) + EPOCH_ORDINAL
+        if "age_years" in arrays:
+            years, months, days = age_columns(ordinals, date.fromordinal(as_of_ordinal))
+            arrays["age_years"][start:stop] = years
+            arrays["age_months"][start:stop] = months
+            arrays["age_days"][start:stop] = days
+        if "weekday" in arrays:
+            arrays["weekday"][start:stop] = weekdays_from_ordinals(ordinals)
+    finally:
+        # Views must be released before the mappings can be closed
+        del arrays
+        for block in blocks.values():
+            block.close()
+    return start, stop
+
+
+def run_parallel(dates, as_of=None, workers=None, chunk_rows=DEFAULT_CHUNK_ROWS, age=True, weekday=True, progress=None):
+    """Compute age and/or weekday columns for a large array of dates on a process pool.
+
+    dates is an array of datetime64 values or date.toordinal() ordinals. The
+    input and result columns live in shared memory, so shards are neither
+    pickled to the workers nor merged afterwards: each worker writes its rows
+    in place and the result is in input order by construction. progress, if
+    given, is called as progress(rows_done, rows_total, shard_index) when a
+    shard finishes. Returns a dict of result arrays.
+    """
+    if as_of is None:
+        as_of = date.today()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    rows = len(dates)
+    wanted = ["days"] + (["age_years", "age_months", "age_days"] if age else []) + (["weekday"] if weekday else [])
+    dtypes = dict(_COLUMNS)
+
+    blocks = {}
+    try:
+        for name in wanted:
+            size = max(1, rows * np.dtype(dtypes[name]).itemsize)
+            blocks[name] = shared_memory.SharedMemory(create=True, size=size)
+        # Convert the input a shard at a time so a memory-mapped source is never fully copied
+        shared_days = np.ndarray(rows, dtype=np.int32, buffer=blocks["days"].buf)
+        for start in range(0, rows, chunk_rows):
+            shared_days[start:start + chunk_rows] = to_day_numbers(dates[start:start + chunk_rows])
+        del shared_days
+        names = {name: block.name for name, block in blocks.items()}
+
+        shards = [(start, min(start + chunk_rows, rows)) for start in range(0, rows, chunk_rows)]
+        done = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_shard, names, rows, start, stop, as_of.toordinal()): i
+                       for i, (start, stop) in enumerate(shards)}
+            for future in as_completed(futures):
+                start, stop = future.result()
+                done += stop - start
+                if progress:
+                    progress(done, rows, futures[future])
+
+        results = {}
+        for name in wanted[1:]:
+            results[name] = np.ndarray(rows, dtype=dtypes[name], buffer=blocks[name].buf).copy()
+        return results
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute age and weekday columns for a large .npy date array on all cores.")
+    parser.add_argument("input", help=".npy file of datetime64[D] values or date.toordinal() ordinals")
+    parser.add_argument("output", help="output .npz file")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="as-of date YYYY-MM-DD (default: today)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="rows per shard")
+    args = parser.parse_args(argv)
+
+    dates = np.load(args.input, mmap_mode="r")
+    started = time.perf_counter()
+    results = run_parallel(dates, args.as_of, args.workers, args.chunk_rows,
+                           progress=lambda done, total, shard: print(f"shard {shard}: {done}/{total} rows", file=sys.stderr))
+    elapsed = time.perf_counter() - started
+    np.savez(args.output, **results)
+    print(f"Wrote {len(dates)} rows to {args.output} in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
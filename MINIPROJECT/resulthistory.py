@@ -0,0 +1,121 @@
+import csv
+import io
+import time
+from array import array
+from collections import namedtuple
+from datetime import date, datetime
+
+DEFAULT_CAPACITY = 100_000
+
+TOOL_AGE = 0
+TOOL_WEEKDAY = 1
+TOOL_COUNTDOWN = 2
+TOOL_NAMES = ("age", "weekday", "countdown")
+
+# Inputs and outputs per tool:
+#   age:       (birth ordinal, as-of ordinal) -> (years, months, days, 0)
+#   weekday:   (date ordinal, 0)              -> (weekday code, 0, 0, 0)
+#   countdown: (target epoch s, now epoch s)  -> (days, hours, minutes, seconds)
+HistoryRecord = namedtuple("HistoryRecord", "timestamp tool input_a input_b out_a out_b out_c out_d")
+
+
+class ResultHistory:
+    """Fixed-capacity ring buffer of numeric results from all tools.
+
+    Each field is a preallocated array.array column, so a record costs about
+    57 bytes regardless of how it would be formatted, and the oldest records
+    are overwritten once capacity is reached. Records are expected to arrive
+    in time order, which lets range queries stop at the first older record.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._timestamp = array("d", bytes(8 * capacity))
+        self._tool = array("B", bytes(capacity))
+        self._inputs = (array("q", bytes(8 * capacity)), array("q", bytes(8 * capacity)))
+        self._outputs = tuple(array("q", bytes(8 * capacity)) for _ in range(4))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def clear(self):
+        self._next = 0
+        self._size = 0
+
+    def record(self, tool, inputs, outputs, timestamp=None):
+        """Append one result; inputs has up to 2 ints and outputs up to 4, missing ones are 0."""
+        i = self._next
+        self._timestamp[i] = time.time() if timestamp is None else timestamp
+        self._tool[i] = tool
+        for column, value in zip(self._inputs, tuple(inputs) + (0, 0)):
+            column[i] = value
+        for column, value in zip(self._outputs, tuple(outputs) + (0, 0, 0, 0)):
+            column[i] = value
+        self._next = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def _record_at(self, i):
+        return HistoryRecord(self._timestamp[i], self._tool[i], self._inputs[0][i], self._inputs[1][i],
+                             self._outputs[0][i], self._outputs[1][i], self._outputs[2][i], self._outputs[3][i])
+
+    def _indices(self):
+        """Slot indices from newest to oldest."""
+        start = self._next - 1
+        for k in range(self._size):
+            yield (start - k) % self.capacity
+
+    def query(self, tool=None, since=None, until=None, limit=None):
+        """Records newest first, optionally filtered by tool and by timestamp range [since, until)."""
+        tools = self._tool
+        stamps = self._timestamp
+        found = 0
+        for i in self._indices():
+            stamp = stamps[i]
+            if since is not None and stamp < since:
+                break  # everything older is outside the range too
+            if until is not None and stamp >= until:
+                continue
+            if tool is not None and tools[i] != tool:
+                continue
+            yield self._record_at(i)
+            found += 1
+            if limit is not None and found >= limit:
+                break
+
+    def latest(self, tool=None):
+        return next(self.query(tool=tool, limit=1), None)
+
+    def export_csv(self, tool=None, since=None, until=None):
+        """Return matching records, oldest first, as CSV text."""
+        return records_to_csv(reversed(list(self.query(tool, since, until))))
+
+
+def records_to_csv(records):
+    """Format HistoryRecords as CSV text with readable dates."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(("time", "tool", "input_a", "input_b", "out_a", "out_b", "out_c", "out_d"))
+    for r in records:
+        if r.tool == TOOL_COUNTDOWN:
+            inputs = (datetime.fromtimestamp(r.input_a).isoformat(sep=" "), datetime.fromtimestamp(r.input_b).isoformat(sep=" "))
+        else:
+            inputs = (date.fromordinal(r.input_a).isoformat(), date.fromordinal(r.input_b).isoformat() if r.input_b else "")
+        writer.writerow((datetime.fromtimestamp(r.timestamp).isoformat(sep=" ", timespec="seconds"),
+                         TOOL_NAMES[r.tool]) + inputs + (r.out_a, r.out_b, r.out_c, r.out_d))
+    return out.getvalue()
+
+
+_shared = None
+
+
+def get_history(capacity=DEFAULT_CAPACITY):
+    """Return the process-wide ResultHistory, creating it with capacity on first use."""
+    global _shared
+    if _shared is None:
+        _shared = ResultHistory(capacity)
+    return _shared
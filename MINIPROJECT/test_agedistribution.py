@@ -0,0 +1,64 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from agedistribution import AgeDistribution
+from ageengine import calculate_age
+
+
+def _population(n, seed=1):
+    rng = random.Random(seed)
+    start = date(1920, 1, 1).toordinal()
+    births = [date.fromordinal(start + rng.randrange(40000)) for _ in range(n)]
+    births += [date(2000, 2, 29), date(2004, 2, 29), date(2026, 12, 31)]
+    return births
+
+
+def _expected(births, as_of):
+    counts = {}
+    unborn = 0
+    for birth in births:
+        if birth > as_of:
+            unborn += 1
+        else:
+            age = calculate_age(birth, as_of)[0]
+            counts[age] = counts.get(age, 0) + 1
+    return counts, unborn
+
+
+def _state(distribution):
+    return {age: n for age, n in enumerate(distribution.counts) if n}, distribution.unborn
+
+
+def test_advance_matches_calculate_age_day_by_day():
+    births = _population(2000)
+    distribution = AgeDistribution(births, date(2025, 2, 20))
+    day = distribution.as_of
+    while day < date(2026, 3, 5):
+        day += timedelta(days=1)
+        distribution.advance(day)
+        assert _state(distribution) == _expected(births, day)
+
+
+@pytest.mark.parametrize("as_of", [date(2024, 1, 1), date(2030, 6, 15)])
+def test_rebuild_paths_match(as_of):
+    births = _population(2000, seed=2)
+    distribution = AgeDistribution(births, date(2026, 3, 1))
+    distribution.advance(as_of)  # backwards, or beyond the replay limit
+    assert _state(distribution) == _expected(births, as_of)
+
+
+def test_add_remove_and_numpy_input():
+    births = _population(500, seed=3)
+    as_of = date(2026, 10, 18)
+    distribution = AgeDistribution(births, as_of)
+    distribution.add(date(1990, 5, 5), 3)
+    distribution.remove(births[0])
+    expected = births[1:] + [date(1990, 5, 5)] * 3
+    assert _state(distribution) == _expected(expected, as_of)
+    assert len(distribution) == len(expected)
+
+    np = pytest.importorskip("numpy")
+    from_array = AgeDistribution(np.array([d.toordinal() for d in births]), as_of)
+    assert _state(from_array) == _expected(births, as_of)
@@ -0,0 +1,33 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ageengine import age_columns, age_from_parts, calculate_age
+
+
+def _expected(birth, as_of):
+    return calculate_age(birth, as_of) if birth <= as_of else (-1, -1, -1)
+
+
+def test_age_columns_match_calculate_age():
+    rng = random.Random(1)
+    births = [date(1900, 1, 1) + timedelta(days=rng.randrange(50000)) for _ in range(500)]
+    for as_of in (date(2026, 1, 15), date(2024, 2, 29), date(2026, 3, 1), date(2025, 12, 31)):
+        years, months, days = age_columns([b.toordinal() for b in births], as_of)
+        for i, birth in enumerate(births):
+            assert (years[i], months[i], days[i]) == _expected(birth, as_of)
+
+
+def test_as_of_in_january_of_year_one():
+    births = [date(1, 1, 1), date(1, 1, 3), date(1, 1, 20)]
+    as_of = date(1, 1, 5)
+    years, months, days = age_columns(np.array([b.toordinal() for b in births]), as_of)
+    assert list(zip(years, months, days)) == [_expected(b, as_of) for b in births]
+
+
+def test_empty_input():
+    for result in (age_columns([], date(2026, 1, 1)), age_from_parts([], [], [], date(2026, 1, 1))):
+        assert [len(column) for column in result] == [0, 0, 0]
@@ -0,0 +1,67 @@
+import random
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+import businessdays
+from businessdays import BusinessCalendar, load_holidays, parse_weekmask
+
+HOLIDAYS = [date(2026, 1, 1), date(2026, 4, 6), date(2026, 5, 1), date(2026, 12, 25), date(2027, 1, 1),
+            date(2026, 5, 2)]  # 2 May 2026 is a Saturday
+
+
+def _brute_count(calendar, start, end):
+    return sum(calendar.is_business_day(start + timedelta(days=i)) for i in range((end - start).days))
+
+
+def test_parse_weekmask():
+    assert parse_weekmask("1111100") == (True,) * 5 + (False,) * 2
+    assert parse_weekmask("Sun, Mon Tuesday") == (True, True, False, False, False, False, True)
+    with pytest.raises(ValueError):
+        parse_weekmask("Mon Funday")
+    with pytest.raises(ValueError):
+        parse_weekmask([1, 0])
+
+
+def test_is_business_day():
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    assert calendar.is_business_day(date(2026, 1, 2))
+    assert not calendar.is_business_day(date(2026, 1, 1))
+    assert not calendar.is_business_day(date(2026, 1, 3))
+
+
+def test_count_matches_day_by_day():
+    rng = random.Random(1)
+    for weekmask in ("1111100", "0111110", "1010101"):
+        calendar = BusinessCalendar(weekmask, HOLIDAYS)
+        for _ in range(200):
+            start = date(2025, 6, 1) + timedelta(days=rng.randrange(800))
+            end = start + timedelta(days=rng.randrange(400))
+            assert calendar.count(start, end) == _brute_count(calendar, start, end)
+            assert calendar.count(end, start) == -calendar.count(start, end)
+
+
+def test_count_many_matches_numpy_busday_count():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(2)
+    starts = np.datetime64("2020-01-01") + rng.integers(0, 3000, 5000)
+    ends = starts + rng.integers(0, 1000, 5000)
+    for weekmask in ("1111100", "1100011"):
+        calendar = BusinessCalendar(weekmask, HOLIDAYS)
+        expected = np.busday_count(starts, ends, weekmask=weekmask, holidays=HOLIDAYS)
+        assert (calendar.count_many(starts, ends) == expected).all()
+
+
+def test_count_many_without_numpy(monkeypatch):
+    monkeypatch.setattr(businessdays, "np", None)
+    monkeypatch.setitem(sys.modules, "numpy", None)  # import numpy now raises ImportError
+    with pytest.raises(ImportError, match="NumPy is required"):
+        BusinessCalendar().count_many([date(2026, 1, 1).toordinal()], [date(2026, 2, 1).toordinal()])
+    assert BusinessCalendar().count(date(2026, 1, 1), date(2026, 2, 1)) == 22
+
+
+def test_load_holidays(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("# 2026\n2026-01-01\n\n2026-12-25  # Christmas\n", encoding="utf-8")
+    assert load_holidays(path) == [date(2026, 1, 1), date(2026, 12, 25)]
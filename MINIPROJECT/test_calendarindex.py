@@ -0,0 +1,50 @@
+import calendar
+from datetime import date
+
+import pytest
+
+from calendarindex import CalendarIndex, MAX_YEAR, MIN_YEAR
+
+
+@pytest.fixture(scope="module")
+def index():
+    return CalendarIndex.build()
+
+
+def test_every_month_matches_datetime(index):
+    for year in range(MIN_YEAR, MAX_YEAR + 1):
+        assert index.is_leap(year) == calendar.isleap(year)
+        for month in range(1, 13):
+            first = date(year, month, 1)
+            assert index.to_ordinal(year, month, 1) == first.toordinal()
+            assert index.weekday(year, month, 1) == first.weekday()
+            assert index.days_in_month(year, month) == calendar.monthrange(year, month)[1]
+
+
+def test_ordinal_round_trip(index):
+    last = date(MAX_YEAR, 12, 31).toordinal()
+    for ordinal in list(range(1, 800)) + list(range(729000, 740000)) + list(range(last - 800, last + 1)):
+        d = date.fromordinal(ordinal)
+        assert index.from_ordinal(ordinal) == (d.year, d.month, d.day)
+        assert index.to_ordinal(d.year, d.month, d.day) == ordinal
+
+
+def test_validation(index):
+    assert index.is_valid(2024, 2, 29) and not index.is_valid(2023, 2, 29)
+    assert not index.is_valid(0, 1, 1) and not index.is_valid(10000, 1, 1)
+    for args in ((2023, 2, 29), (2023, 13, 1), (0, 1, 1)):
+        with pytest.raises(ValueError):
+            index.to_ordinal(*args)
+    with pytest.raises(ValueError):
+        index.from_ordinal(0)
+
+
+def test_blob_round_trip(index, tmp_path):
+    path = tmp_path / "calendar.idx"
+    index.save(path)
+    loaded = CalendarIndex.load(path)
+    assert loaded.to_bytes() == index.to_bytes()
+    with pytest.raises(ValueError):
+        CalendarIndex.from_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        CalendarIndex.from_bytes(index.to_bytes()[:1000])
@@ -0,0 +1,73 @@
+import io
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from datecli import countdown, handle_line, run
+
+NOW = datetime(2026, 2, 28, 12, 0, 0)
+
+
+def _seconds(result):
+    return result["days"] * 86400 + result["hours"] * 3600 + result["minutes"] * 60 + result["seconds"]
+
+
+def test_zoned_countdown_uses_the_current_instant():
+    for zone in ("Asia/Tokyo", "America/New_York", "UTC"):
+        target = datetime.now(ZoneInfo(zone)).replace(tzinfo=None, microsecond=0) + timedelta(hours=1)
+        result = countdown({"target": target.isoformat(), "zone": zone})
+        assert 3590 <= _seconds(result) <= 3600
+        assert not result["reached"]
+
+
+def test_zoned_countdown_explicit_now_is_wall_time_in_the_zone():
+    body = {"target": "2026-03-29T03:30:00", "zone": "Europe/Berlin", "now": "2026-03-29T01:30:00"}
+    assert _seconds(countdown(body)) == 3600  # clocks skip 02:00-03:00 that night
+    assert _seconds(countdown({"target": "2026-03-29T03:30:00", "zone": "Europe/Berlin"},
+                              datetime(2026, 3, 29, 1, 30))) == 3600
+
+
+def test_json_lines():
+    assert json.loads(handle_line('{"tool": "age", "birth_date": "2000-02-29", "id": 7}', now=NOW)) == {
+        "years": 25, "months": 11, "days": 30, "id": 7}
+    assert json.loads(handle_line('{"date": "2026-01-05"}', "weekday")) == {"weekday": 0, "name": "Monday"}
+    assert json.loads(handle_line('{"tool": "countdown", "target": "2026-03-01T13:01:01"}', now=NOW)) == {
+        "reached": False, "days": 1, "hours": 1, "minutes": 1, "seconds": 1}
+
+
+def test_json_line_errors_keep_the_id():
+    assert json.loads(handle_line('{"tool": "age", "id": "a"}')) == {"error": "Missing field: birth_date", "id": "a"}
+    assert json.loads(handle_line('{"tool": "nope", "id": 1}'))["id"] == 1
+    assert "Unknown tool" in json.loads(handle_line('{"date": "2026-01-05"}'))["error"]
+    assert json.loads(handle_line('{"tool": "age", "birth_date": "2030-01-01"}', now=NOW)) == {
+        "error": "Birth date is in the future."}
+    assert "error" in json.loads(handle_line("{not json"))
+
+
+def test_plain_lines():
+    assert handle_line("2000-02-29\n", "age", NOW) == "25\t11\t30"
+    assert handle_line(" 2026-01-05 ", "weekday") == "0\tMonday"
+    assert handle_line("2026-03-01T13:01:01", "countdown", NOW) == "1d 01:01:01"
+    assert handle_line("2026-02-27", "countdown", NOW) == "Reached"
+    assert handle_line("2026-01-05") == "error: plain date lines need --tool"
+    assert handle_line("yesterday", "weekday").startswith("error: ")
+
+
+def test_run_answers_each_line_and_skips_blank_ones():
+    stdout = io.StringIO()
+    run(io.StringIO('2026-01-05\n\n  \n{"tool": "age", "birth_date": "2000-01-01"}\n2026-01-06'), stdout, "weekday", NOW)
+    assert stdout.getvalue().splitlines() == ["0\tMonday", '{"years": 26, "months": 1, "days": 27}', "1\tTuesday"]
+
+
+def test_command_line_streams_without_wx_or_numpy(tmp_path):
+    script = ("import sys, datecli; datecli.main(sys.argv[1:]); "
+              "print('loaded', 'numpy' in sys.modules or 'wx' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", script, "--tool", "weekday", "--now", "2026-02-28",
+                             "--index", str(tmp_path / "calendar.idx")],
+                            input="2026-01-05\n2026-01-06\n", capture_output=True, text=True, timeout=60,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.stdout.splitlines() == ["0\tMonday", "1\tTuesday", "loaded False"]
+    assert (tmp_path / "calendar.idx").exists()
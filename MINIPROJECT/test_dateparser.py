@@ -0,0 +1,83 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dateparser import DateParser, detect_format, FORMATS, parse_dates
+
+EPOCH = date(1970, 1, 1)
+LAYOUTS = {
+    "YYYY-MM-DD": "{y:04}-{m:02}-{d:02}",
+    "YYYY/MM/DD": "{y:04}/{m:02}/{d:02}",
+    "YYYYMMDD": "{y:04}{m:02}{d:02}",
+    "DD/MM/YYYY": "{d:02}/{m:02}/{y:04}",
+    "MM/DD/YYYY": "{m:02}/{d:02}/{y:04}",
+    "DD.MM.YYYY": "{d}.{m}.{y:04}",
+    "DD-MM-YYYY": "{d:02}-{m:02}-{y:04}",
+    "MM-DD-YYYY": "{m}-{d}-{y:04}",
+    "D Mon YYYY": "{d} {mon} {y:04}",
+    "Mon D, YYYY": "{month} {d}, {y:04}",
+}
+
+
+def _dates(n, seed=1):
+    rng = random.Random(seed)
+    return [date(1900, 1, 1) + timedelta(days=rng.randrange(60000)) for _ in range(n)]
+
+
+def _text(fmt, day):
+    return LAYOUTS[fmt].format(y=day.year, m=day.month, d=day.day, mon=day.strftime("%b"), month=day.strftime("%B"))
+
+
+def test_layouts_cover_every_format():
+    assert set(LAYOUTS) == set(FORMATS)
+
+
+@pytest.mark.parametrize("fmt", list(FORMATS))
+def test_parse_matches_date(fmt):
+    days = _dates(300) + [date(2000, 2, 29), date(1, 1, 1), date(9999, 12, 31)]
+    parsed = parse_dates([_text(fmt, d) for d in days], fmt)
+    assert parsed.invalid_count == 0 and not parsed.nulls.any()
+    assert parsed.days.tolist() == [(d - EPOCH).days for d in days]
+
+
+@pytest.mark.parametrize("fmt", ["YYYY-MM-DD", "MM-DD-YYYY", "D Mon YYYY", "Mon D, YYYY", "YYYYMMDD"])
+def test_detect_format(fmt):
+    strings = [_text(fmt, d) for d in _dates(50)]
+    assert detect_format(strings) == fmt
+    assert DateParser().parse(strings).invalid_count == 0
+
+
+def test_ambiguous_days_are_read_day_first():
+    assert detect_format(["01/02/2026", "03/04/2026"]) == "DD/MM/YYYY"
+    assert detect_format(["01/02/2026", "12/31/2026"]) == "MM/DD/YYYY"  # only month first fits both
+    assert detect_format(["", None, "  "]) is None
+
+
+def test_invalid_and_missing_values():
+    strings = ["2026-02-28", "2026-02-29", "2024-02-29", "2026-13-01", "2026-1-5", "garbage", None, "", "2026-02-288"]
+    parsed = parse_dates(strings, "YYYY-MM-DD")
+    assert parsed.nulls.tolist() == [False, True, False, True, False, True, True, True, True]
+    assert parsed.days[~parsed.nulls].tolist() == [(d - EPOCH).days for d in
+                                                  (date(2026, 2, 28), date(2024, 2, 29), date(2026, 1, 5))]
+    assert parsed.invalid_count == 4  # missing values are nulls but not invalid
+    assert [row for row, _ in parsed.invalid_rows] == [1, 3, 5, 8]
+
+
+def test_chunks_share_format_memo_and_row_numbers():
+    parser = DateParser(memo_size=8, max_reported=3)
+    first = parser.parse(["5 Jan 2026", "bad", "6 Jan 2026"])
+    second = parser.parse(["bad", "7 Jan 2026"] + [f"{d} Feb 2026" for d in range(1, 20)] + ["31 Feb 2026"])
+    assert parser.format == "D Mon YYYY"
+    assert first.days[0] == (date(2026, 1, 5) - EPOCH).days
+    assert second.days[-2] == (date(2026, 2, 19) - EPOCH).days
+    assert parser.invalid_count == 3
+    assert parser.invalid_rows == [(1, "bad"), (3, "bad"), (24, "31 Feb 2026")]
+    assert "5 Jan 2026" not in parser.memo  # the memo outgrew memo_size and started over
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        DateParser("Julian")
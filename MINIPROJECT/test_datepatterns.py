@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+
+import pytest
+
+from datepatterns import day_on_weekday, nth_weekdays, years_on_weekday
+
+
+def _all_days(start_year, end_year):
+    day = date(start_year, 1, 1)
+    while day.year <= end_year:
+        yield day
+        day += timedelta(days=1)
+
+
+def _nth(day):
+    """(n, last) for a date: it is the nth of its weekday in the month, and whether it is the last one."""
+    return (day.day - 1) // 7 + 1, (day + timedelta(days=7)).month != day.month
+
+
+def test_friday_the_13th_matches_brute_force():
+    expected = [d for d in _all_days(1890, 2110) if d.day == 13 and d.weekday() == 4]
+    assert list(day_on_weekday(13, 4, 1890, 2110)) == expected
+
+
+def test_day_on_weekday_in_one_month_across_cycles():
+    expected = [d for d in _all_days(1590, 2420) if d.month == 2 and d.day == 29 and d.weekday() == 0]
+    assert list(day_on_weekday(29, 0, 1590, 2420, month=2)) == expected
+
+
+def test_years_on_weekday():
+    expected = [y for y in range(1, 2101) if date(y, 12, 25).weekday() == 6]
+    assert list(years_on_weekday(12, 25, 6, 1, 2100)) == expected
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, -1])
+def test_nth_weekdays_matches_brute_force(n):
+    for weekday in (0, 3, 6):
+        expected = [d for d in _all_days(1990, 2040) if d.weekday() == weekday
+                    and (_nth(d)[1] if n == -1 else _nth(d)[0] == n)]
+        assert list(nth_weekdays(n, weekday, 1990, 2040)) == expected
+
+
+def test_range_end_and_errors():
+    assert list(day_on_weekday(31, 4, 9999, 9999))[-1] == date(9999, 12, 31)
+    with pytest.raises(ValueError):
+        list(day_on_weekday(13, 4, 2000, 1999))
+    with pytest.raises(ValueError):
+        list(nth_weekdays(6, 0, 2000, 2001))
@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from dateservice import countdown, countdown_batch, DateService
+
+
+async def _exchange(request, **options):
+    service = DateService(port=0, **options)
+    server = await service.start()
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        writer.write_eof()  # the server answers what was sent, then sees the end of input
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return response
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def _responses(data):
+    """[(status, headers, payload)] of the responses in data, in order."""
+    result = []
+    while data:
+        head, _, data = data.partition(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        headers = dict(line.split(": ", 1) for line in lines[1:])
+        length = int(headers["Content-Length"])
+        result.append((int(lines[0].split(" ", 2)[1]), headers, json.loads(data[:length])))
+        data = data[length:]
+    return result
+
+
+def _send(request, **options):
+    """(status, payload) of the first response to the raw request bytes."""
+    status, _, payload = _responses(asyncio.run(_exchange(request, **options)))[0]
+    return status, payload
+
+
+def _post(path, body):
+    data = json.dumps(body).encode()
+    return b"POST %s HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (path.encode(), len(data), data)
+
+
+@pytest.mark.parametrize("length", [b"-5", b"five", b"1.5"])
+def test_malformed_content_length(length):
+    status, payload = _send(b"POST /age HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n{}")
+    assert status == 400
+    assert payload == {"error": "Invalid Content-Length"}
+
+
+@pytest.mark.parametrize("now", ["2025-12-31T23:59:59.500000", "2025-12-31T23:59:59", "2026-01-01T00:00:00.250000",
+                                 "2025-10-02T08:15:42.999999"])
+def test_countdown_batch_matches_scalar(now):
+    targets = ["2026-01-01T00:00:00", "2026-01-01T00:00:01", "2025-12-31T12:00:00", "2027-06-30T18:45:10"]
+    batch = countdown_batch({"targets": targets, "now": now})
+    for i, target in enumerate(targets):
+        scalar = countdown({"target": target, "now": now})
+        assert {key: values[i] for key, values in batch.items()} == scalar
+
+
+def test_keep_alive_serves_several_requests_in_order():
+    request = (_post("/weekday", {"date": "2026-01-05"}) + _post("/age", {"birth_date": "2000-02-29", "as_of": "2026-02-28"})
+               + b"GET /health HTTP/1.1\r\nConnection: close\r\n\r\n")
+    responses = _responses(asyncio.run(_exchange(request)))
+    assert [(status, payload) for status, _, payload in responses] == [
+        (200, {"weekday": 0, "name": "Monday"}),
+        (200, {"years": 25, "months": 11, "days": 30}),
+        (200, {"status": "ok"}),
+    ]
+    assert [headers["Connection"] for _, headers, _ in responses] == ["keep-alive", "keep-alive", "close"]
+
+
+def test_http_1_0_closes_by_default():
+    data = asyncio.run(_exchange(b"GET /health HTTP/1.0\r\n\r\n"))
+    assert [(s, h["Connection"]) for s, h, _ in _responses(data)] == [(200, "close")]
+
+
+@pytest.mark.parametrize("request_bytes, status", [
+    (b"GET /nowhere HTTP/1.1\r\n\r\n", 404),
+    (b"GET /age HTTP/1.1\r\n\r\n", 405),
+    (b"NONSENSE\r\n\r\n", 400),
+    (b"POST /age HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", 411),
+    (b"POST /age HTTP/1.1\r\nContent-Length: 8\r\n\r\nnot json", 400),
+    (b"POST /age HTTP/1.1\r\nContent-Length: 2\r\n\r\n[]", 400),
+])
+def test_request_errors(request_bytes, status):
+    assert _send(request_bytes)[0] == status
+
+
+def test_body_over_the_limit():
+    status, payload = _send(_post("/age", {"birth_date": "2000-01-01"}), max_body=10)
+    assert status == 413
+
+
+@pytest.mark.parametrize("body, message", [
+    ({}, "Missing field 'birth_date'"),
+    ({"birth_date": "2030-01-01", "as_of": "2026-01-01"}, "Birth date is in the future."),
+])
+def test_handler_errors_are_400(body, message):
+    assert _send(_post("/age", body)) == (400, {"error": message})
+
+
+def test_truncated_body_closes_without_response():
+    assert asyncio.run(_exchange(b"POST /age HTTP/1.1\r\nContent-Length: 50\r\n\r\n{}")) == b""
+
+
+def test_batches_match_scalar_endpoints():
+    dates = ["1970-01-01", "2000-02-29", "1999-12-31", "2026-02-28"]
+    as_of = "2026-02-28"
+    status, ages = _send(_post("/age/batch", {"birth_dates": dates, "as_of": as_of}))
+    assert status == 200
+    status, weekdays = _send(_post("/weekday/batch", {"dates": dates}))
+    assert status == 200
+    for i, value in enumerate(dates):
+        assert _send(_post("/age", {"birth_date": value, "as_of": as_of}))[1] == {k: v[i] for k, v in ages.items()}
+        assert _send(_post("/weekday", {"date": value}))[1] == {k: v[i] for k, v in weekdays.items()}
+
+
+def test_batch_date_format():
+    status, payload = _send(_post("/weekday/batch", {"dates": ["05/01/2026", "31/12/1999"], "date_format": "auto"}))
+    assert (status, payload["name"]) == (200, ["Monday", "Friday"])
+    status, payload = _send(_post("/countdown/batch", {"targets": ["2 Jan 2026"], "date_format": "D Mon YYYY",
+                                                       "now": "2026-01-01T12:00:00"}))
+    assert (status, payload["hours"]) == (200, [12])
+    assert _send(_post("/weekday/batch", {"dates": ["2026-01-05"], "date_format": "Julian"}))[0] == 400
+    assert _send(_post("/weekday/batch", {"dates": ["x", "y"], "date_format": "auto"})) == (
+        400, {"error": "Could not detect the date format of the batch"})
+    assert _send(_post("/age/batch", {"birth_dates": ["2026-01-05", "2026-02-30"], "date_format": "YYYY-MM-DD"}))[0] == 400
@@ -0,0 +1,60 @@
+import time
+from datetime import datetime
+
+import eventstore
+from eventstore import EventStore, get_store
+
+
+def test_get_store_prunes_reached_events(tmp_path, monkeypatch):
+    path = str(tmp_path / "events.db")
+    now = time.time()
+    store = EventStore(path)
+    store.add_many([("long gone", now - 30 * 86400), ("just reached", now - 60), ("upcoming", now + 3600)])
+    store.close()
+    monkeypatch.setattr(eventstore, "_shared", None)
+    shared = get_store(path)
+    try:
+        assert [e.name for e in shared.due_between(0, now + 86400)] == ["just reached", "upcoming"]
+    finally:
+        shared.close()
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "events.db")
+    store = EventStore(path)
+    first = store.add("Launch", datetime(2026, 5, 1, 9, 30))
+    store.add_many([("Review", 1_800_000_000.5), ("Ship", 1_700_000_000)])
+    store.close()
+
+    store = EventStore(path)
+    assert len(store) == 3
+    event = store.get(first)
+    assert (event.name, event.target) == ("Launch", datetime(2026, 5, 1, 9, 30))
+    assert [(e.name, e.deadline) for e in store.due_between(0, 2e9)] == [
+        ("Ship", 1_700_000_000), ("Launch", datetime(2026, 5, 1, 9, 30).timestamp()), ("Review", 1_800_000_000.5)]
+    store.remove(first)
+    assert store.get(first) is None
+    store.close()
+
+
+def test_next_due_and_due_between_are_ordered_windows(tmp_path):
+    store = EventStore(str(tmp_path / "events.db"))
+    store.add_many((f"e{t}", t) for t in (50, 10, 40, 20, 30, 60))
+    assert [e.deadline for e in store.next_due(3, after=20)] == [30, 40, 50]
+    assert [e.deadline for e in store.next_due(10, after=60)] == []
+    assert [e.deadline for e in store.due_between(20, 50)] == [20, 30, 40]
+    assert store.remove_before(35) == 3
+    assert [e.deadline for e in store.due_between(0, 100)] == [40, 50, 60]
+    store.close()
+
+
+def test_add_missing_skips_stored_events(tmp_path):
+    store = EventStore(str(tmp_path / "events.db"))
+    store.add("Launch", 100)
+    assert store.add_missing([("Launch", 100), ("Launch", 200), ("Other", 100)]) == 2
+    assert store.add_missing([("Launch", 100), ("Launch", 200), ("Other", 100)]) == 0
+    assert store.add_missing([]) == 0
+    assert store.add_missing([("Twice", 300), ("Twice", 300)]) == 1
+    assert sorted((e.name, e.deadline) for e in store.due_between(0, 1000)) == [
+        ("Launch", 100), ("Launch", 200), ("Other", 100), ("Twice", 300)]
+    store.close()
@@ -0,0 +1,103 @@
+import os
+import queue
+import threading
+
+import pytest
+
+from exportwriter import BackgroundWriter
+
+
+class Events:
+    """Collects callback calls made on the writer thread."""
+
+    def __init__(self):
+        self.calls = []
+
+    def on(self, kind):
+        return lambda arg: self.calls.append((kind, arg))
+
+
+def test_write_replaces_file_and_reports(tmp_path):
+    writer = BackgroundWriter()
+    events = Events()
+    path = str(tmp_path / "result.txt")
+    writer.write(path, "first\n")
+    writer.write(path, lambda: "second\n", on_done=events.on("done"), on_error=events.on("error"))
+    writer.close()
+    assert open(path, encoding="utf-8").read() == "second\n"
+    assert events.calls == [("done", path)]
+
+
+def test_write_error_goes_to_on_error(tmp_path):
+    writer = BackgroundWriter()
+    events = Events()
+    writer.write(str(tmp_path / "missing" / "result.txt"), "text", events.on("done"), events.on("error"))
+    writer.close()
+    assert [kind for kind, _ in events.calls] == ["error"]
+    assert isinstance(events.calls[0][1], OSError)
+
+
+def test_stream_appends_lines_in_order(tmp_path):
+    writer = BackgroundWriter()
+    path = str(tmp_path / "log.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("kept\n")
+    stream = writer.open_stream(path)
+    for i in range(2000):
+        stream.write(f"{i}\n", block=True)
+    events = Events()
+    stream.close(on_done=events.on("done"))
+    writer.close()
+    assert open(path, encoding="utf-8").read() == "kept\n" + "".join(f"{i}\n" for i in range(2000))
+    assert events.calls == [("done", path)]
+
+
+@pytest.mark.skipif(not os.path.exists("/dev/full"), reason="needs /dev/full")
+def test_failing_stream_is_dropped_and_others_continue(tmp_path):
+    writer = BackgroundWriter()
+    events = Events()
+    bad = writer.open_stream("/dev/full", on_error=events.on("error"))
+    good = writer.open_stream(str(tmp_path / "log.txt"))
+    bad.write("x" * 100000 + "\n", block=True)
+    good.write("still logging\n", block=True)
+    writer.join()
+    writer.write(str(tmp_path / "later.txt"), "later\n")
+    good.write("after the failure\n", block=True)
+    writer.close()
+    assert [kind for kind, _ in events.calls] == ["error"]
+    assert open(tmp_path / "log.txt", encoding="utf-8").read() == "still logging\nafter the failure\n"
+    assert open(tmp_path / "later.txt", encoding="utf-8").read() == "later\n"
+
+
+def test_full_queue(tmp_path):
+    blocked = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        blocked.set()
+        release.wait(5)
+        return ""
+
+    writer = BackgroundWriter(max_pending=2)
+    writer.write(str(tmp_path / "slow.txt"), slow)
+    blocked.wait(5)  # the worker is busy with the first job; two more fill the queue
+    stream = writer.open_stream(str(tmp_path / "log.txt"))
+    stream.write("queued\n")
+    events = Events()
+    writer.write(str(tmp_path / "dropped.txt"), "text", on_error=events.on("error"))
+    with pytest.raises(queue.Full):
+        stream.write("dropped\n")
+    release.set()
+    writer.close()
+    assert [kind for kind, _ in events.calls] == ["error"]
+    assert not os.path.exists(tmp_path / "dropped.txt")
+    assert open(tmp_path / "log.txt", encoding="utf-8").read() == "queued\n"
+
+
+def test_close_writes_queued_lines_of_open_streams(tmp_path):
+    writer = BackgroundWriter()
+    stream = writer.open_stream(str(tmp_path / "log.txt"), append=False)
+    stream.write("line\n", block=True)
+    writer.close()
+    assert open(tmp_path / "log.txt", encoding="utf-8").read() == "line\n"
+    assert not writer._thread.is_alive()
@@ -0,0 +1,126 @@
+import io
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from eventstore import EventStore
+from icsimport import IcsEvent, import_ics, iter_vevents, parse_rrule
+
+
+def _epoch(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def _utc(t):
+    return datetime.fromtimestamp(t, timezone.utc).replace(tzinfo=None)
+
+
+def _expand(*props, after=(2026, 1, 1), before=(2027, 1, 1)):
+    """UTC wall times of the occurrences of one VEVENT in [after, before)."""
+    event = IcsEvent(next(iter_vevents(io.StringIO("\n".join(["BEGIN:VEVENT", *props, "END:VEVENT"])))))
+    return [_utc(t) for t in event.occurrences(_epoch(*after), _epoch(*before))]
+
+
+def _write_ics(path, *events):
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0"]
+    for props in events:
+        lines += ["BEGIN:VEVENT", *props, "END:VEVENT"]
+    lines.append("END:VCALENDAR")
+    path.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+    return str(path)
+
+
+def test_event_failing_to_expand_is_skipped(tmp_path):
+    path = _write_ics(tmp_path / "cal.ics",
+                      ["UID:bad", "SUMMARY:Bad", "DTSTART:20260105T090000Z", "RRULE:FREQ=DAILY;INTERVAL=0"],
+                      ["UID:good", "SUMMARY:Good", "DTSTART:20260106T090000Z"])
+    store = EventStore(str(tmp_path / "events.db"))
+    result = import_ics(path, store, 30, now=_epoch(2026, 1, 1))
+    assert (result.events, result.added, result.skipped) == (2, 1, 1)
+    assert [(e.name, e.deadline) for e in store.due_between(0, _epoch(2027, 1, 1))] == [("Good", _epoch(2026, 1, 6, 9))]
+
+
+def test_folded_lines_and_ignored_components():
+    text = ("BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:Quarterly\r\n  planning\\, all teams\r\n"
+            "DTSTART;TZID=\"Europe/Berlin\":20260105T090000\r\nDESCRIPTION:dropped\r\n"
+            "BEGIN:VALARM\r\nSUMMARY:not the event name\r\nEND:VALARM\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n")
+    (props,) = list(iter_vevents(io.StringIO(text)))
+    event = IcsEvent(props)
+    assert "DESCRIPTION" not in props
+    assert (event.name, event.start, event.zone) == ("Quarterly planning, all teams", datetime(2026, 1, 5, 9), "Europe/Berlin")
+
+
+def test_daily_count_and_exdate():
+    assert _expand("DTSTART:20260105T090000Z", "RRULE:FREQ=DAILY;COUNT=5", "EXDATE:20260106T090000Z,20260108T090000Z") == [
+        datetime(2026, 1, 5, 9), datetime(2026, 1, 7, 9), datetime(2026, 1, 9, 9)]
+
+
+def test_weekly_byday_until_and_rdate():
+    assert _expand("DTSTART:20260105T180000Z", "RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;UNTIL=20260202",
+                   "RDATE:20260110T120000Z") == [
+        datetime(2026, 1, 5, 18), datetime(2026, 1, 8, 18), datetime(2026, 1, 10, 12),
+        datetime(2026, 1, 19, 18), datetime(2026, 1, 22, 18), datetime(2026, 2, 2, 18)]
+
+
+def test_monthly_nth_weekday_and_setpos():
+    last_friday = _expand("DTSTART:20260130T100000Z", "RRULE:FREQ=MONTHLY;BYDAY=-1FR;COUNT=4")
+    assert [d.day for d in last_friday] == [30, 27, 27, 24]
+    last_workday = _expand("DTSTART:20260130T100000Z", "RRULE:FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1;COUNT=3")
+    assert [d.date().isoformat() for d in last_workday] == ["2026-01-30", "2026-02-27", "2026-03-31"]
+    month_end = _expand("DTSTART:20260131T000000Z", "RRULE:FREQ=MONTHLY;BYMONTHDAY=-1;COUNT=3")
+    assert [d.day for d in month_end] == [31, 28, 31]
+
+
+def test_yearly_rules():
+    assert _expand("DTSTART:20240229T080000Z", "RRULE:FREQ=YEARLY", before=(2033, 1, 1)) == [datetime(2028, 2, 29, 8),
+                                                                                            datetime(2032, 2, 29, 8)]
+    thanksgiving = _expand("DTSTART:20261126T170000Z", "RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=4TH", before=(2029, 1, 1))
+    assert [d.day for d in thanksgiving] == [26, 25, 23]
+
+
+def test_window_starting_late_in_a_counted_series():
+    props = ("DTSTART:20200106T070000Z", "RRULE:FREQ=WEEKLY;BYDAY=MO,WE;COUNT=700")
+    everything = _expand(*props, after=(2020, 1, 1), before=(2030, 1, 1))
+    assert len(everything) == 700
+    assert _expand(*props) == [d for d in everything if datetime(2026, 1, 1) <= d < datetime(2027, 1, 1)]
+    monthly = ("DTSTART:20200131T070000Z", "RRULE:FREQ=MONTHLY;BYMONTHDAY=31;COUNT=50")
+    everything = _expand(*monthly, after=(2020, 1, 1), before=(2040, 1, 1))
+    assert len(everything) == 50
+    assert _expand(*monthly) == [d for d in everything if datetime(2026, 1, 1) <= d < datetime(2027, 1, 1)]
+
+
+def test_zoned_series_keeps_wall_time_across_dst():
+    berlin = ZoneInfo("Europe/Berlin")
+    times = _expand("DTSTART;TZID=Europe/Berlin:20260323T090000", "RRULE:FREQ=DAILY;COUNT=14",
+                    "EXDATE;TZID=Europe/Berlin:20260330T090000")
+    walls = [t.replace(tzinfo=timezone.utc).astimezone(berlin) for t in times]
+    assert len(walls) == 13 and {(w.hour, w.minute) for w in walls} == {(9, 0)}
+    assert datetime(2026, 3, 30).date() not in {w.date() for w in walls}
+
+
+def test_all_day_event_starts_at_local_midnight():
+    assert _expand("DTSTART;VALUE=DATE:20260301") == [_utc(datetime(2026, 3, 1).timestamp())]
+
+
+@pytest.mark.parametrize("rule", ["FREQ=HOURLY", "FREQ=DAILY;BYHOUR=9", "INTERVAL=2"])
+def test_unsupported_rules(rule):
+    with pytest.raises(ValueError):
+        parse_rrule(rule)
+
+
+def test_import_overrides_cancellations_and_reimport(tmp_path):
+    path = _write_ics(tmp_path / "cal.ics",
+                      ["UID:standup", "SUMMARY:Standup", "DTSTART:20260105T090000Z", "RRULE:FREQ=DAILY;COUNT=3"],
+                      ["UID:standup", "SUMMARY:Standup (moved)", "RECURRENCE-ID:20260106T090000Z",
+                       "DTSTART:20260106T150000Z"],
+                      ["UID:gone", "SUMMARY:Gone", "DTSTART:20260107T090000Z", "STATUS:CANCELLED"],
+                      ["UID:untitled", "DTSTART:20260108T090000Z"],
+                      ["UID:past", "SUMMARY:Past", "DTSTART:20251201T090000Z"])
+    store = EventStore(str(tmp_path / "events.db"))
+    result = import_ics(path, store, 30, now=_epoch(2026, 1, 1))
+    assert (result.events, result.added, result.skipped) == (5, 4, 0)
+    assert [(e.name, _utc(e.deadline)) for e in store.due_between(0, _epoch(2027, 1, 1))] == [
+        ("Standup", datetime(2026, 1, 5, 9)), ("Standup (moved)", datetime(2026, 1, 6, 15)),
+        ("Standup", datetime(2026, 1, 7, 9)), ("Untitled event", datetime(2026, 1, 8, 9))]
+    assert import_ics(path, store, 30, now=_epoch(2026, 1, 1)).added == 0
@@ -0,0 +1,32 @@
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ageengine import calculate_age
+from mmapcolumns import DateColumnStore
+
+
+def _ordinals(n, seed=1):
+    rng = np.random.default_rng(seed)
+    return date(1930, 1, 1).toordinal() + rng.integers(0, 30000, n)
+
+
+def test_ages_and_weekdays_match_scalar(tmp_path):
+    ordinals = _ordinals(300)
+    as_of = date(2026, 3, 1)
+    store = DateColumnStore.create(str(tmp_path), ordinals, chunk_rows=64)
+    years, months, days = store.recompute_ages(as_of)
+    weekday = store.column("weekday")
+    for i, ordinal in enumerate(ordinals):
+        birth = date.fromordinal(int(ordinal))
+        assert (years[i], months[i], days[i]) == calculate_age(birth, as_of)
+        assert weekday[i] == birth.weekday()
+
+
+@pytest.mark.parametrize("rows", [20, 5])
+def test_recreating_a_store_resizes_the_age_columns(tmp_path, rows):
+    DateColumnStore.create(str(tmp_path), _ordinals(10)).recompute_ages(date(2026, 1, 1))
+    store = DateColumnStore.create(str(tmp_path), _ordinals(rows, seed=2))
+    assert all(len(column) == rows for column in store.recompute_ages(date(2026, 1, 1)))
@@ -0,0 +1,68 @@
+import csv
+import io
+from datetime import date, datetime
+
+import pytest
+
+from resulthistory import ResultHistory, TOOL_AGE, TOOL_COUNTDOWN, TOOL_WEEKDAY
+
+
+def _filled(capacity, n):
+    history = ResultHistory(capacity)
+    for i in range(n):
+        history.record(i % 3, (i, i + 1), (i, 2 * i), timestamp=1000 + i)
+    return history
+
+
+def test_wraparound_keeps_the_newest_records():
+    history = _filled(5, 12)
+    assert len(history) == 5
+    assert [r.input_a for r in history.query()] == [11, 10, 9, 8, 7]
+    history.record(TOOL_AGE, (99,), (1, 2, 3), timestamp=2000)
+    assert [r.input_a for r in history.query()] == [99, 11, 10, 9, 8]
+    assert history.latest() == (2000, TOOL_AGE, 99, 0, 1, 2, 3, 0)
+
+
+def test_partly_filled():
+    history = _filled(10, 3)
+    assert len(history) == 3
+    assert [r.timestamp for r in history.query()] == [1002, 1001, 1000]
+
+
+@pytest.mark.parametrize("n", [4, 7, 20])
+def test_query_filters_match_brute_force(n):
+    history = _filled(7, n)
+    kept = list(range(max(0, n - 7), n))[::-1]
+    for tool in (None, 0, 1, 2):
+        for since, until in ((None, None), (1003, None), (None, 1005), (1002, 1004), (1010, 1001)):
+            for limit in (None, 1, 2):
+                expected = [i for i in kept if (tool is None or i % 3 == tool)
+                            and (since is None or 1000 + i >= since) and (until is None or 1000 + i < until)]
+                if limit is not None:
+                    expected = expected[:limit]
+                assert [r.input_a for r in history.query(tool, since, until, limit)] == expected
+
+
+def test_clear_and_capacity():
+    history = _filled(3, 5)
+    history.clear()
+    assert len(history) == 0
+    assert history.latest() is None
+    with pytest.raises(ValueError):
+        ResultHistory(0)
+
+
+def test_export_csv_oldest_first():
+    history = ResultHistory(10)
+    history.record(TOOL_AGE, (date(2000, 2, 29).toordinal(), date(2026, 2, 28).toordinal()), (25, 11, 30), 1.0)
+    history.record(TOOL_WEEKDAY, (date(2026, 1, 5).toordinal(),), (0,), 2.0)
+    target = datetime(2026, 12, 31, 23, 59, 59).timestamp()
+    history.record(TOOL_COUNTDOWN, (int(target), int(target) - 90061), (1, 1, 1, 1), 3.0)
+    rows = list(csv.reader(io.StringIO(history.export_csv())))
+    assert rows[0] == ["time", "tool", "input_a", "input_b", "out_a", "out_b", "out_c", "out_d"]
+    assert [row[1:] for row in rows[1:]] == [
+        ["age", "2000-02-29", "2026-02-28", "25", "11", "30", "0"],
+        ["weekday", "2026-01-05", "", "0", "0", "0", "0"],
+        ["countdown", "2026-12-31 23:59:59", "2026-12-30 22:58:58", "1", "1", "1", "1"],
+    ]
+    assert len(list(csv.reader(io.StringIO(history.export_csv(tool=TOOL_WEEKDAY))))) == 2
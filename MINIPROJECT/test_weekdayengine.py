@@ -0,0 +1,35 @@
+from datetime import date, timedelta
+
+import pytest
+
+from weekdayengine import weekday, weekday_name, WEEKDAY_NAMES
+
+
+def _days(start, end):
+    day = start
+    while day < end:
+        yield day
+        day += timedelta(days=1)
+
+
+def test_scalar_matches_date_weekday_over_a_full_cycle():
+    for d in _days(date(2000, 1, 1), date(2400, 1, 1)):
+        assert weekday(d.year, d.month, d.day) == d.weekday()
+
+
+def test_scalar_at_the_ends_of_the_range():
+    for d in (date(1, 1, 1), date(1, 12, 31), date(9999, 1, 1), date(9999, 12, 31)):
+        assert weekday_name(d.year, d.month, d.day) == WEEKDAY_NAMES[d.weekday()]
+
+
+def test_vectorized_matches_date_weekday():
+    np = pytest.importorskip("numpy")
+    from weekdayengine import weekday_names, weekdays, weekdays_from_ordinals
+
+    dates = list(_days(date(1, 1, 1), date(3, 1, 1))) + list(_days(date(1600, 1, 1), date(2400, 1, 1))) \
+        + list(_days(date(9998, 1, 1), date(9999, 12, 31)))
+    expected = np.array([d.weekday() for d in dates])
+    codes = weekdays([d.year for d in dates], [d.month for d in dates], [d.day for d in dates])
+    assert (codes == expected).all()
+    assert (weekdays_from_ordinals([d.toordinal() for d in dates]) == expected).all()
+    assert list(weekday_names(codes[:7])) == [WEEKDAY_NAMES[c] for c in expected[:7]]
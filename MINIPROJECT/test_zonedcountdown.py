@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from zonedcountdown import deadlines, local_seconds, remaining, to_epoch, zone_table
+
+ZONES = ("Europe/Berlin", "America/New_York", "Australia/Sydney", "Australia/Lord_Howe", "Asia/Kolkata", "UTC")
+
+
+def _reference(wall, zone, fold=0):
+    return wall.replace(tzinfo=ZoneInfo(zone), fold=fold).timestamp()
+
+
+def _walls_near_transitions(zone, years=(1995, 2026, 2040)):
+    """Wall times every 15 minutes on the days the zone's offset changes, plus a few ordinary hours."""
+    tz = ZoneInfo(zone)
+    walls = [datetime(2026, 6, 15, 12, 0), datetime(2026, 1, 1, 0, 0), datetime(1970, 1, 1, 0, 0)]
+    for year in years:
+        day = datetime(year, 1, 1)
+        while day.year == year:
+            if day.replace(tzinfo=tz).utcoffset() != (day + timedelta(days=1)).replace(tzinfo=tz).utcoffset():
+                walls += [day + timedelta(minutes=15 * k) for k in range(2 * 96)]
+            day += timedelta(days=1)
+    return walls
+
+
+@pytest.mark.parametrize("zone", ZONES)
+def test_to_epoch_matches_zoneinfo_around_transitions(zone):
+    walls = _walls_near_transitions(zone)
+    for fold in (0, 1):
+        for wall in walls:
+            assert to_epoch(wall, zone, fold) == _reference(wall, zone, fold), (wall, fold)
+
+
+@pytest.mark.parametrize("zone", ZONES)
+def test_to_wall_and_utc_offset(zone):
+    table = zone_table(zone)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+    for t in range(int(start), int(start) + 366 * 86400, 3 * 3600 + 17):
+        expected = datetime.fromtimestamp(t, ZoneInfo(zone))
+        assert table.utc_offset(t) == expected.utcoffset().total_seconds()
+        assert table.to_wall(t) == expected.replace(tzinfo=None)
+
+
+def test_berlin_gap_and_overlap():
+    gap = datetime(2026, 3, 29, 2, 30)  # skipped: clocks go from 02:00 to 03:00
+    assert to_epoch(gap, "Europe/Berlin") == _reference(datetime(2026, 3, 29, 3, 30), "Europe/Berlin")
+    overlap = datetime(2026, 10, 25, 2, 30)  # happens twice
+    assert to_epoch(overlap, "Europe/Berlin", fold=1) - to_epoch(overlap, "Europe/Berlin", fold=0) == 3600
+
+
+def test_to_epochs_matches_scalar():
+    np = pytest.importorskip("numpy")
+    for zone in ZONES:
+        walls = _walls_near_transitions(zone, years=(2026,))
+        table = zone_table(zone)
+        for fold in (0, 1):
+            epochs = table.to_epochs(np.array([local_seconds(w) for w in walls]), fold)
+            assert list(epochs) == [table.to_epoch(w, fold) for w in walls]
+
+
+def test_deadlines_and_remaining():
+    events = [("Asia/Kolkata", datetime(2026, 1, 1)), (None, datetime(2026, 1, 1)),
+              ("America/New_York", datetime(2026, 11, 1, 1, 30))]
+    expected = [_reference(events[0][1], "Asia/Kolkata"), datetime(2026, 1, 1).timestamp(),
+                _reference(events[2][1], "America/New_York")]
+    assert list(deadlines(events)) == expected
+    assert remaining(expected, now=expected[0]) == [0, expected[1] - expected[0], expected[2] - expected[0]]
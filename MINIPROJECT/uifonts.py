@@ -0,0 +1,18 @@
+import wx
+
+_fonts = {}
+
+
+def get_font(size, bold=False):
+    """Return a shared wx.Font of the default family, creating it on first use (a wx.App must exist)."""
+    key = (size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        weight = wx.FONTWEIGHT_BOLD if bold else wx.FONTWEIGHT_NORMAL
+        font = _fonts[key] = wx.Font(size, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, weight)
+    return font
+
+
+def get_fonts():
+    """The (header, default, button) fonts every tool window uses."""
+    return get_font(20, True), get_font(14), get_font(14, True)
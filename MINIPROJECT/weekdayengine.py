@@ -0,0 +1,92 @@
+from calendarindex import get_index
+
+np = None  # imported on first vectorized use, see ageengine
+
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# The Gregorian calendar repeats every 400 years (146097 days = 20871 weeks),
+# so the weekday of 1 January only depends on year % 400. These small tables
+# back the vectorized path; scalar lookups use the shared calendar index.
+CYCLE_YEARS = 400
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _build_tables():
+    leap = [1 if _is_leap(y) else 0 for y in range(CYCLE_YEARS)]
+    # Year 0 of the cycle is e.g. 2000, whose 1 January was a Saturday (5)
+    jan1 = [0] * CYCLE_YEARS
+    jan1[0] = 5
+    for y in range(1, CYCLE_YEARS):
+        jan1[y] = (jan1[y - 1] + 365 + leap[y - 1]) % 7
+    month_lengths = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    # Days before the first of each month, index 1-12, for common and leap years
+    offsets = ([0] * 13, [0] * 13)
+    for is_leap in (0, 1):
+        total = 0
+        for m in range(1, 13):
+            offsets[is_leap][m] = total
+            total += month_lengths[m - 1] + (1 if m == 2 and is_leap else 0)
+    return tuple(leap), tuple(jan1), (tuple(offsets[0]), tuple(offsets[1]))
+
+
+YEAR_LEAP, YEAR_START, MONTH_OFFSETS = _build_tables()
+
+
+def weekday(year, month, day):
+    """Weekday of a date as 0-6 (Monday is 0), matching date.weekday()."""
+    return get_index().weekday(year, month, day)
+
+
+def weekday_name(year, month, day):
+    return WEEKDAY_NAMES[weekday(year, month, day)]
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for batch weekday calculation. Install it with: pip install numpy") from None
+        np = numpy
+
+
+_np_tables = None
+
+
+def _arrays():
+    global _np_tables
+    if _np_tables is None:
+        _np_tables = (
+            np.array(YEAR_LEAP, dtype=np.int8),
+            np.array(YEAR_START, dtype=np.int8),
+            np.array(MONTH_OFFSETS, dtype=np.int16),
+            np.array(WEEKDAY_NAMES, dtype=object),
+        )
+    return _np_tables
+
+
+def weekdays(years, months, days):
+    """Vectorized weekday() over int arrays; assumes the inputs are valid dates."""
+    _require_numpy()
+    leap_t, start_t, offset_t, _ = _arrays()
+    cy = np.asarray(years, dtype=np.int64) % CYCLE_YEARS
+    leap = leap_t[cy]
+    months = np.asarray(months, dtype=np.intp)
+    total = start_t[cy].astype(np.int32) + offset_t[leap, months] + np.asarray(days, dtype=np.int32) - 1
+    return (total % 7).astype(np.int8)
+
+
+def weekdays_from_ordinals(ordinals):
+    """Weekday codes for date.toordinal() ordinals (0001-01-01 was a Monday)."""
+    _require_numpy()
+    return ((np.asarray(ordinals, dtype=np.int64) - 1) % 7).astype(np.int8)
+
+
+def weekday_names(codes):
+    """Map weekday codes to the shared name strings (an object array, no new str objects)."""
+    _require_numpy()
+    return _arrays()[3][np.asarray(codes, dtype=np.intp)]
@@ -0,0 +1,195 @@
+import time
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+from zoneinfo import ZoneInfo, available_timezones
+
+from ageengine import EPOCH_ORDINAL
+from calendarindex import get_index
+
+np = None  # imported on first vectorized use, see ageengine
+
+DAY = 86400
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for vectorized time-zone conversion. Install it with: pip install numpy") from None
+        np = numpy
+
+
+class ZoneTable:
+    """UTC offset transitions of one time zone, precomputed a year at a time.
+
+    Each year is built once from zoneinfo by sampling the offset daily and
+    bisecting to the exact second of every change; the covered years form one
+    sorted transition array. After that, the offset at any instant is a
+    single bisect, and converting a wall-clock time to UTC needs no tzinfo
+    call at all.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.zone = ZoneInfo(name)
+        self.first_year = self.last_year = None
+        self.start = self.end = 0  # epoch range covered by the built years
+        self.start_offset = 0
+        self.times = array("q")
+        self.offsets = array("l")
+
+    def _zone_offset(self, t):
+        return int(datetime.fromtimestamp(t, self.zone).utcoffset().total_seconds())
+
+    def _year_transitions(self, year):
+        """Offset at the start of year and the (time, offset) changes within it, found by daily sampling."""
+        index = get_index()
+        start = (index.to_ordinal(year, 1, 1) - EPOCH_ORDINAL) * DAY
+        end = start + (366 if index.is_leap(year) else 365) * DAY
+        start_offset = prev = self._zone_offset(start)
+        changes = []
+        for t in range(start + DAY, end + DAY, DAY):
+            offset = self._zone_offset(t)
+            if offset == prev:
+                continue
+            lo, hi = t - DAY, t
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if self._zone_offset(mid) == prev:
+                    lo = mid
+                else:
+                    hi = mid
+            if hi < end:
+                changes.append((hi, offset))
+            prev = offset
+        return start, end, start_offset, changes
+
+    def _extend(self, t):
+        """Build whole years until t falls inside the covered range."""
+        year = get_index().from_ordinal(int(t // DAY) + EPOCH_ORDINAL)[0]
+        if self.first_year is None:
+            self.start, self.end, self.start_offset, changes = self._year_transitions(year)
+            self.first_year = self.last_year = year
+            self.times.extend(c[0] for c in changes)
+            self.offsets.extend(c[1] for c in changes)
+        while year < self.first_year:
+            self.first_year -= 1
+            self.start, _, self.start_offset, changes = self._year_transitions(self.first_year)
+            self.times[0:0] = array("q", (c[0] for c in changes))
+            self.offsets[0:0] = array("l", (c[1] for c in changes))
+        while year > self.last_year:
+            self.last_year += 1
+            _, self.end, _, changes = self._year_transitions(self.last_year)
+            self.times.extend(c[0] for c in changes)
+            self.offsets.extend(c[1] for c in changes)
+
+    def utc_offset(self, t):
+        """UTC offset in seconds at epoch time t."""
+        if not self.start <= t < self.end:
+            self._extend(t)
+        i = bisect_right(self.times, t)
+        return self.offsets[i - 1] if i else self.start_offset
+
+    def to_epoch(self, wall, fold=0):
+        """Epoch seconds of a naive wall-clock datetime in this zone, with PEP 495 fold semantics."""
+        local = local_seconds(wall)
+        # Transitions are far apart, so the offsets a day either side are the only candidates
+        before = self.utc_offset(local - DAY)
+        after = self.utc_offset(local + DAY)
+        if before == after:
+            return local - before
+        valid = [offset for offset in {before, after} if self.utc_offset(local - offset) == offset]
+        if len(valid) == 2:  # repeated hour: fold 0 is the earlier instant
+            return local - (max(valid) if fold == 0 else min(valid))
+        if valid:
+            return local - valid[0]
+        return local - (before if fold == 0 else after)  # skipped hour
+
+    def to_epochs(self, local, fold=0):
+        """Vectorized to_epoch over a NumPy array of local wall-clock seconds since 1970-01-01."""
+        _require_numpy()
+        local = np.asarray(local, dtype=np.float64)
+        if not len(local):
+            return local
+        for t in (local.min() - 2 * DAY, local.max() + 2 * DAY):
+            if not self.start <= t < self.end:
+                self._extend(t)
+        times = np.frombuffer(self.times, dtype=np.int64) if len(self.times) else np.zeros(0, np.int64)
+        offsets = np.concatenate(([self.start_offset], np.asarray(self.offsets, dtype=np.int64)))
+
+        def offset_at(t):
+            return offsets[np.searchsorted(times, t, side="right")]
+
+        before = offset_at(local - DAY)
+        after = offset_at(local + DAY)
+        before_ok = offset_at(local - before) == before
+        after_ok = offset_at(local - after) == after
+        both = np.maximum(before, after) if fold == 0 else np.minimum(before, after)
+        skipped = before if fold == 0 else after
+        offset = np.where(before_ok & after_ok, both, np.where(before_ok, before, np.where(after_ok, after, skipped)))
+        return local - offset
+
+    def to_wall(self, t):
+        """Naive wall-clock datetime in this zone at epoch time t."""
+        return datetime(1970, 1, 1) + timedelta(seconds=t + self.utc_offset(t))
+
+
+def local_seconds(wall):
+    """Seconds from 1970-01-01 00:00 to a naive wall-clock datetime, ignoring any zone."""
+    return ((wall.toordinal() - EPOCH_ORDINAL) * DAY + wall.hour * 3600 + wall.minute * 60 + wall.second
+            + wall.microsecond / 1e6)
+
+
+_tables = {}
+
+
+def zone_table(name):
+    """Return the cached ZoneTable for a zone name."""
+    table = _tables.get(name)
+    if table is None:
+        table = _tables[name] = ZoneTable(name)
+    return table
+
+
+def zone_names():
+    return sorted(available_timezones())
+
+
+def to_epoch(wall, zone=None, fold=0):
+    """Epoch seconds of a naive wall-clock datetime in zone, or in the system local zone when zone is None."""
+    if zone is None:
+        return wall.replace(fold=fold).timestamp()
+    return zone_table(zone).to_epoch(wall, fold)
+
+
+def deadlines(events, fold=0):
+    """Resolve many (zone, naive wall datetime) pairs to epoch seconds using the cached tables.
+
+    With NumPy available, events are grouped by zone and each group is resolved in one vectorized pass.
+    """
+    events = list(events)
+    try:
+        _require_numpy()
+    except ImportError:
+        return [to_epoch(wall, zone, fold) for zone, wall in events]
+    result = np.empty(len(events), dtype=np.float64)
+    groups = {}
+    for i, (zone, wall) in enumerate(events):
+        groups.setdefault(zone, []).append(i)
+    for zone, rows in groups.items():
+        if zone is None:
+            result[rows] = [to_epoch(events[i][1], None, fold) for i in rows]
+        else:
+            result[rows] = zone_table(zone).to_epochs([local_seconds(events[i][1]) for i in rows], fold)
+    return result
+
+
+def remaining(deadline_list, now=None):
+    """Seconds left until each epoch deadline. Per tick this is plain subtraction, with no time zone work."""
+    if now is None:
+        now = time.time()
+    return [deadline - now for deadline in deadline_list]